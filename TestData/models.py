@@ -0,0 +1,250 @@
+"""
+Immutable, indexed test-data model.
+Records are frozen dataclasses with __slots__: a fixed, compact layout that
+no test can modify for the next one. Tables keep records in definition
+order and build their secondary indexes once, when TestData.test_data is
+imported, so every lookup is a dictionary hit instead of a scan.
+"""
+from dataclasses import dataclass
+from typing import Dict, Generic, Iterable, Iterator, Optional, Tuple, TypeVar
+
+
+R = TypeVar("R")
+
+
+def parse_price(text: str) -> int:
+    """
+    Parse a displayed price into integer cents.
+
+    Args:
+        text: Price such as "$29.99"
+
+    Returns:
+        int: Price in cents, 2999 for "$29.99"
+    """
+    dollars, _, cents = text.strip().lstrip("$").replace(",", "").partition(".")
+    return int(dollars or "0") * 100 + int((cents + "00")[:2])
+
+
+def format_price(cents: int) -> str:
+    """Format integer cents the way the application displays prices ("$29.99")."""
+    return f"${cents // 100}.{cents % 100:02d}"
+
+
+@dataclass(frozen=True)
+class User:
+    """Login profile."""
+    __slots__ = ("key", "username", "password", "expected_result")
+    key: str
+    username: str
+    password: str
+    expected_result: str  # success, locked or failed
+
+
+@dataclass(frozen=True)
+class Product:
+    """Inventory item."""
+    __slots__ = ("key", "name", "product_id", "price_cents", "description", "data_test")
+    key: str
+    name: str
+    product_id: int  # Inventory id the application keeps in localStorage["cart-contents"]
+    price_cents: int
+    description: str
+    data_test: str  # Suffix of the add-to-cart-/remove- data-test attributes
+
+    @property
+    def price(self) -> str:
+        """Price as displayed, for example "$29.99"."""
+        return format_price(self.price_cents)
+
+    @property
+    def add_to_cart_id(self) -> str:
+        """data-test attribute of the product's add to cart button."""
+        return f"add-to-cart-{self.data_test}"
+
+    @property
+    def remove_id(self) -> str:
+        """data-test attribute of the product's remove button."""
+        return f"remove-{self.data_test}"
+
+
+@dataclass(frozen=True)
+class SortOption:
+    """Inventory sort dropdown option."""
+    __slots__ = ("key", "value", "display")
+    key: str
+    value: str
+    display: str
+
+
+@dataclass(frozen=True)
+class TestCase:
+    """Traceability entry linking a test id to its module and user."""
+    __slots__ = ("test_id", "module", "description", "user", "expected_result")
+    __test__ = False  # Not a pytest test class
+    test_id: str
+    module: str
+    description: str
+    user: str
+    expected_result: str
+
+
+def unique_index(rows: Iterable[R], field: str) -> Dict[object, R]:
+    """
+    Index rows by a field that must be unique.
+
+    Raises:
+        ValueError: Two rows share a value
+    """
+    index = {}
+    for row in rows:
+        value = getattr(row, field)
+        if value in index:
+            raise ValueError(f"Duplicate {type(row).__name__}.{field}: {value!r}")
+        index[value] = row
+    return index
+
+
+def group_index(rows: Iterable[R], field: str) -> Dict[object, Tuple[R, ...]]:
+    """Index rows by a shared field value, keeping definition order within each group."""
+    groups: Dict[object, list] = {}
+    for row in rows:
+        groups.setdefault(getattr(row, field), []).append(row)
+    return {value: tuple(group) for value, group in groups.items()}
+
+
+class Table(Generic[R]):
+    """Records in definition order, indexed by primary key."""
+
+    __slots__ = ("_rows", "_by_key")
+    key_field = "key"
+
+    def __init__(self, rows: Iterable[R]):
+        """
+        Initialize table.
+
+        Args:
+            rows: Records; their key_field values must be unique
+        """
+        self._rows = tuple(rows)
+        self._by_key = unique_index(self._rows, self.key_field)
+
+    def __getitem__(self, key: str) -> R:
+        return self._by_key[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._by_key
+
+    def __iter__(self) -> Iterator[R]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, key: str, default: Optional[R] = None) -> Optional[R]:
+        """Record with the given key, or default."""
+        return self._by_key.get(key, default)
+
+    def keys(self) -> Tuple[str, ...]:
+        """Primary keys in definition order."""
+        return tuple(self._by_key)
+
+
+class UserTable(Table[User]):
+    """Login profiles, also indexed by expected result."""
+
+    __slots__ = ("_by_expected_result",)
+
+    def __init__(self, rows: Iterable[User]):
+        super().__init__(rows)
+        self._by_expected_result = group_index(self._rows, "expected_result")
+
+    def by_expected_result(self, expected_result: str) -> Tuple[User, ...]:
+        """Users whose login should end in the given result (success, locked or failed)."""
+        return self._by_expected_result.get(expected_result, ())
+
+
+class ProductCatalog(Table[Product]):
+    """Inventory, also indexed by display name, data-test id and price rank."""
+
+    __slots__ = ("_by_name", "_by_test_id", "_by_price", "_names")
+
+    def __init__(self, rows: Iterable[Product]):
+        super().__init__(rows)
+        self._by_name = unique_index(self._rows, "name")
+        self._by_test_id = unique_index(self._rows, "data_test")
+        self._by_price = tuple(sorted(self._rows, key=lambda product: (product.price_cents, product.name)))
+        self._names = tuple(product.name for product in self._rows)
+
+    def names(self) -> Tuple[str, ...]:
+        """Display names in catalog order."""
+        return self._names
+
+    def get_by_name(self, name: str) -> Optional[Product]:
+        """Product with the given display name, or None."""
+        return self._by_name.get(name)
+
+    def by_name(self, name: str) -> Product:
+        """
+        Product with the given display name.
+
+        Raises:
+            KeyError: No product has that name
+        """
+        product = self._by_name.get(name)
+        if product is None:
+            raise KeyError(f"Unknown product '{name}'. Available: {', '.join(self._names)}")
+        return product
+
+    def by_test_id(self, test_id: str) -> Product:
+        """
+        Product owning a data-test id.
+
+        Args:
+            test_id: "add-to-cart-<id>", "remove-<id>" or the bare id
+
+        Raises:
+            KeyError: No product has that id
+        """
+        for prefix in ("add-to-cart-", "remove-"):
+            if test_id.startswith(prefix) and test_id[len(prefix):] in self._by_test_id:
+                return self._by_test_id[test_id[len(prefix):]]
+        return self._by_test_id[test_id]
+
+    def by_price_rank(self, rank: int) -> Product:
+        """Product at a position of the price ordering; 0 is the cheapest, -1 the most expensive."""
+        return self._by_price[rank]
+
+    def by_price(self, descending: bool = False) -> Tuple[Product, ...]:
+        """Products ordered by price, then name, as the lohi/hilo sort options should show them."""
+        return self._by_price[::-1] if descending else self._by_price
+
+
+class SortOptionTable(Table[SortOption]):
+    """Sort options, also indexed by dropdown value."""
+
+    __slots__ = ("_by_value",)
+
+    def __init__(self, rows: Iterable[SortOption]):
+        super().__init__(rows)
+        self._by_value = unique_index(self._rows, "value")
+
+    def by_value(self, value: str) -> SortOption:
+        """Sort option with the given dropdown value (az, za, lohi, hilo)."""
+        return self._by_value[value]
+
+
+class TestCaseTable(Table[TestCase]):
+    """Test case mappings keyed by test id, also indexed by module."""
+
+    __slots__ = ("_by_module",)
+    __test__ = False
+    key_field = "test_id"
+
+    def __init__(self, rows: Iterable[TestCase]):
+        super().__init__(rows)
+        self._by_module = group_index(self._rows, "module")
+
+    def by_module(self, module: str) -> Tuple[TestCase, ...]:
+        """Test cases of a module, such as "Cart Module"."""
+        return self._by_module.get(module, ())
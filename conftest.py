@@ -5,8 +5,39 @@ Contains browser setup, fixtures, and MCP Playwright integration.
 import pytest
 import time
 import os
+from collections import Counter
 from typing import Dict, Any
 
+from mcp_integration import (
+    mcp_client, mcp_initialize_browser, mcp_close_browser, mcp_disconnect, mcp_collect_performance_metrics,
+    mcp_snapshot_stats, mcp_collect_memory_metrics, DEFAULT_ISOLATION_TIER
+)
+from support.artifact_merge import (
+    WORKER_ARTIFACTS_DIR, WORKER_ARTIFACTS_ENV, SHARD_LOG_DATE_FORMAT, SHARD_LOG_FORMAT, ResultShardWriter,
+    merge_worker_artifacts, prepare_shard_directory, report_columns
+)
+from support.asset_cache import AssetCache
+from support.data_loader import RecordSource, external_source, partition_params, row_params
+from support.failure_capture import FailureCapture
+from support.failure_set import FailureSet, FAILED_SELECTION_ENV
+from support.mcp_recording import MCP_RECORDING, CommandRecorder, drives_client, open_replay, recording_path
+from support.mcp_pool import close_shared_pool, print_pool_stats
+from support.memory_tracking import (
+    LeakDetector, memory_sample, memory_tracking_enabled, print_leak_report, reset_python_peak, start_python_tracking
+)
+from support.profiling import (
+    PROFILE_ENV, SamplingProfiler, hot_frames, profile_path, profile_selected, read_collapsed, write_profile,
+    write_run_profile
+)
+from support.request_blocking import RequestBlocker, DEFAULT_BLOCKING_PROFILE
+from support.sharding import SHARD_ENV, select_shard
+from support.test_history import (
+    RunHistory, FLAKY_THRESHOLD, aggregate_operations, current_git_revision, current_run_id
+)
+from pages.cart_page import CartPage
+from TestData.models import Product, User
+from TestData.test_data import REPORT_CONFIG, PRODUCTS, SORT_OPTIONS, TEST_USERS
+
 
 # Test configuration
 BROWSER_TYPE = "chromium"  # chromium, firefox, webkit
@@ -14,16 +45,24 @@ HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"  # Read from environ
 SLOW_MO = 100  # Milliseconds to slow down operations
 TIMEOUT = 30000  # 30 seconds
 VIEWPORT_SIZE = {"width": 1280, "height": 720}
-
-# Test data
-TEST_USERS = {
-    "standard_user": "secret_sauce",
-    "locked_out_user": "secret_sauce", 
-    "problem_user": "secret_sauce",
-    "performance_glitch_user": "secret_sauce"
-}
+ASSET_CACHE_ENABLED = os.getenv("ASSET_CACHE", "true").lower() == "true"
+PERFORMANCE_METRICS_ENABLED = os.getenv("PERFORMANCE_METRICS", "true").lower() == "true"
+TEST_HISTORY_ENABLED = os.getenv("TEST_HISTORY", "true").lower() == "true"
+HISTORY_SCHEDULING = os.getenv("HISTORY_SCHEDULING", "true").lower() == "true"
+QUARANTINE_LANE = os.getenv("QUARANTINE_LANE", "off")  # main, quarantine, off; run_tests.py sets main with a lane
+MEMORY_TRACKING_ENABLED = memory_tracking_enabled()
+PROFILE_SELECTION = os.getenv(PROFILE_ENV, "")  # Set by run_tests.py --profile
 
 BASE_URL = "https://www.saucedemo.com/"
+REPORT_TITLE = "Sauce Demo BDD Test Automation Report"
+
+# Set in pytest_configure; pytest_runtest_logreport receives no config
+_history_config = None
+_failure_set = None  # Controller's FailureSet, updated from every test report
+_leak_detector = None  # Controller's LeakDetector, fed with every test's memory sample
+_run_profile = None  # Controller's collapsed stacks summed over every profiled test
+_active_profiler = None  # Sampler of the test running in this process
+_result_shard = None  # Worker's ResultShardWriter under xdist
 
 
 @pytest.fixture(scope="session")
@@ -38,8 +77,74 @@ def browser_config():
     }
 
 
+@pytest.fixture(scope="session", autouse=True)
+def asset_cache(request):
+    """
+    Static asset cache shared by all contexts and xdist workers.
+    Registered as a route handler so every new browser context uses it.
+    """
+    if not ASSET_CACHE_ENABLED:
+        yield None
+        return
+    
+    cache = AssetCache()
+    mcp_client.add_route_handler(cache.handle_route)
+    request.config.asset_cache = cache
+    
+    yield cache
+    
+    cache.close()
+
+
+@pytest.fixture(scope="session")
+def request_blocker(asset_cache):
+    """
+    Session-wide request blocker.
+    Registered after the asset cache so it sees requests first and only
+    unblocked requests fall through to the cache.
+    """
+    blocker = RequestBlocker(size_hint=asset_cache.size_of if asset_cache else None)
+    mcp_client.add_route_handler(blocker.handle_route)
+    return blocker
+
+
+@pytest.fixture(autouse=True)
+def blocking_profile(request, request_blocker):
+    """
+    Select the blocking profile for the current test.
+    Priority: @pytest.mark.blocking("<profile>"), then @visual, then BLOCKING_PROFILE.
+    """
+    marker = request.node.get_closest_marker("blocking")
+    if marker is not None and marker.args:
+        profile = marker.args[0]
+    elif request.node.get_closest_marker("visual") is not None:
+        profile = "visual"
+    else:
+        profile = DEFAULT_BLOCKING_PROFILE
+    request_blocker.use_profile(profile)
+    
+    yield profile
+    
+    stats = request_blocker.stats
+    request.node.user_properties.append(("blocking_profile", profile))
+    request.node.user_properties.append(("blocked_requests", stats["blocked_requests"]))
+    request.node.user_properties.append(("blocked_bytes", stats["blocked_bytes"]))
+
+
+@pytest.fixture
+def isolation_tier(request):
+    """
+    Isolation tier for the current test.
+    Priority: @pytest.mark.isolation("<tier>"), then ISOLATION_TIER (default new-context).
+    """
+    marker = request.node.get_closest_marker("isolation")
+    tier = marker.args[0] if marker is not None and marker.args else DEFAULT_ISOLATION_TIER
+    request.node.user_properties.append(("isolation_tier", tier))
+    return tier
+
+
 @pytest.fixture(scope="function")
-def browser_context(browser_config):
+def browser_context(request, browser_config, isolation_tier):
     """
     Browser context fixture for each test.
     This will integrate with MCP Playwright server.
@@ -52,17 +157,70 @@ def browser_context(browser_config):
         "logged_in": False,
         "current_user": None,
         "items_in_cart": False,
-        "test_start_time": time.time()
+        "test_start_time": time.time(),
+        "step_metrics": [],
+        "performance_metrics": None,
+        "time_budget": None,
+        "isolation": isolation_tier
     }
+    mcp_client.operation_log = []
+    mcp_client.transition_marks = {}
+    
+    # Record this scenario's client command stream, or answer it from an earlier recording
+    if MCP_RECORDING == "record" and drives_client(request.node):
+        mcp_client.recorder = CommandRecorder(recording_path(request.node.nodeid))
+    elif MCP_RECORDING == "replay" and drives_client(request.node):
+        mcp_client.replay = open_replay(request.node.nodeid)
+        if mcp_client.replay is None:
+            pytest.skip(f"No MCP recording for {request.node.nodeid}; record one with run_tests.py --record")
     
-    # Setup browser through MCP Playwright server
-    # This would be implemented when using actual MCP calls
+    # Budget derived from this test's recent passing durations; client operations time out once it is spent
+    history = getattr(request.config, "test_history", None)
+    if history is not None:
+        context["time_budget"] = history.suggested_timeout(request.node.nodeid, exclude_run=current_run_id())
+        mcp_client.deadline = context["test_start_time"] + context["time_budget"]
+    
+    # Keep a ring buffer of recent activity; it is only written to disk on failure
+    if REPORT_CONFIG["trace_on_failure"] or REPORT_CONFIG["video_on_failure"]:
+        context["capture"] = FailureCapture(
+            trace=REPORT_CONFIG["trace_on_failure"],
+            video=REPORT_CONFIG["video_on_failure"]
+        )
+        mcp_client.capture = context["capture"]
+    
+    # Setup browser through MCP Playwright server; connects to the shared
+    # browser server when run_tests.py published one
+    mcp_initialize_browser(
+        browser_config["browser_type"], browser_config["headless"], browser_config["viewport"],
+        isolation=isolation_tier
+    )
+    if MEMORY_TRACKING_ENABLED:
+        reset_python_peak()
     
     yield context
     
+    # Teardown operations run without the budget
+    mcp_client.deadline = None
+    
+    # Sample memory while the page is still open
+    if MEMORY_TRACKING_ENABLED:
+        request.node.user_properties.append(("memory", memory_sample(mcp_collect_memory_metrics())))
+    
     # Cleanup after test
+    mcp_close_browser()
+    mcp_client.capture = None
+    recorder, replay = mcp_client.recorder, mcp_client.replay
+    mcp_client.recorder = mcp_client.replay = None
+    if recorder is not None:
+        print(f"📼 Recorded {len(recorder.entries)} command(s) to {recorder.save()}")
     context["test_end_time"] = time.time()
     context["test_duration"] = context["test_end_time"] - context["test_start_time"]
+    request.node.user_properties.append(("mcp_operations", aggregate_operations(mcp_client.operation_log)))
+    if context["time_budget"] and context["test_duration"] > context["time_budget"]:
+        print(f"⏱️ Test took {context['test_duration']:.2f}s, over its historical budget of {context['time_budget']:.2f}s")
+        request.node.user_properties.append(("over_time_budget", context["time_budget"]))
+    if replay is not None:
+        replay.finish()
 
 
 @pytest.fixture(scope="function") 
@@ -142,20 +300,26 @@ def authenticated_user(browser_context):
 
 @pytest.fixture
 def empty_cart(browser_context):
-    """Fixture to ensure cart is empty."""
+    """Fixture to ensure cart is empty by clearing the seeded cart state."""
+    assert CartPage().seed_cart([]), "Failed to empty cart"
     browser_context["items_in_cart"] = False
+    browser_context["cart_items"] = []
     return browser_context
 
 
 @pytest.fixture
 def cart_with_items(browser_context):
-    """Fixture to provide cart with items."""
+    """Fixture to provide cart with items, seeded before the first navigation."""
+    items = [PRODUCTS["sauce_labs_backpack"].name]
+    assert CartPage().seed_cart(items), "Failed to seed cart"
     browser_context["items_in_cart"] = True
+    browser_context["cart_items"] = items
     return browser_context
 
 
 # Pytest hooks for better reporting and integration
 
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
     """Configure pytest with custom markers and settings."""
     config.addinivalue_line(
@@ -170,10 +334,177 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "smoke: Smoke tests for critical functionality"
     )
+    config.addinivalue_line(
+        "markers", "visual: Visual tests that load images, fonts and media"
+    )
+    config.addinivalue_line(
+        "markers", "performance: Latency budget tests"
+    )
+    config.addinivalue_line(
+        "markers", "blocking(profile): Request-blocking profile (functional, visual, full)"
+    )
+    config.addinivalue_line(
+        "markers", "isolation(tier): Isolation tier (new-browser, new-context, reset-context, shared-page)"
+    )
+    
+    # Under xdist every process writes its own log and result shard; runs before
+    # the junitxml, html and logging plugins configure themselves
+    _configure_worker_artifacts(config)
+    
+    # Every process selects from the failure set; only the controller updates it
+    global _failure_set
+    config.failure_set = FailureSet()
+    if not os.getenv("PYTEST_XDIST_WORKER"):
+        _failure_set = config.failure_set
+    
+    # Every process samples its own memory; the controller looks for leaks per worker
+    global _leak_detector
+    if MEMORY_TRACKING_ENABLED:
+        start_python_tracking()
+        if not os.getenv("PYTEST_XDIST_WORKER"):
+            _leak_detector = config.leak_detector = LeakDetector()
+    
+    # Every process profiles its own tests; the controller merges the stacks
+    global _run_profile
+    if PROFILE_SELECTION and not os.getenv("PYTEST_XDIST_WORKER"):
+        _run_profile = config.run_profile = Counter()
+    
+    # Every process reads the history; only the controller writes to it
+    global _history_config
+    if TEST_HISTORY_ENABLED:
+        _history_config = config
+        config.test_history = RunHistory()
+        config.test_history_results = {}
+        if not os.getenv("PYTEST_XDIST_WORKER"):
+            config.test_history.start_run(current_run_id(), current_git_revision())
+
+
+def _configure_worker_artifacts(config):
+    """
+    Give each xdist process its own log file and result shard.
+    The controller keeps the configured JUnit, HTML and log paths as merge
+    targets and turns off its own in-memory report building. Shard logs are
+    written with timestamped records, which the merge orders by.
+    """
+    global _result_shard
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker and os.getenv(WORKER_ARTIFACTS_ENV):
+        directory = os.environ[WORKER_ARTIFACTS_ENV]
+        config.option.log_file = os.path.join(directory, f"{worker}.log")
+        config.option.log_file_format = SHARD_LOG_FORMAT
+        config.option.log_file_date_format = SHARD_LOG_DATE_FORMAT
+        _result_shard = ResultShardWriter(os.path.join(directory, f"{worker}.jsonl"), worker)
+    elif not worker and getattr(config.option, "numprocesses", None):
+        directory = prepare_shard_directory(WORKER_ARTIFACTS_DIR)
+        os.environ[WORKER_ARTIFACTS_ENV] = directory  # Inherited by the workers spawned after configure
+        config.merged_artifacts = {
+            "directory": directory,
+            "junit": getattr(config.option, "xmlpath", None),
+            "html": getattr(config.option, "htmlpath", None),
+            "log": config.getoption("log_file") or config.getini("log_file")
+        }
+        if config.merged_artifacts["junit"]:
+            config.option.xmlpath = None
+        if config.merged_artifacts["html"]:
+            config.option.htmlpath = None
+        config.option.log_file = os.path.join(directory, "controller.log")
+        config.option.log_file_format = SHARD_LOG_FORMAT
+        config.option.log_file_date_format = SHARD_LOG_DATE_FORMAT
 
 
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Close browser and MCP server connections, persist the failure set, write
+    the run profile and merge the worker shards into the final reports.
+    """
+    mcp_disconnect()
+    session.config.mcp_pool_stats = close_shared_pool()
+    if _failure_set is not None:
+        _failure_set.save()
+    if _run_profile:
+        session.config.run_profile_files = write_run_profile(_run_profile)
+    if _result_shard is not None:
+        _result_shard.close()
+    targets = getattr(session.config, "merged_artifacts", None)
+    if targets is not None:
+        session.config.merged_artifact_files = merge_worker_artifacts(
+            targets["directory"], junit=targets["junit"], html_report=targets["html"], log=targets["log"],
+            title=REPORT_TITLE
+        )
+
+
+def pytest_unconfigure(config):
+    """Close the run history."""
+    history = getattr(config, "test_history", None)
+    if history is not None:
+        history.close()
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Select this run's CI shard, split off quarantined flaky tests and order the rest longest-first.
+    With TEST_SHARD=i/n only the i-th of n duration-balanced shards is kept.
+    With QUARANTINE_LANE=main (set by run_tests.py while it runs a quarantine
+    lane) tests whose flakiness score exceeds FLAKY_THRESHOLD are deselected;
+    QUARANTINE_LANE=quarantine selects only those. Tests are then ordered by
+    historical duration so xdist workers finish together, with tests without
+    history first since their cost is unknown. FAILED_SELECTION=first moves
+    tests that failed last time to the front, FAILED_SELECTION=only keeps just
+    those. Only previous runs are consulted, so every worker computes the same
+    selection and order.
+    """
+    history = getattr(config, "test_history", None)
+    medians = history.median_durations(exclude_run=current_run_id()) if history is not None else {}
+    
+    # Keep only this CI shard's share of the tests, balanced by expected duration
+    shard = os.getenv(SHARD_ENV)
+    if shard:
+        selected, deselected, config.shard_summary = select_shard(items, shard, medians)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+    
+    if history is not None:
+        _apply_history(config, items, history, medians)
+    
+    # Last-failed tests first, or only those
+    selection = os.getenv(FAILED_SELECTION_ENV)
+    if selection in ("first", "only"):
+        selected = config.failure_set.select(items, only=selection == "only")
+        if len(selected) < len(items):
+            config.hook.pytest_deselected(items=[item for item in items if item.nodeid not in config.failure_set])
+        items[:] = selected
+
+
+def _apply_history(config, items, history, medians):
+    """Apply the flaky-test quarantine and longest-first ordering from the run history."""
+    # Known-flaky tests run only in the non-blocking quarantine lane
+    if QUARANTINE_LANE in ("main", "quarantine"):
+        flaky = set(history.flaky_tests(FLAKY_THRESHOLD, exclude_run=current_run_id()))
+        want_flaky = QUARANTINE_LANE == "quarantine"
+        in_lane = [item for item in items if (item.nodeid in flaky) == want_flaky]
+        deselected = [item for item in items if (item.nodeid in flaky) != want_flaky]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = in_lane
+        if want_flaky:
+            for item in in_lane:
+                item.user_properties.append(("quarantined", True))
+        else:
+            config.quarantined = [item.nodeid for item in deselected]
+    
+    if HISTORY_SCHEDULING and medians:
+        items.sort(key=lambda item: -medians.get(item.nodeid, float("inf")))
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_runtest_setup(item):
-    """Setup for each test item."""
+    """Setup for each test item; starts the profiler before any fixture is set up."""
+    global _active_profiler
+    if profile_selected(item.nodeid, PROFILE_SELECTION):
+        _active_profiler = SamplingProfiler()
+        _active_profiler.start()
+    
     # Extract test metadata
     markers = [marker.name for marker in item.iter_markers()]
     item.user_properties.append(("markers", markers))
@@ -184,6 +515,19 @@ def pytest_runtest_setup(item):
         pass
 
 
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_teardown(item, nextitem):
+    """Stop the profiler after fixture teardown and write the test's profile."""
+    global _active_profiler
+    if _active_profiler is None:
+        return
+    stacks = _active_profiler.stop()
+    _active_profiler = None
+    if stacks:
+        files = write_profile(stacks, profile_path(item.nodeid), item.nodeid)
+        item.user_properties.append(("profile_files", files))
+
+
 def pytest_runtest_makereport(item, call):
     """Generate test report."""
     if call.when == "call":
@@ -191,20 +535,180 @@ def pytest_runtest_makereport(item, call):
         outcome = "PASSED" if call.excinfo is None else "FAILED"
         item.user_properties.append(("outcome", outcome))
         
+        context = getattr(item, "funcargs", {}).get("browser_context")
+        if context and context.get("step_metrics"):
+            item.user_properties.append(("step_metrics", context["step_metrics"]))
+        
         if call.excinfo:
             # Test failed - capture failure info
             item.user_properties.append(("failure_reason", str(call.excinfo.value)))
+    
+    if call.excinfo is not None and call.when in ("setup", "call"):
+        # Persist the trace/screencast ring buffer only for failing tests
+        context = getattr(item, "funcargs", {}).get("browser_context")
+        capture = context.get("capture") if context else None
+        if capture is not None:
+            artifacts = capture.persist(item.nodeid)
+            item.user_properties.append(("failure_artifacts", artifacts))
+
+
+def pytest_runtest_logreport(report):
+    """
+    Record each finished test in the failure set, the leak detector and the
+    run history. Runs on the controller, which receives every worker's
+    reports, so the database has a single writer.
+    """
+    if _result_shard is not None:
+        _result_shard.add_report(report)
+    
+    if _failure_set is not None and report.outcome != "rerun":
+        if report.failed:
+            _failure_set.record(report.nodeid, "failed")
+        elif report.passed and report.when == "call":
+            _failure_set.record(report.nodeid, "passed")
+    
+    node = getattr(report, "node", None)
+    worker = node.gateway.id if node is not None else "master"
+    if _leak_detector is not None and report.when == "teardown":
+        memory = dict(report.user_properties).get("memory")
+        if memory:
+            _leak_detector.add(worker, report.nodeid, memory)
+    if _run_profile is not None and report.when == "teardown":
+        # Stacks are read back from the test's file rather than shipped in the report
+        for path in dict(report.user_properties).get("profile_files", [])[:1]:
+            _run_profile.update(read_collapsed(path))
+    
+    config = _history_config
+    if config is None or os.getenv("PYTEST_XDIST_WORKER"):
+        return
+    phases = config.test_history_results.setdefault(report.nodeid, {"duration": 0.0, "outcome": "passed"})
+    phases["duration"] += report.duration
+    if report.outcome == "rerun":
+        phases["outcome"] = "rerun"
+    elif report.failed:
+        phases["outcome"] = "failed" if report.when == "call" else "error"
+    elif report.skipped and phases["outcome"] == "passed":
+        phases["outcome"] = "skipped"
+    if report.when != "teardown" and report.outcome != "rerun":
+        return
+    
+    properties = dict(report.user_properties)
+    config.test_history_results.pop(report.nodeid)
+    config.test_history.record_test(
+        current_run_id(),
+        report.nodeid,
+        phases["outcome"],
+        phases["duration"],
+        worker=worker,
+        git_revision=current_git_revision(),
+        steps=properties.get("step_metrics", []),
+        operations=properties.get("mcp_operations"),
+        memory=properties.get("memory")
+    )
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print shard, quarantine, memory leak, profile, merged report, MCP pool and asset cache statistics."""
+    shard = getattr(config, "shard_summary", None)
+    if shard:
+        loads = ", ".join(f"{load:.1f}s" for load in shard["loads"])
+        terminalreporter.write_sep("-", f"shard {shard['shard']}/{shard['count']}")
+        terminalreporter.write_line(
+            f"{shard['tests']} test(s); estimated load per shard: {loads} "
+            f"({shard['history']} test(s) priced from history, the rest by step count)"
+        )
+    
+    quarantined = getattr(config, "quarantined", [])
+    if quarantined:
+        terminalreporter.write_sep("-", f"{len(quarantined)} flaky test(s) quarantined")
+        for nodeid in quarantined:
+            terminalreporter.write_line(nodeid)
+        terminalreporter.write_line("Run them with QUARANTINE_LANE=quarantine (run_tests.py does this automatically)")
+    
+    detector = getattr(config, "leak_detector", None)
+    leaks = detector.find_leaks() if detector is not None else []
+    if leaks:
+        terminalreporter.write_sep("-", f"{len(leaks)} possible memory leak(s)")
+        print_leak_report(leaks, terminalreporter.write_line)
+    
+    profile_files = getattr(config, "run_profile_files", None)
+    if profile_files:
+        terminalreporter.write_sep("-", "profile")
+        samples = sum(config.run_profile.values())
+        for frame, count in hot_frames(config.run_profile):
+            terminalreporter.write_line(f"{count / samples:6.1%} self  {frame}")
+        terminalreporter.write_line(f"Flamegraph and speedscope profiles: {', '.join(profile_files)}")
+    
+    merged = getattr(config, "merged_artifact_files", None)
+    if merged:
+        terminalreporter.write_sep("-", "worker shards merged")
+        for path in merged:
+            terminalreporter.write_line(path)
+    
+    pool_stats = getattr(config, "mcp_pool_stats", None)
+    if pool_stats:
+        terminalreporter.write_sep("-", "MCP connection pool")
+        print_pool_stats(pool_stats, terminalreporter.write_line)
+    
+    cache = getattr(config, "asset_cache", None)
+    if cache is None:
+        return
+    stats = cache.stats
+    lookups = stats["hits"] + stats["revalidated"] + stats["misses"]
+    if lookups == 0:
+        return
+    terminalreporter.write_sep("-", "static asset cache")
+    terminalreporter.write_line(
+        f"hit rate {cache.hit_rate():.1%} ({stats['hits']} hits, {stats['revalidated']} revalidated, "
+        f"{stats['misses']} misses), {stats['bytes_served'] / 1024:.0f} KiB served from cache, "
+        f"{stats['evictions']} evictions"
+    )
+
+
+# pytest-bdd hooks for per-step performance metrics
+
+def pytest_bdd_before_step(request, feature, scenario, step, step_func):
+    """Remember when each BDD step starts."""
+    request.getfixturevalue("browser_context")["step_started"] = time.time()
+
+
+def _record_step_metrics(request, step, error=None):
+    """Attach duration and page performance metrics to the finished step."""
+    context = request.getfixturevalue("browser_context")
+    entry = {
+        "step": f"{step.keyword} {step.name}",
+        "duration": time.time() - context.pop("step_started", time.time()),
+        "error": error
+    }
+    if PERFORMANCE_METRICS_ENABLED:
+        entry["metrics"] = mcp_collect_performance_metrics()
+        context["performance_metrics"] = entry["metrics"]
+    snapshot = mcp_snapshot_stats()
+    if snapshot is not None:
+        entry["snapshot"] = snapshot
+    context["step_metrics"].append(entry)
+
+
+def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func_args):
+    """Collect metrics after a successful BDD step."""
+    _record_step_metrics(request, step)
+
+
+def pytest_bdd_step_error(request, feature, scenario, step, step_func, step_func_args, exception):
+    """Collect metrics after a failed BDD step."""
+    _record_step_metrics(request, step, error=str(exception))
 
 
 def pytest_html_report_title(report):
     """Customize HTML report title."""
-    report.title = "Sauce Demo BDD Test Automation Report"
+    report.title = REPORT_TITLE
 
 
 def pytest_html_results_table_header(cells):
     """Customize HTML report table headers."""
     cells.insert(2, '<th class="sortable" data-column-type="text">Module</th>')
     cells.insert(3, '<th class="sortable" data-column-type="text">Tags</th>')
+    cells.insert(4, '<th class="sortable" data-column-type="text">Isolation</th>')
 
 
 def pytest_html_results_table_row(report, cells):
@@ -213,23 +717,11 @@ def pytest_html_results_table_row(report, cells):
     if not hasattr(report, 'user_properties'):
         return
     
-    # Extract module and tags from test markers
-    markers = []
-    module = "Unknown"
-    
-    for prop in report.user_properties:
-        if prop[0] == "markers":
-            markers = prop[1]
-            if "auth" in markers:
-                module = "Authentication"
-            elif "inventory" in markers:
-                module = "Inventory"
-            elif "cart" in markers:
-                module = "Cart"
-            break
-    
-    cells.insert(2, f'<td>{module}</td>')
-    cells.insert(3, f'<td>{", ".join(markers)}</td>')
+    # Module and tags from test markers; write_html() fills the same columns for xdist runs
+    columns = report_columns(dict(report.user_properties))
+    cells.insert(2, f'<td>{columns["module"]}</td>')
+    cells.insert(3, f'<td>{columns["tags"]}</td>')
+    cells.insert(4, f'<td>{columns["isolation"]}</td>')
 
 
 # Retry mechanism for flaky tests
@@ -243,25 +735,36 @@ def pytest_runtest_protocol(item, nextitem):
 # Test data fixtures
 @pytest.fixture
 def test_data():
-    """Test data fixture."""
+    """Test data fixture exposing the shared test-data tables."""
     return {
         "users": TEST_USERS,
-        "products": [
-            {
-                "name": "Sauce Labs Backpack",
-                "price": "$29.99",
-                "description": "carry.allTheThings() with the sleek, streamlined Sly Pack"
-            },
-            {
-                "name": "Sauce Labs Bike Light", 
-                "price": "$9.99",
-                "description": "A red light isn't the desired state in testing"
-            }
-        ],
-        "sort_options": {
-            "name_a_z": "az",
-            "name_z_a": "za", 
-            "price_low_high": "lohi",
-            "price_high_low": "hilo"
-        }
+        "products": PRODUCTS,
+        "sort_options": SORT_OPTIONS
     }
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize data-driven tests from EXTERNAL_DATA_DIR, falling back to the TestData tables.
+
+    product_record gets one test per catalog row; user_partition gets one test
+    per partition of the users, sized so every xdist worker and CI shard has a share.
+    """
+    if "product_record" in metafunc.fixturenames:
+        source = external_source("products", Product) or RecordSource(PRODUCTS)
+        metafunc.parametrize("product_record", row_params(source), indirect=True)
+    if "user_partition" in metafunc.fixturenames:
+        source = external_source("users", User) or RecordSource(TEST_USERS)
+        metafunc.parametrize("user_partition", partition_params(source), indirect=True)
+
+
+@pytest.fixture
+def product_record(request):
+    """Catalog row of a data-driven test, read from its source when the test runs."""
+    return request.param.load()
+
+
+@pytest.fixture
+def user_partition(request):
+    """Users of a data-driven test's partition, streamed from its source."""
+    return request.param.rows()
@@ -41,3 +41,16 @@ Feature: Authentication Module
     And click Login Button
     Then login Button should be still displayed
     And error message should contain "locked out"
+
+  @auth
+  Scenario: Login outcome for every test user
+    When all test users log in concurrently
+    Then every user should get the expected login result
+
+  @auth @performance
+  Scenario: Performance glitch user login stays within latency budget
+    When user enters user name as "performance_glitch_user" and password as "secret_sauce"
+    And click Login Button
+    Then verify page has text "Products"
+    And products page should render within 6000 ms of the login click
+    And first contentful paint should be within 6000 ms
@@ -63,11 +63,167 @@ from playwright.sync_api import sync_playwright
 ```
 
 CURRENT STATE: Running in simulation mode for demonstration
-To activate real MCP: Set environment variable MCP_MODE=real
+To activate real MCP: Set environment variable MCP_MODE=real. Option 3 is
+implemented by support.mcp_transport: the client starts the server given by
+MCP_SERVER_COMMAND (default: npx @playwright/mcp@latest --headless) and keeps
+pipelined JSON-RPC connections to it, MCP_POOL_SHARDS server processes shared
+by all clients in the process (support.mcp_pool).
 """
 import time
 import os
-from typing import Optional, Dict, Any
+import asyncio
+import functools
+import threading
+import uuid
+from typing import Optional, Dict, Any, List
+
+from support.browser_server import endpoint_for_worker, published_endpoints, STARTUP_TIMEOUT
+from support.failure_capture import SCREENCAST_OPTIONS
+from support.performance_metrics import (
+    LONG_TASK_OBSERVER_SCRIPT, PERFORMANCE_METRICS_SCRIPT, MARK_TRANSITION_SCRIPT, TRANSITION_SCRIPT,
+    simulated_metrics, simulated_transition_ms
+)
+from support.text_index import PageTextIndex, default_automaton
+from support.aria_snapshot import SnapshotCache
+from support.mcp_pool import shared_pool
+from support.mcp_transport import tool_result_value
+from support.memory_tracking import JS_HEAP_SCRIPT, process_rss
+
+
+# Operations after which cached page state (such as the text index) is stale
+MUTATING_OPERATIONS = ("navigate", "click", "type", "select_option", "seed_storage")
+
+# Isolation tiers, from strongest to cheapest:
+#   new-browser    fresh browser process per test
+#   new-context    fresh context on the shared browser per test (default)
+#   reset-context  pooled context; cookies and storage cleared, page sent to about:blank
+#   shared-page    pooled context and page reused as-is
+ISOLATION_TIERS = ("new-browser", "new-context", "reset-context", "shared-page")
+DEFAULT_ISOLATION_TIER = os.getenv("ISOLATION_TIER", "new-context")
+POOLED_TIERS = ("reset-context", "shared-page")
+
+SET_STORAGE_SCRIPT = """
+(entries) => {
+    for (const [key, value] of Object.entries(entries)) {
+        if (value === null) {
+            localStorage.removeItem(key);
+        } else {
+            localStorage.setItem(key, value);
+        }
+    }
+}
+"""
+
+# Evaluates a list of visibility/text/count predicates in a single round trip
+CHECK_MANY_SCRIPT = """
+(predicates) => {
+    const isVisible = (element) => !!element
+        && !!(element.offsetWidth || element.offsetHeight || element.getClientRects().length)
+        && getComputedStyle(element).visibility !== "hidden";
+    return predicates.map((predicate) => {
+        try {
+            if (predicate.kind === "visible") {
+                const visible = isVisible(document.querySelector(predicate.selector));
+                return { passed: visible, actual: visible };
+            }
+            if (predicate.kind === "text") {
+                const root = predicate.selector ? document.querySelector(predicate.selector) : document.body;
+                const text = root ? root.innerText : "";
+                return { passed: text.includes(predicate.text), actual: predicate.selector ? text.slice(0, 200) : null };
+            }
+            if (predicate.kind === "count") {
+                const count = document.querySelectorAll(predicate.selector).length;
+                return { passed: count === predicate.count, actual: count };
+            }
+            return { passed: false, error: "Unknown predicate kind: " + predicate.kind };
+        } catch (e) {
+            return { passed: false, error: String(e) };
+        }
+    });
+}
+"""
+
+# DOM scripts evaluated through the MCP server's browser_evaluate tool
+CLICK_SCRIPT = """
+(selector) => {
+    const element = document.querySelector(selector);
+    if (!element) throw new Error("No element matches " + selector);
+    element.click();
+    return true;
+}
+"""
+
+SET_VALUE_SCRIPT = """
+(selector, value) => {
+    const element = document.querySelector(selector);
+    if (!element) throw new Error("No element matches " + selector);
+    // Native setter so framework-controlled inputs see the change
+    Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), "value").set.call(element, value);
+    element.dispatchEvent(new Event("input", { bubbles: true }));
+    element.dispatchEvent(new Event("change", { bubbles: true }));
+    return true;
+}
+"""
+
+WAIT_FOR_SELECTOR_SCRIPT = """
+(selector, timeout) => new Promise((resolve) => {
+    const deadline = Date.now() + timeout;
+    const poll = () => {
+        if (document.querySelector(selector)) return resolve(true);
+        if (Date.now() > deadline) return resolve(false);
+        setTimeout(poll, 50);
+    };
+    poll();
+})
+"""
+
+PAGE_TEXT_SCRIPT = "() => document.body.innerText"
+
+# Per-origin storage cleared between reset-context tests (CDP Storage.clearDataForOrigin)
+CLEARED_STORAGE_TYPES = "local_storage,indexeddb,websql,cache_storage,service_workers,file_systems"
+
+
+def _redact_typed_text(args: tuple) -> tuple:
+    """Hide typed text for password fields before it reaches a trace."""
+    selector, text, *rest = args
+    description = rest[0] if rest else ""
+    if "password" in description.lower():
+        text = "*" * len(text)
+    return (selector, text, *rest)
+
+
+def _traced(operation: str, redact=None):
+    """
+    Decorator recording client operations into the active failure capture
+    and command recorder, or answering them from the active replay.
+
+    Args:
+        operation: Operation name written to the trace
+        redact: Optional callable that masks sensitive arguments
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            started = time.time()
+            if operation in MUTATING_OPERATIONS:
+                # Bumped up front so snapshots returned by the operation belong to the new version
+                self.page_version += 1
+            details = redact(args) if redact else args
+            if self.replay is not None:
+                result, delay = self.replay.next(operation, details)
+                if delay:
+                    await asyncio.sleep(delay)
+            else:
+                result = await func(self, *args, **kwargs)
+            duration = time.time() - started
+            self.operation_log.append((operation, started, duration))
+            if self.recorder is not None:
+                self.recorder.record(operation, details, result, duration)
+            if self.capture is not None:
+                self.capture.record_event(operation, details, duration, result)
+            return result
+        return wrapper
+    return decorator
 
 
 class MCPPlaywrightClient:
@@ -78,7 +234,28 @@ class MCPPlaywrightClient:
         self.current_page = None
         self.browser_context = None
         self.timeout = 30000  # 30 seconds
+        self.deadline = None  # time.time() by which the current test must finish, from its history budget
         self.simulation_mode = True  # Set to True for simulation, False for real MCP
+        self.capture = None  # FailureCapture ring buffer attached by the test fixture
+        self.route_handlers = []  # (pattern, handler) pairs installed on every browser context
+        self._context_routes = []  # route_handlers entries already installed on the current context
+        self.operation_log = []  # (operation, started, duration) tuples, reset per test
+        self._playwright = None
+        self.browser = None  # Shared browser reached through a published browser server
+        self.context = None  # Isolated Playwright context for the current test
+        self.page = None  # Set when a real browser page backs this client
+        self.isolation = DEFAULT_ISOLATION_TIER  # Tier used for the current test
+        self._own_browser = None  # Browser launched for the new-browser tier
+        self._screencast_page = None  # Page the screencast session is attached to
+        self.local_storage = {}  # origin -> entries seeded in simulation mode
+        self.transition_marks = {}  # mark name -> time.time() of transitions marked in simulation mode
+        self.page_version = 0  # Bumped by every operation that may change the page
+        self.transport = None  # MCPStdioTransport of the pool shard serving this client (MCP_MODE=real)
+        self.session_id = uuid.uuid4().hex  # Sticky routing key into the MCP connection pool
+        self._text_index = None  # PageTextIndex over the last page-text capture
+        self.snapshots = SnapshotCache()  # Accessibility trees from MCP tool responses, one per page
+        self.recorder = None  # CommandRecorder writing this test's command stream
+        self.replay = None  # ReplayBackend answering commands instead of a browser
         
     def _is_mcp_available(self) -> bool:
         """Check if MCP server is available."""
@@ -86,28 +263,228 @@ class MCPPlaywrightClient:
         # For now, we'll use environment variable to control mode
         return os.getenv("MCP_MODE", "simulation").lower() == "real"
         
-    async def initialize_browser(self, browser_type: str = "chromium", headless: bool = False):
+    async def _mcp_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Call a tool in this client's own tab on its MCP server shard, starting the pool on first use.
+        
+        Args:
+            name: Tool name such as browser_navigate
+            arguments: Tool arguments
+        """
+        shard = shared_pool().shard_for(self.session_id)
+        self.transport = shard.transport
+        result = await shard.acall_session_tool(self.session_id, name, arguments, timeout=self._timeout_ms() / 1000)
+        for item in result.get("content", []):
+            if item.get("type") == "text":
+                self.snapshots.update(item["text"], self.page_version)
+        return result
+    
+    def _timeout_ms(self, timeout: Optional[int] = None) -> int:
+        """Per-operation timeout in ms: the given or default one, cut to what is left before the test's deadline."""
+        timeout = timeout or self.timeout
+        if self.deadline is None:
+            return timeout
+        return max(1, min(timeout, int((self.deadline - time.time()) * 1000)))  # 0 would mean no timeout
+    
+    async def _mcp_evaluate(self, script: str, *args) -> Any:
+        """
+        Evaluate a page function through the MCP server.
+        
+        Args:
+            script: JavaScript function source
+            args: JSON-serialisable arguments passed to the function
+        """
+        function = f"() => ({script})(...{json.dumps(list(args))})"
+        return tool_result_value(await self._mcp_tool("browser_evaluate", {"function": function}))
+    
+    def add_route_handler(self, handler, pattern: str = "**/*"):
+        """
+        Register a Playwright route handler for every new browser context.
+        
+        Handlers run in reverse registration order, so register fallbacks
+        (such as caches) before filters that should see requests first.
+        
+        Args:
+            handler: Async callable receiving a Playwright Route
+            pattern: URL glob the handler applies to
+        """
+        if (pattern, handler) not in self.route_handlers:
+            self.route_handlers.append((pattern, handler))
+    
+    async def _install_routes(self, context):
+        """Install the registered route handlers the context does not have yet, in registration order."""
+        for pattern, handler in self.route_handlers:
+            if (pattern, handler) not in self._context_routes:
+                await context.route(pattern, handler)
+                self._context_routes.append((pattern, handler))
+    
+    async def _connect_browser_server(self, endpoint: str):
+        """
+        Connect to a shared browser server.
+        
+        The browser connection is kept for the whole worker and re-established
+        when the server was restarted by its supervisor.
+        
+        Args:
+            endpoint: Browser server HTTP endpoint
+        """
+        if self.browser is None or not self.browser.is_connected():
+            deadline = time.time() + STARTUP_TIMEOUT
+            while True:
+                try:
+                    self.browser = await self._playwright.chromium.connect_over_cdp(endpoint)
+                    break
+                except Exception as e:
+                    if time.time() > deadline:
+                        raise RuntimeError(f"Browser server {endpoint} is not reachable: {e}")
+                    await asyncio.sleep(0.5)  # Supervisor may be restarting the server
+        return self.browser
+    
+    async def _open_page(self, endpoint: str, headless: bool, viewport: Optional[Dict[str, int]] = None):
+        """
+        Provide a page for the current test according to the isolation tier.
+        
+        Pooled tiers reuse the context left by the previous test; the other
+        tiers open a new context on the shared browser or on a browser
+        launched for this test alone.
+        
+        Args:
+            endpoint: Browser server HTTP endpoint
+            headless: Run a browser launched for the new-browser tier without a window
+            viewport: Context viewport size
+        """
+        if self.isolation in POOLED_TIERS and self.page is not None and not self.page.is_closed():
+            if self.isolation == "reset-context":
+                await self._reset_context()
+            await self._install_routes(self.context)  # Handlers registered since the context was opened
+            await self._start_screencast()
+            return
+        await self._close_context()
+        
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+            self._playwright = await async_playwright().start()
+        if self.isolation == "new-browser":
+            self._own_browser = await self._playwright.chromium.launch(headless=headless)
+            browser = self._own_browser
+        else:
+            browser = await self._connect_browser_server(endpoint)
+        
+        self.context = await browser.new_context(viewport=viewport or {"width": 1280, "height": 720})
+        await self.context.add_init_script(LONG_TASK_OBSERVER_SCRIPT)
+        await self._install_routes(self.context)
+        self.page = await self.context.new_page()
+        await self._start_screencast()
+    
+    async def _reset_context(self):
+        """
+        Clear cookies and web storage of the pooled context and start from a blank page.
+        
+        Storage is cleared for every origin the context holds data for, not just
+        the one the page is on. The page is replaced by a new tab, which is the
+        only way to drop sessionStorage of origins the old tab visited earlier.
+        """
+        state = await self.context.storage_state()
+        origins = {origin["origin"] for origin in state.get("origins", [])}
+        if self.page.url.startswith("http"):
+            origins.add(await self.page.evaluate("() => location.origin"))
+        session = await self.context.new_cdp_session(self.page)
+        for origin in sorted(origins):
+            await session.send("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": CLEARED_STORAGE_TYPES})
+        await session.detach()
+        await self.context.clear_cookies()
+        
+        blank_page = await self.context.new_page()
+        for page in self.context.pages:
+            if page is not blank_page:
+                await page.close()
+        self.page = blank_page
+        self._text_index = None
+    
+    async def _close_context(self):
+        """Close the current context, and the browser when it was launched for one test."""
+        if self.context is not None:
+            await self.context.close()
+        self.context = None
+        self._context_routes = []
+        self.page = None
+        self._screencast_page = None
+        self._text_index = None
+        if self._own_browser is not None:
+            await self._own_browser.close()
+            self._own_browser = None
+    
+    async def _start_screencast(self):
+        """Stream screencast frames into the failure capture ring buffer."""
+        if self.capture is None or not self.capture.video_enabled or self._screencast_page is self.page:
+            return
+        session = await self.context.new_cdp_session(self.page)
+        self._screencast_page = self.page
+        
+        def on_frame(params):
+            if self.capture is not None:
+                self.capture.record_frame(params["data"])  # Decoded only if the test fails
+            asyncio.ensure_future(session.send("Page.screencastFrameAck", {"sessionId": params["sessionId"]}))
+        
+        session.on("Page.screencastFrame", on_frame)
+        await session.send("Page.startScreencast", SCREENCAST_OPTIONS)
+    
+    async def _close_session_tab(self):
+        """Close this client's tab on its MCP server shard; other sessions keep their tabs."""
+        shard = shared_pool().shard_for(self.session_id)
+        await shard.aclose_session(self.session_id, timeout=self.timeout / 1000)
+    
+    async def disconnect(self):
+        """Close pooled contexts, drop browser and MCP server connections and stop the Playwright driver."""
+        await self._close_context()
+        if self.transport is not None:
+            await self._close_session_tab()
+            shared_pool().release(self.session_id)  # The connection stays open for other clients
+            self.transport = None
+        self.snapshots.clear()
+        if self.browser is not None:
+            await self.browser.close()  # Disconnects only; the shared browser keeps running
+            self.browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+    
+    async def initialize_browser(self, browser_type: str = "chromium", headless: bool = False,
+                                 viewport: Optional[Dict[str, int]] = None, isolation: Optional[str] = None):
         """Initialize browser through MCP server."""
-        print(f"🌐 Initializing {browser_type} browser (headless: {headless})")
+        isolation = isolation or DEFAULT_ISOLATION_TIER
+        if isolation not in ISOLATION_TIERS:
+            raise ValueError(f"Unknown isolation tier '{isolation}'. Available: {', '.join(ISOLATION_TIERS)}")
+        print(f"🌐 Initializing {browser_type} browser (headless: {headless}, isolation: {isolation})")
         self.browser_context = {"browser_type": browser_type, "headless": headless}
+        self.isolation = isolation
         
-        if self._is_mcp_available():
-            # Real MCP initialization would go here
-            print("🔗 Connected to MCP Playwright server")
+        if self.replay is not None:
+            print(f"📼 Replaying {self.replay.remaining} recorded command(s) from {self.replay.source}")
+            return True
+        endpoint = endpoint_for_worker(published_endpoints())
+        if endpoint:
+            await self._open_page(endpoint, headless, viewport)
+            print(f"🔗 Connected to shared browser server at {endpoint}")
+        elif self._is_mcp_available():
+            shard = shared_pool().shard_for(self.session_id)
+            self.transport = shard.transport
+            print(f"🔗 Connected to MCP Playwright server shard {shard.index} ({' '.join(self.transport.command)})")
         else:
             print("🎭 Running in simulation mode")
         return True
     
+    @_traced("navigate")
     async def navigate_to_url(self, url: str) -> bool:
         """Navigate to a URL using MCP Playwright."""
         try:
             print(f"🧭 Navigating to: {url}")
             
-            if self._is_mcp_available():
-                # Real MCP call - this would be the actual implementation
-                # In practice, this would make an HTTP request to MCP server
-                # or use VS Code's extension API
-                print("🔗 Using real MCP navigation")
+            if self.page is not None:
+                await self.page.goto(url, timeout=self._timeout_ms())
+                return True
+            elif self._is_mcp_available():
+                await self._mcp_tool("browser_navigate", {"url": url})
                 return True
             else:
                 # Simulation mode - always returns success
@@ -119,14 +496,17 @@ class MCPPlaywrightClient:
             print(f"❌ Navigation failed: {e}")
             return False
 
+    @_traced("click")
     async def click_element(self, selector: str, description: str = "") -> bool:
         """Click an element using MCP Playwright."""
         try:
             print(f"🖱️ Clicking element: {description or selector}")
             
-            if self._is_mcp_available():
-                # Real MCP call
-                print("🔗 Using real MCP click")
+            if self.page is not None:
+                await self.page.click(selector, timeout=self._timeout_ms())
+                return True
+            elif self._is_mcp_available():
+                await self._mcp_evaluate(CLICK_SCRIPT, selector)
                 return True
             else:
                 # Simulation mode
@@ -138,14 +518,17 @@ class MCPPlaywrightClient:
             print(f"❌ Click failed: {e}")
             return False
 
+    @_traced("type", redact=_redact_typed_text)
     async def type_text(self, selector: str, text: str, description: str = "") -> bool:
         """Type text into an element using MCP Playwright."""
         try:
             print(f"⌨️ Typing into {description or selector}: {'*' * len(text) if 'password' in description.lower() else text}")
             
-            if self._is_mcp_available():
-                # Real MCP call
-                print("🔗 Using real MCP typing")
+            if self.page is not None:
+                await self.page.fill(selector, text, timeout=self._timeout_ms())
+                return True
+            elif self._is_mcp_available():
+                await self._mcp_evaluate(SET_VALUE_SCRIPT, selector, text)
                 return True
             else:
                 # Simulation mode
@@ -157,15 +540,21 @@ class MCPPlaywrightClient:
             print(f"❌ Type failed: {e}")
             return False
 
+    @_traced("verify_text")
     async def get_page_text(self, text: str) -> bool:
         """Check if page contains specific text using MCP Playwright."""
         try:
             print(f"🔍 Checking for text: '{text}'")
             
-            if self._is_mcp_available():
-                # Real MCP call
-                print("🔗 Using real MCP text verification")
-                return True
+            tree = self.snapshots.tree_for(self.page_version)
+            if tree is not None and tree.contains_text(text):
+                return True  # Answered from the accessibility tree of the last action
+            if self.page is not None or self._is_mcp_available():
+                index = await self._page_text_index()
+                if index.contains(text):
+                    return True
+                # The page may have settled since the capture; look once more
+                return (await self._page_text_index(refresh=True)).contains(text)
             else:
                 # Simulation mode - always finds text
                 print("🎭 Simulating text check")
@@ -176,16 +565,72 @@ class MCPPlaywrightClient:
             print(f"❌ Text check failed: {e}")
             return False
 
+    async def _page_text_index(self, refresh: bool = False) -> PageTextIndex:
+        """
+        Get the text index for the current page, capturing the page text only when it changed.
+        
+        Args:
+            refresh: Capture again even if no mutating operation ran
+        """
+        index = self._text_index
+        if refresh or index is None or index.version != self.page_version:
+            if self.page is not None:
+                text = await self.page.inner_text("body")
+            else:
+                value = await self._mcp_evaluate(PAGE_TEXT_SCRIPT)
+                text = value if isinstance(value, str) else json.dumps(value)
+            index = PageTextIndex(text, default_automaton(), self.page_version)
+            self._text_index = index
+        return index
+    
+    @_traced("check_many")
+    async def check_many(self, predicates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Evaluate visibility, text and count predicates in one page evaluation.
+        
+        Args:
+            predicates: Dicts with kind ("visible", "text" or "count") and
+                selector, text or count as the kind requires
+        
+        Returns:
+            List[Dict[str, Any]]: Each predicate extended with passed, actual and error
+        """
+        try:
+            print(f"🔍 Checking {len(predicates)} predicate(s) in one round trip")
+            
+            if self.page is not None:
+                outcomes = await self.page.evaluate(CHECK_MANY_SCRIPT, predicates)
+            elif self._is_mcp_available():
+                outcomes = await self._mcp_evaluate(CHECK_MANY_SCRIPT, predicates)
+                if not isinstance(outcomes, list) or len(outcomes) != len(predicates):
+                    raise ValueError(f"Unexpected batched check result: {outcomes!r}")
+            else:
+                # Simulation mode - every predicate holds
+                print("🎭 Simulating batched check")
+                time.sleep(0.1)
+                outcomes = [{"passed": True, "actual": None} for _ in predicates]
+            
+        except Exception as e:
+            print(f"❌ Batched check failed: {e}")
+            outcomes = [{"passed": False, "actual": None, "error": str(e)} for _ in predicates]
+        
+        return [
+            dict(predicate, passed=outcome["passed"], actual=outcome.get("actual"), error=outcome.get("error"))
+            for predicate, outcome in zip(predicates, outcomes)
+        ]
+
+    @_traced("wait_for_element")
     async def wait_for_element(self, selector: str, timeout: Optional[int] = None) -> bool:
         """Wait for element to be visible using MCP Playwright."""
         try:
-            wait_timeout = timeout or self.timeout
+            wait_timeout = self._timeout_ms(timeout)
             print(f"⏳ Waiting for element: {selector} (timeout: {wait_timeout}ms)")
             
-            if self._is_mcp_available():
-                # Real MCP call
-                print("🔗 Using real MCP wait")
+            if self.page is not None:
+                await self.page.wait_for_selector(selector, timeout=wait_timeout)
                 return True
+            elif self._is_mcp_available():
+                return await self._mcp_evaluate(WAIT_FOR_SELECTOR_SCRIPT, selector, wait_timeout) is not False
             else:
                 # Simulation mode
                 print("🎭 Simulating wait")
@@ -196,15 +641,18 @@ class MCPPlaywrightClient:
             print(f"❌ Wait failed: {e}")
             return False
     
+    @_traced("screenshot")
     async def take_screenshot(self, filename: Optional[str] = None) -> str:
         """Take a screenshot using MCP Playwright."""
         try:
             screenshot_name = filename or f"screenshot_{int(time.time())}.png"
             print(f"📸 Taking screenshot: {screenshot_name}")
             
-            if self._is_mcp_available():
-                # Real MCP call
-                print("🔗 Using real MCP screenshot")
+            if self.page is not None:
+                await self.page.screenshot(path=screenshot_name)
+                return screenshot_name
+            elif self._is_mcp_available():
+                await self._mcp_tool("browser_take_screenshot", {"filename": screenshot_name})
                 return screenshot_name
             else:
                 # Simulation mode
@@ -215,14 +663,17 @@ class MCPPlaywrightClient:
             print(f"❌ Screenshot failed: {e}")
             return ""
 
+    @_traced("select_option")
     async def select_dropdown_option(self, selector: str, value: str, description: str = "") -> bool:
         """Select dropdown option using MCP Playwright."""
         try:
             print(f"📋 Selecting dropdown option: {value} in {description or selector}")
             
-            if self._is_mcp_available():
-                # Real MCP call
-                print("🔗 Using real MCP dropdown selection")
+            if self.page is not None:
+                await self.page.select_option(selector, value, timeout=self._timeout_ms())
+                return True
+            elif self._is_mcp_available():
+                await self._mcp_evaluate(SET_VALUE_SCRIPT, selector, value)
                 return True
             else:
                 # Simulation mode
@@ -234,14 +685,173 @@ class MCPPlaywrightClient:
             print(f"❌ Dropdown selection failed: {e}")
             return False
 
+    @_traced("seed_storage")
+    async def seed_local_storage(self, origin: str, entries: Dict[str, Optional[str]]) -> bool:
+        """
+        Write localStorage entries for an origin without loading the application.
+        
+        The page is sent to a stub document on the origin that is fulfilled
+        locally, the entries are written and the page returns to where it was,
+        so a seeded cart costs one storage write instead of a click per item.
+        
+        Args:
+            origin: Application origin such as https://www.saucedemo.com/
+            entries: Keys to set; None removes a key
+        """
+        try:
+            print(f"🌱 Seeding localStorage for {origin}: {', '.join(entries)}")
+            
+            if self.page is not None:
+                seed_url = origin.rstrip("/") + "/__seed_state__"
+                return_to = self.page.url
+                
+                async def fulfill_stub(route):
+                    await route.fulfill(status=200, content_type="text/html", body="<html></html>")
+                
+                await self.page.route(seed_url, fulfill_stub)
+                try:
+                    await self.page.goto(seed_url, timeout=self._timeout_ms())
+                    await self.page.evaluate(SET_STORAGE_SCRIPT, entries)
+                finally:
+                    await self.page.unroute(seed_url, fulfill_stub)
+                if return_to.startswith(origin.rstrip("/")):
+                    await self.page.goto(return_to, timeout=self._timeout_ms())
+                return True
+            elif self._is_mcp_available():
+                # No request interception over MCP, so the write happens on the origin itself
+                await self._mcp_tool("browser_navigate", {"url": origin})
+                await self._mcp_evaluate(SET_STORAGE_SCRIPT, entries)
+                return True
+            else:
+                # Simulation mode
+                stored = self.local_storage.setdefault(origin, {})
+                for key, value in entries.items():
+                    if value is None:
+                        stored.pop(key, None)
+                    else:
+                        stored[key] = value
+                print("🎭 Simulating storage seeding")
+                return True
+                
+        except Exception as e:
+            print(f"❌ Storage seeding failed: {e}")
+            return False
+
+    async def collect_performance_metrics(self) -> Optional[Dict[str, Any]]:
+        """Collect Navigation Timing, paint and long-task metrics from the current page."""
+        try:
+            if self.page is not None:
+                return await self.page.evaluate(PERFORMANCE_METRICS_SCRIPT)
+            elif self._is_mcp_available() and self.replay is None:
+                metrics = await self._mcp_evaluate(PERFORMANCE_METRICS_SCRIPT)
+                return metrics if isinstance(metrics, dict) else None
+            else:
+                # Simulation mode - derive timings from recorded operations
+                return simulated_metrics(self.operation_log)
+                
+        except Exception as e:
+            print(f"❌ Metrics collection failed: {e}")
+            return None
+
+    async def mark_transition(self, name: str) -> bool:
+        """Set a performance mark before an action that starts a route change."""
+        try:
+            if self.page is not None:
+                await self.page.evaluate(MARK_TRANSITION_SCRIPT, name)
+            elif self._is_mcp_available() and self.replay is None:
+                await self._mcp_evaluate(MARK_TRANSITION_SCRIPT, name)
+            else:
+                # Simulation mode - time the transition from recorded operations
+                self.transition_marks[name] = time.time()
+            return True
+
+        except Exception as e:
+            print(f"❌ Transition mark failed: {e}")
+            return False
+
+    async def measure_transition(self, name: str, selector: str, timeout: Optional[int] = None) -> Optional[float]:
+        """
+        Time a route change from its mark until a selector of the new view appears.
+
+        Args:
+            name: Mark set by mark_transition() before the triggering action
+            selector: Element that shows the new view is rendered
+            timeout: Milliseconds to wait for the selector
+
+        Returns:
+            float: Transition time in milliseconds, or None if the selector never appeared
+        """
+        try:
+            arguments = {"mark": name, "selector": selector, "timeout": self._timeout_ms(timeout)}
+            if self.page is not None:
+                return await self.page.evaluate(TRANSITION_SCRIPT, arguments)
+            elif self._is_mcp_available() and self.replay is None:
+                return await self._mcp_evaluate(TRANSITION_SCRIPT, arguments)
+            else:
+                # Simulation mode
+                marked_at = self.transition_marks.get(name)
+                return None if marked_at is None else simulated_transition_ms(self.operation_log, marked_at)
+
+        except Exception as e:
+            print(f"❌ Transition measurement failed: {e}")
+            return None
+
+    async def collect_memory_metrics(self) -> Optional[Dict[str, Any]]:
+        """Sample the JS heap of the current page and the RSS of the browser processes."""
+        try:
+            if self.page is not None:
+                session = await self.context.new_cdp_session(self.page)
+                try:
+                    await session.send("Performance.enable")
+                    response = await session.send("Performance.getMetrics")
+                finally:
+                    await session.detach()
+                metrics = {metric["name"]: metric["value"] for metric in response["metrics"]}
+                return {
+                    "js_heap_used": int(metrics.get("JSHeapUsedSize", 0)),
+                    "js_heap_total": int(metrics.get("JSHeapTotalSize", 0)),
+                    "dom_nodes": int(metrics.get("Nodes", 0)),
+                    "browser_rss": await self._browser_rss()
+                }
+            elif self._is_mcp_available() and self.replay is None:
+                heap = await self._mcp_evaluate(JS_HEAP_SCRIPT)
+                return heap if isinstance(heap, dict) else None
+            else:
+                # Simulation mode - there is no browser to measure
+                return None
+
+        except Exception as e:
+            print(f"❌ Memory sampling failed: {e}")
+            return None
+
+    async def _browser_rss(self) -> Optional[int]:
+        """RSS of every process of the browser serving this test (shared by all its clients)."""
+        browser = self._own_browser or self.browser
+        if browser is None:
+            return None
+        session = await browser.new_browser_cdp_session()
+        try:
+            info = await session.send("SystemInfo.getProcessInfo")
+        finally:
+            await session.detach()
+        return process_rss(process["id"] for process in info["processInfo"])
+
     async def close_browser(self):
         """Close browser using MCP Playwright."""
         try:
             print("🔚 Closing browser")
             
-            if self._is_mcp_available():
-                # Real MCP call
-                print("🔗 Using real MCP browser close")
+            if self.replay is not None:
+                return True
+            elif self.page is not None:
+                # Pooled tiers keep the context for the next test; the shared browser always stays up
+                if self.isolation not in POOLED_TIERS:
+                    await self._close_context()
+                return True
+            elif self._is_mcp_available():
+                # The server's browser is shared by every session on the shard; close only this tab
+                if self.transport is not None:
+                    await self._close_session_tab()
                 return True
             else:
                 # Simulation mode
@@ -253,48 +863,124 @@ class MCPPlaywrightClient:
             return False
 
 
-# Global MCP client instance
+# Global MCP client instance; page objects use it unless given their own client
 mcp_client = MCPPlaywrightClient()
 
+# Per-thread event loops that outlive individual calls
+_loop_state = threading.local()
+
+
+def _run(coro):
+    """
+    Run a client coroutine on this thread's persistent event loop.
+    
+    Playwright objects are bound to the loop that created them, so a fresh
+    asyncio.run() per call would invalidate the shared browser connection.
+    """
+    loop = getattr(_loop_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _loop_state.loop = loop
+    return loop.run_until_complete(coro)
+
+
+def close_thread_loop():
+    """Close this thread's event loop; call before a short-lived worker thread exits."""
+    loop = getattr(_loop_state, "loop", None)
+    if loop is not None and not loop.is_closed():
+        loop.close()
+    _loop_state.loop = None
+
 
 # Integration functions for page objects
-def mcp_navigate(url: str) -> bool:
+def mcp_initialize_browser(browser_type: str = "chromium", headless: bool = False,
+                           viewport: Optional[Dict[str, int]] = None,
+                           client: Optional[MCPPlaywrightClient] = None,
+                           isolation: Optional[str] = None) -> bool:
+    """Initialize browser via MCP."""
+    return _run((client or mcp_client).initialize_browser(browser_type, headless, viewport, isolation))
+
+
+def mcp_close_browser(client: Optional[MCPPlaywrightClient] = None) -> bool:
+    """Close browser via MCP."""
+    return _run((client or mcp_client).close_browser())
+
+
+def mcp_disconnect(client: Optional[MCPPlaywrightClient] = None):
+    """Disconnect from the shared browser server via MCP."""
+    return _run((client or mcp_client).disconnect())
+
+
+def mcp_navigate(url: str, client: Optional[MCPPlaywrightClient] = None) -> bool:
     """Navigate to URL via MCP."""
-    import asyncio
-    return asyncio.run(mcp_client.navigate_to_url(url))
+    return _run((client or mcp_client).navigate_to_url(url))
 
 
-def mcp_click(selector: str, description: str = "") -> bool:
+def mcp_click(selector: str, description: str = "", client: Optional[MCPPlaywrightClient] = None) -> bool:
     """Click element via MCP."""
-    import asyncio
-    return asyncio.run(mcp_client.click_element(selector, description))
+    return _run((client or mcp_client).click_element(selector, description))
 
 
-def mcp_type(selector: str, text: str, description: str = "") -> bool:
+def mcp_type(selector: str, text: str, description: str = "", client: Optional[MCPPlaywrightClient] = None) -> bool:
     """Type text via MCP."""
-    import asyncio
-    return asyncio.run(mcp_client.type_text(selector, text, description))
+    return _run((client or mcp_client).type_text(selector, text, description))
 
 
-def mcp_verify_text(text: str) -> bool:
+def mcp_verify_text(text: str, client: Optional[MCPPlaywrightClient] = None) -> bool:
     """Verify page contains text via MCP."""
-    import asyncio
-    return asyncio.run(mcp_client.get_page_text(text))
+    return _run((client or mcp_client).get_page_text(text))
+
 
+def mcp_check_many(predicates: List[Dict[str, Any]],
+                   client: Optional[MCPPlaywrightClient] = None) -> List[Dict[str, Any]]:
+    """Evaluate a batch of page predicates via MCP."""
+    return _run((client or mcp_client).check_many(predicates))
 
-def mcp_wait_for_element(selector: str, timeout: Optional[int] = None) -> bool:
+
+def mcp_wait_for_element(selector: str, timeout: Optional[int] = None,
+                         client: Optional[MCPPlaywrightClient] = None) -> bool:
     """Wait for element via MCP."""
-    import asyncio
-    return asyncio.run(mcp_client.wait_for_element(selector, timeout))
+    return _run((client or mcp_client).wait_for_element(selector, timeout))
 
 
-def mcp_screenshot(filename: Optional[str] = None) -> str:
+def mcp_screenshot(filename: Optional[str] = None, client: Optional[MCPPlaywrightClient] = None) -> str:
     """Take screenshot via MCP."""
-    import asyncio
-    return asyncio.run(mcp_client.take_screenshot(filename))
+    return _run((client or mcp_client).take_screenshot(filename))
 
 
-def mcp_select_option(selector: str, value: str, description: str = "") -> bool:
+def mcp_select_option(selector: str, value: str, description: str = "",
+                      client: Optional[MCPPlaywrightClient] = None) -> bool:
     """Select dropdown option via MCP."""
-    import asyncio
-    return asyncio.run(mcp_client.select_dropdown_option(selector, value, description))
+    return _run((client or mcp_client).select_dropdown_option(selector, value, description))
+
+
+def mcp_seed_local_storage(origin: str, entries: Dict[str, Optional[str]],
+                           client: Optional[MCPPlaywrightClient] = None) -> bool:
+    """Seed localStorage entries via MCP."""
+    return _run((client or mcp_client).seed_local_storage(origin, entries))
+
+
+def mcp_collect_performance_metrics(client: Optional[MCPPlaywrightClient] = None) -> Optional[Dict[str, Any]]:
+    """Collect page performance metrics via MCP."""
+    return _run((client or mcp_client).collect_performance_metrics())
+
+
+def mcp_mark_transition(name: str, client: Optional[MCPPlaywrightClient] = None) -> bool:
+    """Set a route-change performance mark via MCP."""
+    return _run((client or mcp_client).mark_transition(name))
+
+
+def mcp_measure_transition(name: str, selector: str, timeout: Optional[int] = None,
+                           client: Optional[MCPPlaywrightClient] = None) -> Optional[float]:
+    """Time a route change via MCP."""
+    return _run((client or mcp_client).measure_transition(name, selector, timeout))
+
+
+def mcp_collect_memory_metrics(client: Optional[MCPPlaywrightClient] = None) -> Optional[Dict[str, Any]]:
+    """Collect browser RSS and page JS heap via MCP."""
+    return _run((client or mcp_client).collect_memory_metrics())
+
+
+def mcp_snapshot_stats(client: Optional[MCPPlaywrightClient] = None) -> Optional[Dict[str, Any]]:
+    """Snapshot bytes and parse time since the last call (None when no snapshot arrived)."""
+    return (client or mcp_client).snapshots.pop_step_stats()
@@ -2,21 +2,91 @@
 Base Page Object Model class providing common functionality for all pages.
 This class integrates with Playwright MCP server for browser automation.
 """
+import functools
+import inspect
 import time
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional
 from mcp_integration import (
     mcp_navigate, mcp_click, mcp_type, mcp_verify_text, 
-    mcp_wait_for_element, mcp_screenshot, mcp_select_option
+    mcp_wait_for_element, mcp_screenshot, mcp_select_option,
+    mcp_collect_performance_metrics, mcp_seed_local_storage, mcp_check_many,
+    mcp_mark_transition, mcp_measure_transition
 )
+from support.mcp_recording import ReplayMismatchError
+
+
+def describe_check(result: Dict[str, Any]) -> str:
+    """
+    Describe a check_many() result for assertion messages.
+    
+    Args:
+        result: One entry returned by BasePage.check_many()
+        
+    Returns:
+        str: Human readable predicate and outcome
+    """
+    if result["kind"] == "visible":
+        description = f"{result['selector']} visible"
+    elif result["kind"] == "text":
+        scope = f" in {result['selector']}" if result.get("selector") else ""
+        description = f"text '{result['text']}'{scope}"
+    else:
+        description = f"{result['count']} x {result['selector']} (found {result.get('actual')})"
+    if result.get("error"):
+        description += f" - {result['error']}"
+    return description
+
+
+def reports_failure(message: str, default: Any = False) -> Callable:
+    """
+    Decorate a page operation so that errors are reported instead of raised.
+    
+    ReplayMismatchError still propagates: a replay that diverged from its
+    recording must fail the test rather than read as a failed operation.
+    
+    Args:
+        message: Printed on error, formatted with the operation's arguments and {error}
+        default: Returned on error; a callable is called with the arguments and error
+        
+    Returns:
+        Callable: Decorator
+    """
+    def decorate(operation: Callable) -> Callable:
+        signature = inspect.signature(operation)
+        
+        @functools.wraps(operation)
+        def wrapper(*args, **kwargs):
+            try:
+                return operation(*args, **kwargs)
+            except ReplayMismatchError:
+                raise
+            except Exception as error:
+                arguments = signature.bind(*args, **kwargs)
+                arguments.apply_defaults()
+                print(message.format(**arguments.arguments, error=error))
+                return default(**arguments.arguments, error=error) if callable(default) else default
+        return wrapper
+    return decorate
 
 
 class BasePage:
-    """Base page class with common page operations."""
+    """
+    Base page class with common page operations.
     
-    def __init__(self):
-        """Initialize base page."""
+    Operations report failures as False or None (see reports_failure).
+    """
+    
+    def __init__(self, client=None):
+        """
+        Initialize base page.
+        
+        Args:
+            client: MCPPlaywrightClient driving this page (defaults to the shared client)
+        """
         self.timeout = 30000  # 30 seconds default timeout
+        self.client = client
         
+    @reports_failure("Navigation failed: {error}")
     def navigate_to(self, url: str) -> bool:
         """
         Navigate to a specific URL.
@@ -27,12 +97,9 @@ class BasePage:
         Returns:
             bool: True if navigation successful
         """
-        try:
-            return mcp_navigate(url)
-        except Exception as e:
-            print(f"Navigation failed: {e}")
-            return False
+        return mcp_navigate(url, client=self.client)
     
+    @reports_failure("Element not found: {selector}, Error: {error}")
     def wait_for_element(self, selector: str, timeout: Optional[int] = None) -> bool:
         """
         Wait for an element to be visible.
@@ -44,12 +111,9 @@ class BasePage:
         Returns:
             bool: True if element found within timeout
         """
-        try:
-            return mcp_wait_for_element(selector, timeout)
-        except Exception as e:
-            print(f"Element not found: {selector}, Error: {e}")
-            return False
+        return mcp_wait_for_element(selector, timeout, client=self.client)
     
+    @reports_failure("Click failed on {selector}: {error}")
     def click_element(self, selector: str, element_description: str = "") -> bool:
         """
         Click on an element.
@@ -61,12 +125,9 @@ class BasePage:
         Returns:
             bool: True if click successful
         """
-        try:
-            return mcp_click(selector, element_description)
-        except Exception as e:
-            print(f"Click failed on {selector}: {e}")
-            return False
+        return mcp_click(selector, element_description, client=self.client)
     
+    @reports_failure("Typing failed on {selector}: {error}")
     def type_text(self, selector: str, text: str, element_description: str = "") -> bool:
         """
         Type text into an element.
@@ -79,12 +140,9 @@ class BasePage:
         Returns:
             bool: True if typing successful
         """
-        try:
-            return mcp_type(selector, text, element_description)
-        except Exception as e:
-            print(f"Typing failed on {selector}: {e}")
-            return False
+        return mcp_type(selector, text, element_description, client=self.client)
     
+    @reports_failure("Get text failed on {selector}: {error}", default=None)
     def get_text(self, selector: str) -> Optional[str]:
         """
         Get text content of an element.
@@ -95,13 +153,10 @@ class BasePage:
         Returns:
             str: Element text content or None if not found
         """
-        try:
-            # This will be handled by MCP Playwright server
-            return ""
-        except Exception as e:
-            print(f"Get text failed on {selector}: {e}")
-            return None
+        # This will be handled by MCP Playwright server
+        return ""
     
+    @reports_failure("Visibility check failed on {selector}: {error}")
     def is_element_visible(self, selector: str) -> bool:
         """
         Check if element is visible.
@@ -112,13 +167,10 @@ class BasePage:
         Returns:
             bool: True if element is visible
         """
-        try:
-            # This will be handled by MCP Playwright server
-            return True
-        except Exception as e:
-            print(f"Visibility check failed on {selector}: {e}")
-            return False
+        # This will be handled by MCP Playwright server
+        return True
     
+    @reports_failure("Text verification failed for '{text}': {error}")
     def verify_page_contains_text(self, text: str) -> bool:
         """
         Verify that page contains specific text.
@@ -129,12 +181,55 @@ class BasePage:
         Returns:
             bool: True if text found on page
         """
-        try:
-            return mcp_verify_text(text)
-        except Exception as e:
-            print(f"Text verification failed for '{text}': {e}")
-            return False
+        return mcp_verify_text(text, client=self.client)
+    
+    @staticmethod
+    def visible(selector: str) -> Dict[str, Any]:
+        """Predicate: the first element matching selector is visible."""
+        return {"kind": "visible", "selector": selector}
+    
+    @staticmethod
+    def has_text(text: str, selector: Optional[str] = None) -> Dict[str, Any]:
+        """Predicate: the page (or the element matching selector) contains text."""
+        return {"kind": "text", "text": text, "selector": selector}
+    
+    @staticmethod
+    def count_of(selector: str, count: int) -> Dict[str, Any]:
+        """Predicate: exactly count elements match selector."""
+        return {"kind": "count", "selector": selector, "count": count}
+    
+    @reports_failure("Batched check failed: {error}", default=lambda predicates, error, **_: [
+        dict(predicate, passed=False, actual=None, error=str(error)) for predicate in predicates
+    ])
+    def check_many(self, predicates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Evaluate several predicates in a single browser round trip.
+        
+        Args:
+            predicates: Predicates built with visible(), has_text() and count_of()
+            
+        Returns:
+            List[Dict[str, Any]]: Each predicate with passed, actual and error
+        """
+        return mcp_check_many(predicates, client=self.client)
+    
+    def expect_all(self, predicates: List[Dict[str, Any]]) -> bool:
+        """
+        Verify that every predicate holds, in a single browser round trip.
+        
+        Args:
+            predicates: Predicates built with visible(), has_text() and count_of()
+            
+        Returns:
+            bool: True if all predicates passed
+        """
+        results = self.check_many(predicates)
+        for result in results:
+            if not result["passed"]:
+                print(f"Check failed: {describe_check(result)}")
+        return all(result["passed"] for result in results)
     
+    @reports_failure("Screenshot failed: {error}", default="")
     def take_screenshot(self, filename: Optional[str] = None) -> str:
         """
         Take a screenshot of the current page.
@@ -145,12 +240,9 @@ class BasePage:
         Returns:
             str: Path to screenshot file
         """
-        try:
-            return mcp_screenshot(filename)
-        except Exception as e:
-            print(f"Screenshot failed: {e}")
-            return ""
+        return mcp_screenshot(filename, client=self.client)
     
+    @reports_failure("Dropdown selection failed on {selector}: {error}")
     def select_dropdown_option(self, selector: str, value: str, element_description: str = "") -> bool:
         """
         Select an option from dropdown.
@@ -163,8 +255,56 @@ class BasePage:
         Returns:
             bool: True if selection successful
         """
-        try:
-            return mcp_select_option(selector, value, element_description)
-        except Exception as e:
-            print(f"Dropdown selection failed on {selector}: {e}")
-            return False
+        return mcp_select_option(selector, value, element_description, client=self.client)
+    
+    @reports_failure("Performance metrics collection failed: {error}", default=None)
+    def get_performance_metrics(self) -> Optional[Dict[str, Any]]:
+        """
+        Get Navigation Timing, paint and long-task metrics for the current page.
+        
+        Returns:
+            dict: Collected metrics or None if unavailable
+        """
+        return mcp_collect_performance_metrics(client=self.client)
+    
+    @reports_failure("Transition mark failed: {error}")
+    def mark_transition(self, name: str) -> bool:
+        """
+        Set a performance mark before an action that starts a client-side route change.
+        
+        Args:
+            name: Mark name passed later to measure_transition()
+            
+        Returns:
+            bool: True if the mark was set
+        """
+        return mcp_mark_transition(name, client=self.client)
+    
+    @reports_failure("Transition measurement failed: {error}", default=None)
+    def measure_transition(self, name: str, selector: str, timeout: Optional[int] = None) -> Optional[float]:
+        """
+        Time a route change from its mark until an element of the new view appears.
+        
+        Args:
+            name: Mark set by mark_transition()
+            selector: Element that shows the new view is rendered
+            timeout: Milliseconds to wait for the element
+            
+        Returns:
+            float: Transition time in milliseconds, or None if unavailable
+        """
+        return mcp_measure_transition(name, selector, timeout, client=self.client)
+    
+    @reports_failure("Storage seeding failed for {origin}: {error}")
+    def seed_local_storage(self, origin: str, entries: Dict[str, Optional[str]]) -> bool:
+        """
+        Write localStorage entries for an origin before or between navigations.
+        
+        Args:
+            origin: Application origin
+            entries: Keys to set; None removes a key
+            
+        Returns:
+            bool: True if the entries were written
+        """
+        return mcp_seed_local_storage(origin, entries, client=self.client)
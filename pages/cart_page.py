@@ -2,8 +2,11 @@
 Cart Page Object Model for Sauce Demo application.
 Handles all cart-related interactions and validations.
 """
+import json
 from pages.base_page import BasePage
 from typing import List, Dict, Optional
+from TestData.models import parse_price
+from TestData.test_data import BASE_URL, PRODUCTS
 
 
 class CartPage(BasePage):
@@ -25,10 +28,47 @@ class CartPage(BasePage):
     YOUR_CART_TEXT = "Your Cart"
     CART_TITLE_TEXT = "Your Cart"
     
-    def __init__(self):
+    # localStorage key holding the cart as a JSON list of product ids
+    CART_STORAGE_KEY = "cart-contents"
+    
+    def __init__(self, client=None):
         """Initialize cart page."""
-        super().__init__()
+        super().__init__(client)
+        
+    @staticmethod
+    def product_ids(product_names: List[str]) -> List[int]:
+        """
+        Map product names to the ids the application stores in its cart.
+        
+        Args:
+            product_names: Product names from TestData.PRODUCTS
+            
+        Returns:
+            List[int]: Product ids in the given order
+        """
+        products = [PRODUCTS.get_by_name(name) for name in product_names]
+        unknown = [name for name, product in zip(product_names, products) if product is None]
+        if unknown:
+            raise ValueError(f"Unknown product(s): {', '.join(unknown)}. Available: {', '.join(PRODUCTS.names())}")
+        return [product.product_id for product in products]
+    
+    def seed_cart(self, product_names: List[str], origin: str = BASE_URL) -> bool:
+        """
+        Put products in the cart by writing the application's cart state directly.
         
+        Call before the first navigation (or reload afterwards) so the
+        application reads the seeded cart; an empty list empties the cart.
+        
+        Args:
+            product_names: Product names from TestData.PRODUCTS
+            origin: Application origin
+            
+        Returns:
+            bool: True if the cart state was written
+        """
+        contents = json.dumps(self.product_ids(product_names)) if product_names else None
+        return self.seed_local_storage(origin, {self.CART_STORAGE_KEY: contents})
+    
     def is_cart_page_displayed(self) -> bool:
         """
         Verify if cart page is displayed.
@@ -68,11 +108,12 @@ class CartPage(BasePage):
         """
         # This will be implemented with actual MCP Playwright calls
         # For now, return sample data for framework structure
+        backpack = PRODUCTS["sauce_labs_backpack"]
         return [
             {
-                "name": "Sauce Labs Backpack",
-                "description": "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection.",
-                "price": "$29.99",
+                "name": backpack.name,
+                "description": backpack.description,
+                "price": backpack.price,
                 "quantity": "1"
             }
         ]
@@ -131,9 +172,11 @@ class CartPage(BasePage):
         Returns:
             bool: True if item removed successfully
         """
-        # Convert item name to data-test attribute format
-        test_id = item_name.lower().replace(" ", "-").replace(".", "").replace("(", "").replace(")", "")
-        remove_button_selector = f'[data-test="remove-{test_id}"]'
+        product = PRODUCTS.get_by_name(item_name)
+        if product is None:
+            print(f"Unknown product: {item_name}")
+            return False
+        remove_button_selector = f'[data-test="{product.remove_id}"]'
         
         return self.click_element(
             remove_button_selector,
@@ -184,18 +227,16 @@ class CartPage(BasePage):
             float: Total cart value
         """
         cart_items = self.get_cart_items()
-        total = 0.0
+        total_cents = 0
         
         for item in cart_items:
             try:
-                # Remove $ and convert to float
-                price = float(item["price"].replace("$", ""))
-                quantity = int(item["quantity"])
-                total += price * quantity
+                # Sum in integer cents so the total has no float rounding error
+                total_cents += parse_price(item["price"]) * int(item["quantity"])
             except (ValueError, KeyError):
                 continue
                 
-        return total
+        return total_cents / 100
     
     def verify_cart_item_details(self, item_name: str, expected_price: Optional[str] = None, 
                                 expected_quantity: Optional[str] = None) -> bool:
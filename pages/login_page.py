@@ -2,7 +2,7 @@
 Login Page Object Model for Sauce Demo application.
 Handles all login-related interactions and validations.
 """
-from pages.base_page import BasePage
+from pages.base_page import BasePage, reports_failure
 
 
 class LoginPage(BasePage):
@@ -18,14 +18,17 @@ class LoginPage(BasePage):
     ERROR_MESSAGE = '[data-test="error"]'
     LOGO = '.login_logo'
     
+    # Performance mark set before every login click; login to inventory is a client-side route change
+    LOGIN_TRANSITION = "login-click"
+    
     # Expected texts
     LOGIN_LOGO_TEXT = "Swag Labs"
     PRODUCTS_PAGE_TEXT = "Products"
     LOGIN_ERROR_TEXT = "Epic sadface:"
     
-    def __init__(self):
+    def __init__(self, client=None):
         """Initialize login page."""
-        super().__init__()
+        super().__init__(client)
         
     def navigate_to_login_page(self) -> bool:
         """
@@ -70,16 +73,18 @@ class LoginPage(BasePage):
     
     def click_login_button(self) -> bool:
         """
-        Click the login button.
+        Click the login button, marking the start of the route change it triggers.
         
         Returns:
             bool: True if click successful
         """
+        self.mark_transition(self.LOGIN_TRANSITION)
         return self.click_element(
             self.LOGIN_BUTTON, 
             "login button"
         )
     
+    @reports_failure("Login failed: {error}")
     def login(self, username: str, password: str) -> bool:
         """
         Perform complete login operation.
@@ -91,23 +96,18 @@ class LoginPage(BasePage):
         Returns:
             bool: True if login process completed successfully
         """
-        try:
-            # Enter credentials
-            if not self.enter_username(username):
-                return False
-                
-            if not self.enter_password(password):
-                return False
-                
-            # Click login button
-            if not self.click_login_button():
-                return False
-                
-            return True
+        # Enter credentials
+        if not self.enter_username(username):
+            return False
+            
+        if not self.enter_password(password):
+            return False
             
-        except Exception as e:
-            print(f"Login failed: {e}")
+        # Click login button
+        if not self.click_login_button():
             return False
+            
+        return True
     
     def is_login_page_displayed(self) -> bool:
         """
@@ -116,11 +116,11 @@ class LoginPage(BasePage):
         Returns:
             bool: True if login page is displayed
         """
-        return (
-            self.is_element_visible(self.USERNAME_INPUT) and
-            self.is_element_visible(self.PASSWORD_INPUT) and
-            self.is_element_visible(self.LOGIN_BUTTON)
-        )
+        return self.expect_all([
+            self.visible(self.USERNAME_INPUT),
+            self.visible(self.PASSWORD_INPUT),
+            self.visible(self.LOGIN_BUTTON)
+        ])
     
     def verify_login_successful(self) -> bool:
         """
@@ -138,10 +138,26 @@ class LoginPage(BasePage):
         Returns:
             bool: True if still on login page (login failed)
         """
-        return (
-            self.is_element_visible(self.LOGIN_BUTTON) or
-            self.is_element_visible(self.ERROR_MESSAGE)
-        )
+        results = self.check_many([
+            self.visible(self.LOGIN_BUTTON),
+            self.visible(self.ERROR_MESSAGE)
+        ])
+        return any(result["passed"] for result in results)
+    
+    def verify_login_error(self, expected_text: str) -> bool:
+        """
+        Verify that login failed with a specific error, in one browser round trip.
+        
+        Args:
+            expected_text: Error text such as EXPECTED_TEXTS["error_locked_user"]
+            
+        Returns:
+            bool: True if still on the login page showing that error
+        """
+        return self.expect_all([
+            self.visible(self.LOGIN_BUTTON),
+            self.has_text(expected_text, self.ERROR_MESSAGE)
+        ])
     
     def get_error_message(self) -> str:
         """
@@ -4,6 +4,7 @@ Handles all product listing, sorting, and selection interactions.
 """
 from pages.base_page import BasePage
 from typing import List
+from TestData.test_data import PRODUCTS, SORT_OPTIONS
 
 
 class ProductsPage(BasePage):
@@ -25,19 +26,19 @@ class ProductsPage(BasePage):
     LOGOUT_LINK = '#logout_sidebar_link'
     
     # Sort options
-    SORT_NAME_A_Z = "az"
-    SORT_NAME_Z_A = "za"
-    SORT_PRICE_LOW_HIGH = "lohi"
-    SORT_PRICE_HIGH_LOW = "hilo"
+    SORT_NAME_A_Z = SORT_OPTIONS["name_a_z"].value
+    SORT_NAME_Z_A = SORT_OPTIONS["name_z_a"].value
+    SORT_PRICE_LOW_HIGH = SORT_OPTIONS["price_low_high"].value
+    SORT_PRICE_HIGH_LOW = SORT_OPTIONS["price_high_low"].value
     
     # Expected texts
     PRODUCTS_TITLE_TEXT = "Products"
     ADD_TO_CART_TEXT = "Add to cart"
     REMOVE_TEXT = "Remove"
     
-    def __init__(self):
+    def __init__(self, client=None):
         """Initialize products page."""
-        super().__init__()
+        super().__init__(client)
         
     def is_products_page_displayed(self) -> bool:
         """
@@ -46,10 +47,10 @@ class ProductsPage(BasePage):
         Returns:
             bool: True if products page is displayed
         """
-        return (
-            self.verify_page_contains_text(self.PRODUCTS_TITLE_TEXT) and
-            self.is_element_visible(self.PRODUCTS_CONTAINER)
-        )
+        return self.expect_all([
+            self.has_text(self.PRODUCTS_TITLE_TEXT),
+            self.visible(self.PRODUCTS_CONTAINER)
+        ])
     
     def verify_products_page_title(self) -> bool:
         """
@@ -77,15 +78,8 @@ class ProductsPage(BasePage):
             List[str]: List of product names
         """
         # This will be implemented with actual MCP Playwright calls
-        # For now, return sample data for framework structure
-        return [
-            "Sauce Labs Backpack",
-            "Sauce Labs Bike Light", 
-            "Sauce Labs Bolt T-Shirt",
-            "Sauce Labs Fleece Jacket",
-            "Sauce Labs Onesie",
-            "Test.allTheThings() T-Shirt (Red)"
-        ]
+        # For now, return the catalog for framework structure
+        return list(PRODUCTS.names())
     
     def click_sort_dropdown(self) -> bool:
         """
@@ -172,9 +166,11 @@ class ProductsPage(BasePage):
         Returns:
             bool: True if product added successfully
         """
-        # Convert product name to data-test attribute format
-        test_id = product_name.lower().replace(" ", "-").replace(".", "").replace("(", "").replace(")", "")
-        add_button_selector = f'[data-test="add-to-cart-{test_id}"]'
+        product = PRODUCTS.get_by_name(product_name)
+        if product is None:
+            print(f"Unknown product: {product_name}")
+            return False
+        add_button_selector = f'[data-test="{product.add_to_cart_id}"]'
         
         return self.click_element(
             add_button_selector,
@@ -188,7 +184,7 @@ class ProductsPage(BasePage):
         Returns:
             bool: True if product added successfully
         """
-        return self.add_product_to_cart_by_name("Sauce Labs Backpack")
+        return self.add_product_to_cart_by_name(PRODUCTS["sauce_labs_backpack"].name)
     
     def click_shopping_cart(self) -> bool:
         """
@@ -9,6 +9,8 @@ import argparse
 import subprocess
 from pathlib import Path
 
+from support.browser_server import BrowserServerPool
+
 
 def setup_environment():
     """Setup the test environment."""
@@ -146,6 +148,36 @@ def run_mcp_demo():
     return subprocess.run(cmd)
 
 
+def run_load_test(args):
+    """Run the page objects as virtual users against a local stand-in."""
+    from support.load_test import LoadTest, StandInServer, print_load_report, write_load_report
+    
+    stand_in = None
+    target = args.load_target
+    if not target:
+        stand_in = StandInServer()
+        stand_in.start()
+        target = stand_in.url
+        print(f"🧪 Local stand-in application at {target}")
+    
+    try:
+        report = LoadTest(
+            base_url=target,
+            users=args.users,
+            rate=args.rate,
+            ramp_up=args.ramp_up,
+            duration=args.duration
+        ).run()
+    finally:
+        if stand_in is not None:
+            stand_in.stop()
+    
+    print_load_report(report)
+    write_load_report(report)
+    print("📁 Load report written to reports/load_report.json")
+    return subprocess.CompletedProcess(args=["load"], returncode=1 if report["errors"] else 0)
+
+
 def show_test_structure():
     """Show the test structure."""
     print("📁 Test Framework Structure:")
@@ -188,6 +220,138 @@ def show_test_structure():
     print("  @smoke     - Critical functionality tests")
 
 
+def show_perf_report(threshold):
+    """Show duration regressions from the local test history."""
+    from support.test_history import RunHistory, TEST_HISTORY_DB, print_perf_report
+    
+    if not os.path.exists(TEST_HISTORY_DB):
+        print(f"ℹ️  No test history at {TEST_HISTORY_DB} yet; run some tests first.")
+        return
+    print(f"📈 Performance report from {TEST_HISTORY_DB}")
+    history = RunHistory(TEST_HISTORY_DB)
+    try:
+        print_perf_report(history, threshold)
+    finally:
+        history.close()
+
+
+def lane_selection(args):
+    """Pytest selection arguments matching the requested test option."""
+    if args.auth:
+        return ["-m", "auth"]
+    if args.inventory:
+        return ["-m", "inventory"]
+    if args.cart:
+        return ["-m", "cart"]
+    if args.all or args.parallel:
+        return []
+    if args.test:
+        return ["-k", args.test]
+    if args.mcp_demo:
+        return ["tests/test_mcp_demo.py"]
+    return ["-m", "smoke"]
+
+
+def start_quarantine_lane(args):
+    """
+    Start known-flaky tests in a separate, non-blocking pytest process.
+    
+    Returns:
+        subprocess.Popen: The quarantine lane, or None when no test is quarantined
+    """
+    from support.test_history import RunHistory, TEST_HISTORY_DB, FLAKY_THRESHOLD, current_run_id
+    
+    if not os.path.exists(TEST_HISTORY_DB):
+        return None
+    history = RunHistory(TEST_HISTORY_DB)
+    try:
+        flaky = history.flaky_tests(FLAKY_THRESHOLD)
+    finally:
+        history.close()
+    if not flaky:
+        return None
+    
+    print(f"🧪 Quarantine lane: {len(flaky)} flaky test(s) running separately (non-blocking)")
+    current_run_id()  # both lanes record under one run id
+    cmd = [
+        sys.executable, "-m", "pytest",
+        *lane_selection(args),
+        "--reruns", "2",
+        "--maxfail=1000",
+        "--html=reports/quarantine_test_report.html",
+        "--self-contained-html",
+        "--junitxml=reports/quarantine_junit.xml"
+    ]
+    return subprocess.Popen(
+        cmd,
+        env=dict(os.environ, QUARANTINE_LANE="quarantine"),
+        stdout=open("reports/quarantine_lane.log", "w"),
+        stderr=subprocess.STDOUT
+    )
+
+
+def run_fix_loop(args):
+    """
+    Rerun the failed tests whenever pages/ or step_definitions/ change.
+    
+    The browser server pool started by main() stays up between iterations,
+    as do the on-disk asset cache and the failure set, so each iteration only
+    pays for the tests that are still failing.
+    """
+    from support.failure_set import FailureSet, FAILED_SELECTION_ENV
+    from support.file_watch import wait_for_change
+    
+    os.environ[FAILED_SELECTION_ENV] = "only"
+    watched = ["pages", "step_definitions"]
+    result = None
+    try:
+        while True:
+            failed = len(FailureSet())
+            if failed:
+                print(f"🔁 Rerunning {failed} failed test(s)")
+            else:
+                print("🔁 No recorded failures; running the whole selection")
+            result = run_selected_tests(args)
+            remaining = len(FailureSet())
+            print(f"{'❌' if remaining else '✅'} {remaining} test(s) still failing")
+            print(f"👀 Watching {', '.join(watched)} for changes (Ctrl+C to stop)")
+            changed = wait_for_change(watched)
+            print(f"✏️  Changed: {', '.join(changed)}")
+    except KeyboardInterrupt:
+        print("\n🛑 Loop stopped")
+    return result
+
+
+def run_selected_tests(args):
+    """Run the test selection requested on the command line."""
+    result = None
+    
+    if args.load:
+        result = run_load_test(args)
+    elif args.smoke:
+        result = run_smoke_tests()
+    elif args.auth:
+        result = run_auth_tests()
+    elif args.inventory:
+        result = run_inventory_tests()
+    elif args.cart:
+        result = run_cart_tests()
+    elif args.all:
+        result = run_all_tests()
+    elif args.parallel:
+        result = run_parallel_tests()
+    elif args.test:
+        result = run_specific_test(args.test)
+    elif args.mcp_demo:
+        result = run_mcp_demo()
+    else:
+        print("ℹ️  No specific test option provided. Use --help for options.")
+        print("🚀 Running smoke tests by default...")
+        result = run_smoke_tests()
+    
+    return result
+
+
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(
@@ -202,6 +366,22 @@ Examples:
   python run_tests.py --test login_with_valid    # Run specific test
   python run_tests.py --mcp-demo                 # Run MCP demo
   python run_tests.py --structure                # Show framework structure
+  python run_tests.py --all --blocking-profile full  # Load every resource
+  python run_tests.py --parallel --browser-server --browser-pool 2  # Share 2 warm browsers
+  python run_tests.py --load --users 20 --rate 10 --duration 120    # Load test with virtual users
+  python run_tests.py --perf-report --regression-threshold 0.2       # Flag tests 20% slower than baseline
+  python run_tests.py --all --no-quarantine      # Keep known-flaky tests in the main lane
+  python run_tests.py --parallel --browser-server --isolation reset-context  # Reuse pooled contexts
+  python run_tests.py --mcp-benchmark            # Sequential vs pipelined MCP calls (offline)
+  python run_tests.py --dry-run                  # Check step bindings without a browser
+  python run_tests.py --all --shard 2/4          # Second of four duration-balanced CI shards
+  python run_tests.py --all --only-failed        # Rerun what failed last time
+  python run_tests.py --all --loop               # Rerun failures on every pages/ or step change
+  python run_tests.py --all --record             # Record MCP command streams per scenario
+  python run_tests.py --all --replay             # Regression-check pages/steps against recordings
+  python run_tests.py --parallel --memory        # Sample memory per test and flag leaks per worker
+  python run_tests.py --cart --profile           # Flamegraph of every cart test
+  python run_tests.py --all --profile checkout   # Profile only tests whose node id contains "checkout"
         """
     )
     
@@ -216,6 +396,56 @@ Examples:
     parser.add_argument("--structure", action="store_true", help="Show test framework structure")
     parser.add_argument("--headed", action="store_true", help="Run tests in headed mode (browser visible)")
     parser.add_argument("--headless", action="store_true", help="Run tests in headless mode (browser hidden)")
+    parser.add_argument("--browser-server", action="store_true",
+                        help="Start a shared pre-warmed browser that all workers connect to")
+    parser.add_argument("--browser-pool", type=int, default=1,
+                        help="Number of shared browser processes with --browser-server (default: 1)")
+    parser.add_argument("--load", action="store_true",
+                        help="Run a load test driving the page objects as virtual users")
+    parser.add_argument("--users", type=int, default=10, help="Maximum concurrent virtual users with --load")
+    parser.add_argument("--rate", type=float, default=5.0, help="Target journeys per second with --load")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="Seconds to ramp up to --rate")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to hold --rate")
+    parser.add_argument("--load-target", type=str,
+                        help="Application URL for --load (default: start a local stand-in)")
+    parser.add_argument("--blocking-profile", choices=["functional", "visual", "full"],
+                        help="Request-blocking profile for tests without a blocking/visual marker")
+    parser.add_argument("--perf-report", action="store_true",
+                        help="Report tests whose recent median duration regressed against their history")
+    parser.add_argument("--regression-threshold", type=float, default=0.25,
+                        help="Relative slowdown flagged by --perf-report (default: 0.25)")
+    parser.add_argument("--mcp-benchmark", action="store_true",
+                        help="Benchmark sequential vs pipelined MCP calls against the local stub server")
+    parser.add_argument("--mcp-shards", type=int,
+                        help="Number of MCP server processes sessions are spread across (MCP_MODE=real)")
+    parser.add_argument("--isolation", choices=["new-browser", "new-context", "reset-context", "shared-page"],
+                        help="Isolation tier for tests without an isolation marker (default: new-context)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Bind every feature step to its definition and check fixtures, without a browser")
+    parser.add_argument("--shard", type=str, metavar="I/N",
+                        help="Run only shard I of N duration-balanced shards of the selected tests")
+    failed_group = parser.add_mutually_exclusive_group()
+    failed_group.add_argument("--failed-first", action="store_true",
+                              help="Run tests that failed last time before the rest")
+    failed_group.add_argument("--only-failed", action="store_true",
+                              help="Run only tests that failed last time (all tests when none did)")
+    parser.add_argument("--loop", action="store_true",
+                        help="Keep a warm browser server and rerun failed tests whenever pages/ or "
+                             "step_definitions/ change")
+    parser.add_argument("--record", action="store_true",
+                        help="Record each scenario's MCP command stream to reports/mcp_recordings/")
+    parser.add_argument("--replay", nargs="?", const="zero", choices=["zero", "recorded"],
+                        help="Replay recorded MCP command streams without a browser, at zero (default) "
+                             "or recorded latency")
+    parser.add_argument("--memory", action="store_true",
+                        help="Sample browser RSS, JS heap and Python tracemalloc peak per test and flag leaks")
+    parser.add_argument("--profile", nargs="?", const="all", metavar="SUBSTRING",
+                        help="Sample the Python stack of each test (or of tests whose node id contains one of the "
+                             "comma-separated substrings) and write flamegraphs to reports/profiles/")
+    parser.add_argument("--data-dir", type=str, metavar="DIR",
+                        help="Feed the data-driven tests from products/users .csv, .jsonl or .sqlite files in DIR")
+    parser.add_argument("--no-quarantine", action="store_true",
+                        help="Run known-flaky tests in the main lane instead of the quarantine lane")
     
     args = parser.parse_args()
     
@@ -234,6 +464,60 @@ Examples:
         print("🖥️  Running in HEADED mode (default - browser visible)")
         os.environ["HEADLESS"] = "false"
     
+    if args.blocking_profile:
+        print(f"🚫 Request-blocking profile: {args.blocking_profile}")
+        os.environ["BLOCKING_PROFILE"] = args.blocking_profile
+    
+    if args.mcp_shards:
+        print(f"🧩 MCP server shards: {args.mcp_shards}")
+        os.environ["MCP_POOL_SHARDS"] = str(args.mcp_shards)
+    
+    if args.isolation:
+        print(f"🧱 Isolation tier: {args.isolation}")
+        os.environ["ISOLATION_TIER"] = args.isolation
+    
+    if args.shard:
+        from support.sharding import parse_shard, SHARD_ENV
+        try:
+            index, count = parse_shard(args.shard)
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            return
+        print(f"🧩 Test shard {index}/{count}")
+        os.environ[SHARD_ENV] = f"{index}/{count}"
+    
+    if args.failed_first or args.only_failed:
+        from support.failure_set import FAILED_SELECTION_ENV
+        print(f"🔁 {'Only' if args.only_failed else 'First'} running tests that failed last time")
+        os.environ[FAILED_SELECTION_ENV] = "only" if args.only_failed else "first"
+    
+    if args.record and args.replay:
+        print("❌ Error: Cannot specify both --record and --replay options")
+        return
+    if args.record:
+        print("📼 Recording MCP command streams to reports/mcp_recordings/")
+        os.environ["MCP_RECORDING"] = "record"
+    elif args.replay:
+        print(f"📼 Replaying recorded MCP command streams ({args.replay} latency, no browser)")
+        os.environ["MCP_RECORDING"] = "replay"
+        os.environ["MCP_REPLAY_LATENCY"] = args.replay
+        args.browser_server = False
+    
+    if args.memory:
+        from support.memory_tracking import MEMORY_TRACKING_ENV
+        print("🧠 Sampling memory per test (browser RSS, JS heap, Python peak)")
+        os.environ[MEMORY_TRACKING_ENV] = "true"
+    
+    if args.profile:
+        from support.profiling import PROFILE_ENV
+        print(f"🔥 Profiling {'every test' if args.profile == 'all' else 'tests matching ' + args.profile}")
+        os.environ[PROFILE_ENV] = args.profile
+    
+    if args.data_dir:
+        from support.data_loader import EXTERNAL_DATA_ENV
+        print(f"🗂️  Loading external test data from {args.data_dir}")
+        os.environ[EXTERNAL_DATA_ENV] = args.data_dir
+    
     # Print header
     print("🎯 Sauce Demo BDD Test Automation Framework")
     print("=" * 60)
@@ -246,32 +530,54 @@ Examples:
         show_test_structure()
         return
     
+    if args.perf_report:
+        show_perf_report(args.regression_threshold)
+        return
+    
+    if args.dry_run:
+        from support.dry_run import run_dry_run, print_dry_run_report
+        sys.exit(0 if print_dry_run_report(run_dry_run()) else 1)
+    
+    if args.mcp_benchmark:
+        from support.mcp_transport import run_transport_benchmark
+        print("📡 Benchmarking MCP transport against the stub server (5 ms per call)...")
+        result = run_transport_benchmark()
+        print(f"   sequential: {result['sequential_per_second']:.0f} calls/s")
+        print(f"   pipelined:  {result['pipelined_per_second']:.0f} calls/s ({result['speedup']:.1f}x)")
+        return
+    
     # Setup environment
     setup_environment()
     
-    # Execute based on arguments
-    result = None
+    if args.loop:
+        # One warm browser for every iteration; the quarantine lane would only slow the loop down
+        args.browser_server = not args.replay
+        args.no_quarantine = True
     
-    if args.smoke:
-        result = run_smoke_tests()
-    elif args.auth:
-        result = run_auth_tests()
-    elif args.inventory:
-        result = run_inventory_tests()
-    elif args.cart:
-        result = run_cart_tests()
-    elif args.all:
-        result = run_all_tests()
-    elif args.parallel:
-        result = run_parallel_tests()
-    elif args.test:
-        result = run_specific_test(args.test)
-    elif args.mcp_demo:
-        result = run_mcp_demo()
-    else:
-        print("ℹ️  No specific test option provided. Use --help for options.")
-        print("🚀 Running smoke tests by default...")
-        result = run_smoke_tests()
+    browser_pool = None
+    if args.browser_server:
+        print(f"🌐 Starting {args.browser_pool} shared browser server(s)...")
+        browser_pool = BrowserServerPool(size=args.browser_pool, headless=os.environ["HEADLESS"] == "true")
+        browser_pool.start()
+        print(f"✅ Browser endpoints: {', '.join(browser_pool.endpoints)}")
+    
+    quarantine_lane = None
+    if not args.no_quarantine and not args.load:
+        quarantine_lane = start_quarantine_lane(args)
+    # The main lane leaves flaky tests out only while a quarantine lane runs them
+    os.environ["QUARANTINE_LANE"] = "main" if quarantine_lane is not None else "off"
+    
+    try:
+        result = run_fix_loop(args) if args.loop else run_selected_tests(args)
+        if quarantine_lane is not None:
+            quarantine_code = quarantine_lane.wait()
+            status = "passed" if quarantine_code == 0 else f"failed (exit code {quarantine_code}, not blocking)"
+            print(f"🧪 Quarantine lane {status}; see reports/quarantine_lane.log")
+    finally:
+        if quarantine_lane is not None and quarantine_lane.poll() is None:
+            quarantine_lane.terminate()
+        if browser_pool is not None:
+            browser_pool.stop()
     
     # Print results
     if result:
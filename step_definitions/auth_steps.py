@@ -2,10 +2,13 @@
 Authentication-specific step definitions for BDD tests.
 Contains steps related to login, logout, and authentication scenarios.
 """
+import time
 import pytest
 from pytest_bdd import given, when, then, parsers
 from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
+from support.user_matrix import expand_user_examples, run_user_matrix
+from TestData.test_data import TEST_USERS
 
 
 @given('user is logged in with valid credentials')
@@ -17,13 +20,14 @@ def user_logged_in_with_valid_credentials(browser_context):
     assert login_page.navigate_to_login_page(), "Failed to navigate to login page"
     
     # Login with standard user
-    assert login_page.login("standard_user", "secret_sauce"), "Failed to login"
+    user = TEST_USERS["standard_user"]
+    assert login_page.login(user.username, user.password), "Failed to login"
     
     # Verify login success
     assert login_page.verify_login_successful(), "Login was not successful"
     
     browser_context["logged_in"] = True
-    browser_context["current_user"] = "standard_user"
+    browser_context["current_user"] = user.username
 
 
 @given('user is on login page')
@@ -150,12 +154,12 @@ def user_logged_in_as_specific_user(browser_context, username):
     # Navigate to login page
     assert login_page.navigate_to_login_page(), "Failed to navigate to login page"
     
-    # Login with specified user
-    password = "secret_sauce"  # Assuming same password for all test users
-    assert login_page.login(username, password), f"Failed to login as {username}"
+    # Login with specified user; every Sauce Demo account shares the standard password
+    user = TEST_USERS.get(username, TEST_USERS["standard_user"])
+    assert login_page.login(username, user.password), f"Failed to login as {username}"
     
     # Verify login success
-    if username != "locked_out_user":  # locked_out_user should not be able to login
+    if user.expected_result != "locked":  # Locked out users should not be able to login
         assert login_page.verify_login_successful(), f"Login was not successful for {username}"
         browser_context["logged_in"] = True
     else:
@@ -188,3 +192,26 @@ def user_attempts_direct_access_to_products(browser_context):
     # This would need actual navigation to products URL
     # For now, just verify we're not logged in
     assert not browser_context.get("logged_in", False), "User should not be logged in"
+
+
+@when('all test users log in concurrently')
+def all_test_users_log_in_concurrently(browser_context, browser_config):
+    """Run the TEST_USERS login matrix, one isolated context per user, concurrently."""
+    started = time.time()
+    results = run_user_matrix(expand_user_examples(), browser_config)
+    browser_context["user_matrix_results"] = results
+    
+    print(f"\n👥 User matrix: {len(results)} users in {time.time() - started:.2f}s "
+          f"(slowest {max(result['duration'] for result in results):.2f}s)")
+    for result in results:
+        status = "✅" if result["passed"] else "❌"
+        print(f"  {status} {result['user_key']:<25} {result['expected_result']:<8} {result['duration']:.2f}s")
+
+
+@then('every user should get the expected login result')
+def verify_every_user_login_result(browser_context):
+    """Verify each user in the matrix got its expected login outcome."""
+    results = browser_context.get("user_matrix_results", [])
+    assert results, "User matrix was not executed"
+    failures = [f"{result['user_key']}: {result['error']}" for result in results if not result["passed"]]
+    assert not failures, "Unexpected login outcomes:\n" + "\n".join(failures)
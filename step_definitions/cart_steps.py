@@ -6,22 +6,39 @@ import pytest
 from pytest_bdd import given, when, then, parsers
 from pages.cart_page import CartPage
 from pages.products_page import ProductsPage
+from TestData.test_data import PRODUCTS
 
 
 @given('user has items in cart')
 def user_has_items_in_cart(browser_context):
     """Pre-condition: User has items in cart."""
-    products_page = ProductsPage()
-    # Add a default item to cart
-    assert products_page.add_first_product_to_cart(), "Failed to add item to cart"
+    cart_page = CartPage()
+    # Seed a default item directly instead of clicking through the inventory
+    items = [PRODUCTS["sauce_labs_backpack"].name]
+    assert cart_page.seed_cart(items), "Failed to seed cart"
     browser_context["items_in_cart"] = True
+    browser_context["cart_items"] = items
+
+
+@given(parsers.parse('user has "{product_names}" in cart'))
+def user_has_products_in_cart(browser_context, product_names):
+    """Pre-condition: User has the given comma-separated products in cart."""
+    cart_page = CartPage()
+    items = [name.strip() for name in product_names.split(",") if name.strip()]
+    assert cart_page.seed_cart(items), "Failed to seed cart"
+    browser_context["items_in_cart"] = bool(items)
+    browser_context["cart_items"] = items
+    if items:
+        browser_context["last_added_item"] = items[-1]
 
 
 @given('user has empty cart')
 def user_has_empty_cart(browser_context):
     """Pre-condition: User has empty cart."""
-    # Ensure cart is empty - this would need actual implementation
+    cart_page = CartPage()
+    assert cart_page.seed_cart([]), "Failed to empty cart"
     browser_context["items_in_cart"] = False
+    browser_context["cart_items"] = []
 
 
 @when('user navigates to cart page')
@@ -159,15 +176,6 @@ def verify_cart_total_calculation(browser_context):
         assert total > 0, f"Cart has items but total is {total}"
 
 
-@given(parsers.parse('user has "{item_name}" in cart'))
-def user_has_specific_item_in_cart(browser_context, item_name):
-    """Pre-condition: User has specific item in cart."""
-    products_page = ProductsPage()
-    assert products_page.add_product_to_cart_by_name(item_name), f"Failed to add {item_name} to cart"
-    browser_context["items_in_cart"] = True
-    browser_context["last_added_item"] = item_name
-
-
 @when(parsers.parse('user removes "{item_name}" from cart'))
 def user_removes_specific_item_from_cart(browser_context, item_name):
     """User removes specific item from cart."""
@@ -0,0 +1,21 @@
+"""
+Support package for framework infrastructure.
+Contains capture, caching and runtime helpers shared by fixtures and page objects.
+
+Modules that import page objects (such as user_matrix) are not re-exported
+here, because mcp_integration itself imports from this package.
+"""
+
+from .failure_capture import FailureCapture
+from .asset_cache import AssetCache
+from .request_blocking import RequestBlocker
+from .browser_server import BrowserServerPool
+from .test_history import RunHistory
+
+__all__ = [
+    'FailureCapture',
+    'AssetCache',
+    'RequestBlocker',
+    'BrowserServerPool',
+    'RunHistory'
+]
@@ -0,0 +1,221 @@
+"""
+Incremental accessibility snapshots.
+Playwright MCP answers actions with a full ARIA snapshot of the page. The
+client keeps the last snapshot per page, diffs each new one against it and
+re-parses only the changed lines, so page queries run against a local tree.
+"""
+import difflib
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+MAX_TRACKED_PAGES = 16
+
+SNAPSHOT_BLOCK_PATTERN = re.compile(r"Page Snapshot:?\s*\n```(?:yaml)?\n(.*?)\n```", re.DOTALL)
+PAGE_URL_PATTERN = re.compile(r"^- Page URL: (\S+)", re.MULTILINE)
+LINE_PATTERN = re.compile(
+    r'^(?P<indent>\s*)- (?P<role>[^\s":\[]+)'
+    r'(?: "(?P<name>(?:[^"\\]|\\.)*)")?'
+    r'(?P<attributes>(?: \[[^\]]*\])*)'
+    r'(?::\s*(?P<text>.*))?$'
+)
+REF_PATTERN = re.compile(r"\[ref=([^\]]+)\]")
+
+
+class SnapshotNode(NamedTuple):
+    """One line of an ARIA snapshot."""
+    depth: int
+    role: Optional[str]
+    name: str
+    ref: Optional[str]
+    text: str
+
+
+def parse_line(line: str) -> SnapshotNode:
+    """
+    Parse one ARIA snapshot line such as '  - button "Add to cart" [ref=e12]'.
+
+    Args:
+        line: Snapshot line
+
+    Returns:
+        SnapshotNode: Parsed node; unrecognised lines keep their text with no role
+    """
+    match = LINE_PATTERN.match(line)
+    if match is None:
+        return SnapshotNode(len(line) - len(line.lstrip()), None, "", None, line.strip())
+    ref = REF_PATTERN.search(match.group("attributes") or "")
+    return SnapshotNode(
+        depth=len(match.group("indent")) // 2,
+        role=match.group("role"),
+        name=(match.group("name") or "").replace('\\"', '"'),
+        ref=ref.group(1) if ref else None,
+        text=(match.group("text") or "").strip().strip('"')
+    )
+
+
+def extract_snapshot(text: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find the page URL and ARIA snapshot in a Playwright MCP tool response.
+
+    Args:
+        text: Tool result text
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: (page URL, snapshot YAML), None where absent
+    """
+    snapshot = SNAPSHOT_BLOCK_PATTERN.search(text)
+    url = PAGE_URL_PATTERN.search(text)
+    return (url.group(1) if url else None), (snapshot.group(1) if snapshot else None)
+
+
+class SnapshotTree:
+    """Local copy of one page's accessibility tree, updated by line deltas."""
+
+    def __init__(self):
+        """Initialize an empty tree."""
+        self.lines: List[str] = []
+        self.nodes: List[SnapshotNode] = []
+        self.version = -1
+
+    def apply(self, snapshot: str, version: int) -> Dict[str, Any]:
+        """
+        Bring the tree up to date with a new snapshot, parsing only changed lines.
+
+        Args:
+            snapshot: Full snapshot YAML
+            version: Client page version the snapshot belongs to
+
+        Returns:
+            Dict[str, Any]: bytes received, delta_bytes (changed lines only),
+            changed_lines and parse_ms
+        """
+        started = time.perf_counter()
+        new_lines = snapshot.splitlines()
+        nodes: List[SnapshotNode] = []
+        delta_bytes = 0
+        changed = 0
+        matcher = difflib.SequenceMatcher(None, self.lines, new_lines, autojunk=False)
+        for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+            if tag == "equal":
+                nodes.extend(self.nodes[old_start:old_end])
+                continue
+            changed += max(old_end - old_start, new_end - new_start)
+            for line in new_lines[new_start:new_end]:
+                delta_bytes += len(line.encode("utf-8")) + 1
+                nodes.append(parse_line(line))
+        self.lines = new_lines
+        self.nodes = nodes
+        self.version = version
+        return {
+            "bytes": len(snapshot.encode("utf-8")),
+            "delta_bytes": delta_bytes,
+            "changed_lines": changed,
+            "parse_ms": (time.perf_counter() - started) * 1000
+        }
+
+    def contains_text(self, text: str) -> bool:
+        """
+        Check whether any node's name or text contains a substring.
+
+        Args:
+            text: Text to look for
+
+        Returns:
+            bool: True if found in the tree
+        """
+        return any(text in node.name or text in node.text for node in self.nodes)
+
+    def find(self, role: Optional[str] = None, name: Optional[str] = None) -> List[SnapshotNode]:
+        """
+        Find nodes by role and/or exact accessible name.
+
+        Args:
+            role: ARIA role such as button or heading
+            name: Accessible name
+
+        Returns:
+            List[SnapshotNode]: Matching nodes in document order
+        """
+        return [
+            node for node in self.nodes
+            if (role is None or node.role == role) and (name is None or node.name == name)
+        ]
+
+
+class SnapshotCache:
+    """Last snapshot tree per page URL, with per-step transfer and parse statistics."""
+
+    def __init__(self, max_pages: int = MAX_TRACKED_PAGES):
+        """
+        Initialize snapshot cache.
+
+        Args:
+            max_pages: Page trees kept before the least recently updated is dropped
+        """
+        self.max_pages = max_pages
+        self.trees: "OrderedDict[str, SnapshotTree]" = OrderedDict()
+        self.current: Optional[SnapshotTree] = None
+        self._step_stats: List[Dict[str, Any]] = []
+
+    def update(self, response_text: str, version: int) -> Optional[Dict[str, Any]]:
+        """
+        Apply the snapshot carried by a tool response, if any.
+
+        Args:
+            response_text: Tool result text
+            version: Client page version the response belongs to
+
+        Returns:
+            Dict[str, Any]: Delta statistics, or None when the response has no snapshot
+        """
+        url, snapshot = extract_snapshot(response_text)
+        if snapshot is None:
+            return None
+        key = url or "about:blank"
+        tree = self.trees.pop(key, None) or SnapshotTree()
+        self.trees[key] = tree
+        while len(self.trees) > self.max_pages:
+            self.trees.popitem(last=False)
+        stats = tree.apply(snapshot, version)
+        self.current = tree
+        self._step_stats.append(stats)
+        return stats
+
+    def tree_for(self, version: int) -> Optional[SnapshotTree]:
+        """
+        Get the current page's tree if it reflects the given page version.
+
+        Args:
+            version: Client page version
+
+        Returns:
+            SnapshotTree: Up-to-date tree, or None
+        """
+        if self.current is not None and self.current.version == version:
+            return self.current
+        return None
+
+    def pop_step_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Summarise and reset the statistics gathered since the last call.
+
+        Returns:
+            Dict[str, Any]: snapshots, bytes, delta_bytes and parse_ms totals, or None if no snapshot arrived
+        """
+        stats, self._step_stats = self._step_stats, []
+        if not stats:
+            return None
+        return {
+            "snapshots": len(stats),
+            "bytes": sum(entry["bytes"] for entry in stats),
+            "delta_bytes": sum(entry["delta_bytes"] for entry in stats),
+            "parse_ms": sum(entry["parse_ms"] for entry in stats)
+        }
+
+    def clear(self):
+        """Forget every tree, e.g. when the browser context changes."""
+        self.trees.clear()
+        self.current = None
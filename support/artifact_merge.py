@@ -0,0 +1,334 @@
+"""
+Per-worker log and result shards, merged after an xdist run.
+Every worker writes its own log file and a JSON-lines file with one record
+per finished test, so no two processes share an output. The controller then
+streams all shards through heapq.merge, ordered by timestamp, into the
+final JUnit XML, HTML report and log. Only one record per shard is held in
+memory at a time.
+"""
+import heapq
+import html
+import json
+import os
+import re
+import shutil
+import socket
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+
+WORKER_ARTIFACTS_ENV = "WORKER_ARTIFACTS_DIR"
+WORKER_ARTIFACTS_DIR = os.getenv(WORKER_ARTIFACTS_ENV, "reports/workers")
+# Shard logs are written in this format whatever the ini says, so every record starts with a timestamp
+SHARD_LOG_FORMAT = "%(asctime)s [%(levelname)8s] %(filename)s:%(lineno)d %(funcName)s(): %(message)s"
+SHARD_LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+LOG_TIMESTAMP_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")  # SHARD_LOG_DATE_FORMAT
+JUNIT_OUTCOMES = ("passed", "failed", "error", "skipped")  # Reruns are left out of JUnit
+
+# Markers naming the Module column of the HTML report, checked in order
+REPORT_MODULES = (("auth", "Authentication"), ("inventory", "Inventory"), ("cart", "Cart"))
+
+
+def report_columns(properties: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Module, Tags and Isolation columns of the HTML report for one test.
+
+    Args:
+        properties: The test report's user_properties as a dict
+
+    Returns:
+        Dict[str, str]: module, tags and isolation cell texts
+    """
+    markers = properties.get("markers") or []
+    return {
+        "module": next((module for marker, module in REPORT_MODULES if marker in markers), "Unknown"),
+        "tags": ", ".join(markers),
+        "isolation": str(properties.get("isolation_tier", ""))
+    }
+
+
+class ResultShardWriter:
+    """Appends one JSON line per finished test of this worker."""
+
+    def __init__(self, path: str, worker: str):
+        """
+        Initialize result shard.
+
+        Args:
+            path: JSON-lines file, truncated on open
+            worker: xdist worker id written into every record
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.worker = worker
+        self._file = open(path, "w", encoding="utf-8")
+        self._phases: Dict[str, Dict[str, Any]] = {}  # nodeid -> record being assembled
+
+    def add_report(self, report):
+        """
+        Fold a setup, call or teardown report into its test's record.
+
+        The record is written once teardown (or a rerun) completes the test.
+
+        Args:
+            report: pytest TestReport
+        """
+        record = self._phases.setdefault(report.nodeid, {
+            "nodeid": report.nodeid,
+            "worker": self.worker,
+            "start": time.time() - report.duration,
+            "duration": 0.0,
+            "outcome": "passed",
+            "message": None,
+            "details": None,
+            "columns": None,
+            "artifacts": []
+        })
+        record["duration"] += report.duration
+        # Later phases carry every property set so far, including the failure-capture artifacts
+        properties = dict(getattr(report, "user_properties", []))
+        record["columns"] = report_columns(properties)
+        record["artifacts"] = properties.get("failure_artifacts", record["artifacts"])
+        if report.outcome == "rerun":
+            record["outcome"] = "rerun"
+        elif report.failed:
+            record["outcome"] = "failed" if report.when == "call" else "error"
+        elif report.skipped and record["outcome"] == "passed":
+            record["outcome"] = "skipped"
+        if report.failed or report.skipped:
+            record["details"] = report.longreprtext
+            if isinstance(report.longrepr, tuple):
+                record["message"] = report.longrepr[2]  # Skip reason
+            else:
+                lines = record["details"].strip().splitlines()
+                record["message"] = lines[-1] if lines else None
+        if report.when == "teardown" or report.outcome == "rerun":
+            self._file.write(json.dumps(self._phases.pop(report.nodeid)) + "\n")
+            self._file.flush()
+
+    def close(self):
+        """Close the shard file."""
+        self._file.close()
+
+
+def prepare_shard_directory(directory: str = WORKER_ARTIFACTS_DIR) -> str:
+    """Empty the shard directory so only this run's shards are merged."""
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def iter_results(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream the records of one result shard."""
+    with open(path, encoding="utf-8") as shard:
+        for line in shard:
+            if line.strip():
+                yield json.loads(line)
+
+
+def merged_results(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Records of every result shard in start order."""
+    return heapq.merge(*(iter_results(path) for path in paths), key=lambda record: record["start"])
+
+
+def summarize(paths: Iterable[str]) -> Dict[str, Any]:
+    """
+    Count outcomes over result shards in one streaming pass.
+
+    Args:
+        paths: Result shard files
+
+    Returns:
+        Dict[str, Any]: Outcome counts plus tests, time and start
+    """
+    summary = {outcome: 0 for outcome in JUNIT_OUTCOMES + ("rerun",)}
+    summary.update(tests=0, time=0.0, start=None)
+    for path in paths:
+        for record in iter_results(path):
+            summary[record["outcome"]] += 1
+            summary["time"] += record["duration"]
+            if record["outcome"] in JUNIT_OUTCOMES:
+                summary["tests"] += 1
+            if summary["start"] is None or record["start"] < summary["start"]:
+                summary["start"] = record["start"]
+    return summary
+
+
+def junit_names(nodeid: str) -> Tuple[str, str]:
+    """Split a node id into JUnit classname and name the way pytest's junitxml does."""
+    parts = nodeid.split("::")
+    path = parts[0]
+    if path.endswith(".py"):
+        path = path[:-3]
+    classname = ".".join([path.replace("/", ".").replace("\\", ".")] + parts[1:-1])
+    return classname, parts[-1]
+
+
+def write_junit(paths: List[str], output: str, suite_name: str = "pytest") -> str:
+    """
+    Write a JUnit XML report from result shards.
+
+    Args:
+        paths: Result shard files
+        output: JUnit XML file
+        suite_name: testsuite name attribute
+
+    Returns:
+        str: The written file
+    """
+    summary = summarize(paths)
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    started = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(summary["start"] or time.time()))
+    with open(output, "w", encoding="utf-8") as xml:
+        xml.write('<?xml version="1.0" encoding="utf-8"?>\n<testsuites>')
+        xml.write(
+            f'<testsuite name={quoteattr(suite_name)} errors="{summary["error"]}" failures="{summary["failed"]}" '
+            f'skipped="{summary["skipped"]}" tests="{summary["tests"]}" time="{summary["time"]:.3f}" '
+            f'timestamp="{started}" hostname={quoteattr(socket.gethostname())}>\n'
+        )
+        for record in merged_results(paths):
+            if record["outcome"] not in JUNIT_OUTCOMES:
+                continue
+            classname, name = junit_names(record["nodeid"])
+            xml.write(f'<testcase classname={quoteattr(classname)} name={quoteattr(name)} time="{record["duration"]:.3f}">')
+            tag = {"failed": "failure", "error": "error", "skipped": "skipped"}.get(record["outcome"])
+            if tag:
+                xml.write(f'<{tag} message={quoteattr(record["message"] or "")}>{escape(record["details"] or "")}</{tag}>')
+            xml.write("</testcase>\n")
+        xml.write("</testsuite></testsuites>\n")
+    return output
+
+
+HTML_HEAD = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title><style>
+body {{ font-family: sans-serif; margin: 20px; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border: 1px solid #ddd; padding: 4px 8px; text-align: left; vertical-align: top; }}
+.passed {{ color: #2e7d32; }} .failed, .error {{ color: #c62828; }} .skipped, .rerun {{ color: #f9a825; }}
+pre {{ white-space: pre-wrap; margin: 0; font-size: 12px; }}
+</style></head><body>
+<h1>{title}</h1>
+<p>{summary}</p>
+<table><tr><th>Result</th><th>Test</th><th>Module</th><th>Tags</th><th>Isolation</th><th>Worker</th><th>Started</th>
+<th>Duration</th><th>Details</th></tr>
+"""
+
+
+def write_html(paths: List[str], output: str, title: str = "Test Report") -> str:
+    """
+    Write a self-contained HTML report from result shards.
+
+    Carries the Module, Tags and Isolation columns the pytest-html hooks in
+    conftest.py add, and links the failure-capture artifacts of failed tests.
+
+    Args:
+        paths: Result shard files
+        output: HTML file
+        title: Report title
+
+    Returns:
+        str: The written file
+    """
+    summary = summarize(paths)
+    counts = ", ".join(f"{summary[outcome]} {outcome}" for outcome in JUNIT_OUTCOMES + ("rerun",) if summary[outcome])
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as page:
+        page.write(HTML_HEAD.format(
+            title=html.escape(title),
+            summary=html.escape(f"{summary['tests']} test(s) in {summary['time']:.2f}s of test time: {counts or 'none'}")
+        ))
+        for record in merged_results(paths):
+            details = f"<pre>{html.escape(record['details'])}</pre>" if record["details"] else ""
+            details += "".join(
+                f'<a href="{html.escape(os.path.relpath(artifact, Path(output).parent))}">'
+                f'{html.escape(Path(artifact).name)}</a> '
+                for artifact in record.get("artifacts") or []
+            )
+            columns = record.get("columns") or report_columns({})
+            page.write(
+                f'<tr><td class="{record["outcome"]}">{record["outcome"].capitalize()}</td>'
+                f'<td>{html.escape(record["nodeid"])}</td><td>{html.escape(columns["module"])}</td>'
+                f'<td>{html.escape(columns["tags"])}</td><td>{html.escape(columns["isolation"])}</td>'
+                f'<td>{html.escape(record["worker"])}</td>'
+                f'<td>{time.strftime("%H:%M:%S", time.localtime(record["start"]))}</td>'
+                f'<td>{record["duration"]:.2f}s</td><td>{details}</td></tr>\n'
+            )
+        page.write("</table></body></html>\n")
+    return output
+
+
+def iter_log_records(path: str, worker: str) -> Iterator[Tuple[str, str]]:
+    """
+    Stream a log file as (timestamp, text) records.
+
+    Lines without a leading timestamp, such as tracebacks, stay with the
+    record they continue. Each record is prefixed with the worker id.
+
+    Args:
+        path: Log file
+        worker: Worker id used as prefix
+
+    Returns:
+        Iterator: (timestamp, record text) pairs
+    """
+    timestamp, lines = "", []
+    with open(path, encoding="utf-8", errors="replace") as log:
+        for line in log:
+            match = LOG_TIMESTAMP_PATTERN.match(line)
+            if match and lines:
+                yield timestamp, "".join(lines)
+                lines = []
+            if match:
+                timestamp = match.group(0)
+                line = f"{line[:match.end()]} [{worker}]{line[match.end():]}"
+            lines.append(line)
+    if lines:
+        yield timestamp, "".join(lines)
+
+
+def merge_logs(paths: List[str], output: str) -> str:
+    """
+    Merge log files by timestamp; records with the same second keep shard order.
+
+    Args:
+        paths: Log files named <worker>.log
+        output: Merged log file
+
+    Returns:
+        str: The written file
+    """
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    streams = [iter_log_records(path, Path(path).stem) for path in paths]
+    with open(output, "w", encoding="utf-8") as merged:
+        for _timestamp, text in heapq.merge(*streams, key=lambda record: record[0]):
+            merged.write(text)
+    return output
+
+
+def merge_worker_artifacts(directory: str, junit: Optional[str] = None, html_report: Optional[str] = None,
+                           log: Optional[str] = None, title: str = "Test Report") -> List[str]:
+    """
+    Merge every shard of a directory into the requested reports.
+
+    Args:
+        directory: Shard directory with <worker>.jsonl and <worker>.log files
+        junit: JUnit XML output, or None
+        html_report: HTML output, or None
+        log: Merged log output, or None
+        title: HTML report title
+
+    Returns:
+        List[str]: Written files
+    """
+    results = sorted(str(path) for path in Path(directory).glob("*.jsonl"))
+    logs = sorted(str(path) for path in Path(directory).glob("*.log"))
+    written = []
+    if junit:
+        written.append(write_junit(results, junit))
+    if html_report:
+        written.append(write_html(results, html_report, title))
+    if log and logs:
+        written.append(merge_logs(logs, log))
+    return written
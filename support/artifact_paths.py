@@ -0,0 +1,20 @@
+"""
+File names for per-test artifacts.
+Failure captures, profiles and MCP recordings are all stored under a name
+derived from the pytest node id.
+"""
+import re
+
+
+def safe_test_name(test_name: str) -> str:
+    """
+    Turn a test node id into a file or directory name.
+
+    Args:
+        test_name: Test node id such as tests/test_cart.py::test_view[chromium]
+
+    Returns:
+        str: Runs of characters other than letters, digits, '_', '.' and '-'
+        replaced by '_', or "test" when nothing is left
+    """
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", test_name).strip("_") or "test"
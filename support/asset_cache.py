@@ -0,0 +1,260 @@
+"""
+Disk-backed static asset cache shared across browser contexts and workers.
+Serves repeat image, font, script and stylesheet requests from a local
+content-addressed store instead of the network.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# Cache configuration
+ASSET_CACHE_DIR = os.getenv("ASSET_CACHE_DIR", ".cache/assets")
+ASSET_CACHE_MAX_BYTES = int(os.getenv("ASSET_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+ASSET_CACHE_TTL = int(os.getenv("ASSET_CACHE_TTL", str(24 * 60 * 60)))  # seconds before revalidation
+STATIC_RESOURCE_TYPES = {"image", "font", "stylesheet", "script", "media"}
+
+# Stored bytes: each content blob counts once, however many URLs share it
+BLOB_BYTES_QUERY = "SELECT COALESCE(SUM(size), 0) FROM (SELECT MAX(size) AS size FROM entries GROUP BY digest)"
+
+# Headers that must not be replayed from the cache
+HOP_BY_HOP_HEADERS = {"connection", "keep-alive", "transfer-encoding", "content-encoding", "content-length"}
+
+
+class AssetCache:
+    """
+    Content-addressed asset store with a shared SQLite index.
+
+    Blobs are stored once per content hash under ``blobs/``, so identical
+    files served from several URLs share storage. The index maps URL to
+    blob, response headers and validators (ETag / Last-Modified). Every
+    xdist worker opens the same directory; SQLite WAL mode and atomic blob
+    renames keep concurrent writers safe.
+    """
+
+    def __init__(self, cache_dir: str = ASSET_CACHE_DIR, max_bytes: int = ASSET_CACHE_MAX_BYTES,
+                 ttl: int = ASSET_CACHE_TTL):
+        """
+        Initialize asset cache.
+
+        Args:
+            cache_dir: Directory holding blobs and the index database
+            max_bytes: Total blob size kept before LRU eviction starts
+            ttl: Seconds an entry is served without revalidation
+        """
+        self.cache_dir = Path(cache_dir)
+        self.blob_dir = self.cache_dir / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.cache_dir / "index.sqlite"), timeout=30,
+                                   check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " url TEXT PRIMARY KEY, digest TEXT NOT NULL, size INTEGER NOT NULL,"
+            " status INTEGER NOT NULL, headers TEXT NOT NULL, etag TEXT, last_modified TEXT,"
+            " stored_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_entries_access ON entries(last_access)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_entries_digest ON entries(digest)")
+        self.stats = {
+            "hits": 0,
+            "revalidated": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "bytes_served": 0
+        }
+
+    def _blob_path(self, digest: str) -> Path:
+        """Get the blob path for a content digest."""
+        return self.blob_dir / digest[:2] / digest
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached entry by URL.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            dict: Entry with body, headers and validators, or None if not cached
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT digest, status, headers, etag, last_modified, stored_at FROM entries WHERE url = ?",
+                (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        digest, status, headers, etag, last_modified, stored_at = row
+        try:
+            body = self._blob_path(digest).read_bytes()
+        except FileNotFoundError:
+            # Blob evicted by another worker between index read and file read
+            return None
+        return {
+            "url": url,
+            "body": body,
+            "status": status,
+            "headers": json.loads(headers),
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh": time.time() - stored_at < self.ttl
+        }
+
+    def size_of(self, url: str) -> int:
+        """
+        Get the cached body size for a URL without reading the blob.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            int: Body size in bytes, or 0 if not cached
+        """
+        with self._lock:
+            row = self._db.execute("SELECT size FROM entries WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else 0
+
+    def touch(self, url: str, revalidated: bool = False):
+        """
+        Mark an entry as recently used.
+
+        Args:
+            url: Request URL
+            revalidated: Also restart the entry's freshness lifetime
+        """
+        now = time.time()
+        with self._lock:
+            if revalidated:
+                self._db.execute("UPDATE entries SET last_access = ?, stored_at = ? WHERE url = ?", (now, now, url))
+            else:
+                self._db.execute("UPDATE entries SET last_access = ? WHERE url = ?", (now, url))
+
+    def store(self, url: str, body: bytes, headers: Dict[str, str], status: int = 200):
+        """
+        Store a response body and its validators.
+
+        Args:
+            url: Request URL
+            body: Response body
+            headers: Response headers
+            status: Response status code
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(digest)
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = blob_path.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+            temp_path.write_bytes(body)
+            os.replace(temp_path, blob_path)
+
+        lowered = {key.lower(): value for key, value in headers.items()}
+        kept_headers = {key: value for key, value in lowered.items() if key not in HOP_BY_HOP_HEADERS}
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, digest, len(body), status, json.dumps(kept_headers),
+                 lowered.get("etag"), lowered.get("last-modified"), now, now)
+            )
+        self.stats["stores"] += 1
+        self.evict()
+
+    def evict(self):
+        """Evict least recently used entries until the blobs they leave behind fit under the limit."""
+        with self._lock:
+            total = self._db.execute(BLOB_BYTES_QUERY).fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            target = int(self.max_bytes * 0.9)  # Leave headroom so eviction does not run on every store
+            rows = self._db.execute("SELECT url, digest, size FROM entries ORDER BY last_access").fetchall()
+            for url, digest, size in rows:
+                if total <= target:
+                    break
+                self._db.execute("DELETE FROM entries WHERE url = ?", (url,))
+                shared = self._db.execute("SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)).fetchone()
+                if shared is None:
+                    try:
+                        self._blob_path(digest).unlink()
+                    except FileNotFoundError:
+                        pass
+                    total -= size  # Bytes are only freed with the last URL using the blob
+                self.stats["evictions"] += 1
+
+    def hit_rate(self) -> float:
+        """
+        Get the fraction of static requests served from the cache.
+
+        Returns:
+            float: Hit rate between 0 and 1
+        """
+        served = self.stats["hits"] + self.stats["revalidated"]
+        total = served + self.stats["misses"]
+        return served / total if total else 0.0
+
+    def size_bytes(self) -> int:
+        """
+        Get the total size of cached blobs.
+
+        Returns:
+            int: Total size in bytes, counting a blob shared by several URLs once
+        """
+        with self._lock:
+            return self._db.execute(BLOB_BYTES_QUERY).fetchone()[0]
+
+    async def handle_route(self, route):
+        """
+        Playwright route handler serving static assets from the cache.
+
+        Non-static or non-GET requests fall through to the next handler.
+
+        Args:
+            route: Playwright Route object
+        """
+        request = route.request
+        if request.method != "GET" or request.resource_type not in STATIC_RESOURCE_TYPES:
+            await route.fallback()
+            return
+
+        entry = self.lookup(request.url)
+        if entry is not None and entry["fresh"]:
+            self.stats["hits"] += 1
+            self.stats["bytes_served"] += len(entry["body"])
+            self.touch(request.url)
+            await route.fulfill(status=entry["status"], headers=entry["headers"], body=entry["body"])
+            return
+
+        # Stale or missing: revalidate with stored validators where possible
+        headers = dict(request.headers)
+        if entry is not None:
+            if entry["etag"]:
+                headers["if-none-match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["if-modified-since"] = entry["last_modified"]
+        response = await route.fetch(headers=headers)
+
+        if response.status == 304 and entry is not None:
+            self.stats["revalidated"] += 1
+            self.stats["bytes_served"] += len(entry["body"])
+            self.touch(request.url, revalidated=True)
+            await route.fulfill(status=entry["status"], headers=entry["headers"], body=entry["body"])
+            return
+
+        self.stats["misses"] += 1
+        body = await response.body()
+        if response.status == 200:
+            self.store(request.url, body, response.headers, response.status)
+        await route.fulfill(response=response, body=body)
+
+    def close(self):
+        """Close the index database."""
+        self._db.close()
@@ -0,0 +1,217 @@
+"""
+Shared pre-warmed browser server.
+Launches one Chromium (or a small pool) up front, publishes its endpoint and
+keeps it alive so every pytest worker and suite connects instead of launching.
+"""
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+from typing import List, Optional
+
+
+# Browser server configuration
+BROWSER_SERVER_ENDPOINTS_ENV = "BROWSER_SERVER_ENDPOINTS"
+BROWSER_SERVER_BASE_PORT = int(os.getenv("BROWSER_SERVER_BASE_PORT", "9333"))
+HEALTH_CHECK_INTERVAL = 2.0  # seconds
+STARTUP_TIMEOUT = 30.0  # seconds
+
+
+def published_endpoints() -> List[str]:
+    """
+    Get browser server endpoints published by run_tests.py.
+
+    Returns:
+        List[str]: HTTP endpoints, empty when no server is running
+    """
+    value = os.getenv(BROWSER_SERVER_ENDPOINTS_ENV, "")
+    return [endpoint for endpoint in value.split(",") if endpoint]
+
+
+def endpoint_for_worker(endpoints: List[str], worker_id: Optional[str] = None) -> Optional[str]:
+    """
+    Pick the pool member a pytest-xdist worker should connect to.
+
+    Args:
+        endpoints: Published endpoints
+        worker_id: xdist worker id such as "gw3" (defaults to PYTEST_XDIST_WORKER)
+
+    Returns:
+        str: Endpoint for this worker, or None when no endpoints exist
+    """
+    if not endpoints:
+        return None
+    worker_id = worker_id or os.getenv("PYTEST_XDIST_WORKER", "gw0")
+    digits = "".join(ch for ch in worker_id if ch.isdigit())
+    index = int(digits) if digits else 0
+    return endpoints[index % len(endpoints)]
+
+
+def is_healthy(endpoint: str, timeout: float = 2.0) -> bool:
+    """
+    Check that a browser server answers its DevTools version probe.
+
+    Args:
+        endpoint: HTTP endpoint such as http://127.0.0.1:9333
+        timeout: Probe timeout in seconds
+
+    Returns:
+        bool: True if the browser is up and accepting connections
+    """
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/version", timeout=timeout) as response:
+            return "webSocketDebuggerUrl" in json.loads(response.read().decode("utf-8"))
+    except (OSError, ValueError):
+        return False
+
+
+def _chromium_executable() -> str:
+    """Resolve the Chromium binary installed by `playwright install`."""
+    from playwright.sync_api import sync_playwright
+    with sync_playwright() as playwright:
+        return playwright.chromium.executable_path
+
+
+class BrowserServer:
+    """A single Chromium process exposing the DevTools protocol on a fixed port."""
+
+    def __init__(self, port: int, headless: bool = True, executable: Optional[str] = None):
+        """
+        Initialize browser server.
+
+        Args:
+            port: Remote debugging port
+            headless: Run the browser without a window
+            executable: Chromium binary (resolved from Playwright if omitted)
+        """
+        self.port = port
+        self.headless = headless
+        self.executable = executable
+        self.process: Optional[subprocess.Popen] = None
+        self.restarts = 0
+        self._profile_dir: Optional[str] = None
+
+    @property
+    def endpoint(self) -> str:
+        """HTTP endpoint clients connect to."""
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self):
+        """Launch the browser and wait until it is healthy."""
+        self.executable = self.executable or _chromium_executable()
+        self._profile_dir = tempfile.mkdtemp(prefix=f"browser-server-{self.port}-")
+        args = [
+            self.executable,
+            f"--remote-debugging-port={self.port}",
+            "--remote-debugging-address=127.0.0.1",
+            f"--user-data-dir={self._profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-background-networking",
+            "about:blank"
+        ]
+        if self.headless:
+            args.insert(1, "--headless=new")
+        self.process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        deadline = time.time() + STARTUP_TIMEOUT
+        while time.time() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Browser server on port {self.port} exited with code {self.process.returncode}")
+            if is_healthy(self.endpoint, timeout=0.5):
+                return
+            time.sleep(0.1)
+        self.stop()
+        raise RuntimeError(f"Browser server on port {self.port} did not become healthy in {STARTUP_TIMEOUT}s")
+
+    def is_alive(self) -> bool:
+        """
+        Check process liveness and DevTools health.
+
+        Returns:
+            bool: True if the server can accept connections
+        """
+        return self.process is not None and self.process.poll() is None and is_healthy(self.endpoint)
+
+    def restart(self):
+        """Stop and relaunch the browser on the same port, keeping the endpoint stable."""
+        self.stop()
+        self.start()
+        self.restarts += 1
+
+    def stop(self):
+        """Terminate the browser and remove its temporary profile."""
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+        if self._profile_dir:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
+
+
+class BrowserServerPool:
+    """
+    Pool of browser servers with a health-check supervisor.
+
+    The supervisor thread probes every server and restarts any that died, so
+    workers reconnecting to the same endpoint find a fresh browser.
+    """
+
+    def __init__(self, size: int = 1, headless: bool = True, base_port: int = BROWSER_SERVER_BASE_PORT):
+        """
+        Initialize browser server pool.
+
+        Args:
+            size: Number of browser processes
+            headless: Run browsers without a window
+            base_port: First remote debugging port; members use consecutive ports
+        """
+        self.servers = [BrowserServer(base_port + index, headless) for index in range(size)]
+        self._stop_event = threading.Event()
+        self._supervisor: Optional[threading.Thread] = None
+
+    @property
+    def endpoints(self) -> List[str]:
+        """Endpoints of all pool members."""
+        return [server.endpoint for server in self.servers]
+
+    def start(self):
+        """Start every server, publish endpoints and begin supervision."""
+        executable = _chromium_executable()
+        for server in self.servers:
+            server.executable = executable
+            server.start()
+        os.environ[BROWSER_SERVER_ENDPOINTS_ENV] = ",".join(self.endpoints)
+        self._stop_event.clear()
+        self._supervisor = threading.Thread(target=self._supervise, name="browser-server-supervisor", daemon=True)
+        self._supervisor.start()
+
+    def _supervise(self):
+        """Restart unhealthy servers until the pool is stopped."""
+        while not self._stop_event.wait(HEALTH_CHECK_INTERVAL):
+            for server in self.servers:
+                if self._stop_event.is_set():
+                    return
+                if not server.is_alive():
+                    print(f"♻️ Browser server on port {server.port} is unhealthy, restarting")
+                    try:
+                        server.restart()
+                    except RuntimeError as e:
+                        print(f"❌ Browser server restart failed: {e}")
+
+    def stop(self):
+        """Stop supervision and every server, and unpublish endpoints."""
+        self._stop_event.set()
+        if self._supervisor is not None:
+            self._supervisor.join(timeout=HEALTH_CHECK_INTERVAL * 2)
+        for server in self.servers:
+            server.stop()
+        os.environ.pop(BROWSER_SERVER_ENDPOINTS_ENV, None)
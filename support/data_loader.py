@@ -0,0 +1,321 @@
+"""
+Streaming loader for external test-data sets.
+CSV, JSON-lines and SQLite files are read row by row and converted to
+TestData model records. Parsed rows are cached in a SQLite file named after
+the source file's content hash, so later runs skip parsing and can read a
+single row or a partition directly. Parametrization only carries row
+positions and ids; each test loads its own row when it runs.
+"""
+import csv
+import dataclasses
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+import pytest
+
+from support.sharding import SHARD_ENV, parse_shard
+from TestData.models import parse_price
+
+
+DATA_CACHE_DIR = os.getenv("DATA_CACHE_DIR", ".cache/test_data")
+EXTERNAL_DATA_ENV = "EXTERNAL_DATA_DIR"
+EXTERNAL_DATA_DIR = os.getenv(EXTERNAL_DATA_ENV, "TestData/external")
+SOURCE_SUFFIXES = (".csv", ".jsonl", ".sqlite", ".db")
+CACHE_FORMAT_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+
+CACHE_SCHEMA = """
+CREATE TABLE rows (
+    position INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+
+def file_hash(path: str) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_source(path: str, table: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream raw rows of a data file.
+
+    Args:
+        path: .csv (header row), .jsonl (one object per line) or .sqlite/.db file
+        table: SQLite table (default: the file name without extension)
+
+    Returns:
+        Iterator[Dict[str, Any]]: Column name to value, one dict per row
+
+    Raises:
+        ValueError: Unsupported file type
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        with open(path, newline="", encoding="utf-8") as source:
+            yield from csv.DictReader(source)
+    elif suffix == ".jsonl":
+        with open(path, encoding="utf-8") as source:
+            for line in source:
+                if line.strip():
+                    yield json.loads(line)
+    elif suffix in (".sqlite", ".db"):
+        db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        db.row_factory = sqlite3.Row
+        try:
+            for row in db.execute(f'SELECT * FROM "{table or Path(path).stem}"'):
+                yield dict(row)
+        finally:
+            db.close()
+    else:
+        raise ValueError(f"Unsupported test-data file '{path}'. Supported: {', '.join(SOURCE_SUFFIXES)}")
+
+
+def coerce_row(record_type, raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a raw row to the fields of a model record.
+
+    Integer fields are parsed from text, and price_cents falls back to a
+    displayed "price" column ("$29.99").
+
+    Args:
+        record_type: Model dataclass such as Product or User
+        raw: Raw row
+
+    Returns:
+        Dict[str, Any]: Field name to value
+
+    Raises:
+        ValueError: A field has no column
+    """
+    data = {}
+    for field in dataclasses.fields(record_type):
+        if field.name in raw:
+            value = raw[field.name]
+        elif field.name == "price_cents" and "price" in raw:
+            value = parse_price(str(raw["price"]))
+        else:
+            raise ValueError(f"{record_type.__name__} row has no '{field.name}' column: {raw}")
+        if field.type in (int, "int") and not isinstance(value, int):
+            value = int(value)
+        elif field.type in (str, "str") and value is None:
+            value = ""
+        data[field.name] = value
+    return data
+
+
+class RowRef(NamedTuple):
+    """Position and id of one row; what a parametrized test carries until it runs."""
+    source: Any
+    position: int
+    id: str
+
+    def load(self):
+        """Read and build the row's record."""
+        return self.source.row(self.position)
+
+
+class Partition(NamedTuple):
+    """Every parts-th row of a source, starting at row part."""
+    source: Any
+    part: int
+    parts: int
+
+    def rows(self) -> Iterator:
+        """Stream the partition's records."""
+        return self.source.partition(self.part, self.parts)
+
+
+class DataSource:
+    """Data file read through a hash-keyed cache of parsed rows."""
+
+    def __init__(self, path: str, record_type=None, table: Optional[str] = None, id_field: str = "key",
+                 cache_dir: str = DATA_CACHE_DIR):
+        """
+        Initialize data source; nothing is read until rows are requested.
+
+        Args:
+            path: CSV, JSON-lines or SQLite file
+            record_type: Model dataclass rows are converted to (None yields dicts)
+            table: SQLite table (default: the file name without extension)
+            id_field: Column used as the test id of a row (the position when absent)
+            cache_dir: Directory of parsed-row caches
+        """
+        self.path = str(path)
+        self.record_type = record_type
+        self.table = table
+        self.id_field = id_field
+        self.cache_dir = Path(cache_dir)
+        self._db = None
+
+    def cache_path(self) -> Path:
+        """Cache file of this source's current content."""
+        kind = self.record_type.__name__ if self.record_type else "dict"
+        return self.cache_dir / f"{file_hash(self.path)[:32]}-{kind}-{self.table or ''}-v{CACHE_FORMAT_VERSION}.sqlite"
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the cache, parsing the source into it on first use."""
+        if self._db is None:
+            path = self.cache_path()
+            if not path.exists():
+                self._build(path)
+            self._db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        return self._db
+
+    def _build(self, path: Path):
+        """Parse the source into a new cache file; written under a temporary name and renamed atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        db = sqlite3.connect(temporary)
+        try:
+            db.executescript(CACHE_SCHEMA)
+            with db:
+                db.executemany("INSERT INTO rows VALUES (?, ?, ?)", (
+                    (position, str(data.get(self.id_field, position)), json.dumps(data))
+                    for position, data in enumerate(
+                        coerce_row(self.record_type, raw) if self.record_type else raw
+                        for raw in read_source(self.path, self.table)
+                    )
+                ))
+        except Exception:
+            db.close()
+            temporary.unlink()
+            raise
+        db.close()
+        os.replace(temporary, path)
+
+    def _record(self, data: str):
+        values = json.loads(data)
+        return self.record_type(**values) if self.record_type else values
+
+    def __iter__(self) -> Iterator:
+        return (self._record(data) for (data,) in self._connection().execute("SELECT data FROM rows ORDER BY position"))
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+
+    def row(self, position: int):
+        """
+        Record at a position.
+
+        Raises:
+            IndexError: No row at that position
+        """
+        found = self._connection().execute("SELECT data FROM rows WHERE position = ?", (position,)).fetchone()
+        if found is None:
+            raise IndexError(f"{self.path} has no row {position}")
+        return self._record(found[0])
+
+    def refs(self) -> Iterator[RowRef]:
+        """Position and id of every row, without building records."""
+        for position, row_id in self._connection().execute("SELECT position, id FROM rows ORDER BY position"):
+            yield RowRef(self, position, row_id)
+
+    def partition(self, part: int, parts: int) -> Iterator:
+        """Stream every parts-th record, starting at position part."""
+        return (
+            self._record(data) for (data,) in self._connection().execute(
+                "SELECT data FROM rows WHERE position % ? = ? ORDER BY position", (parts, part)
+            )
+        )
+
+    def close(self):
+        """Close the cache connection."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+class RecordSource:
+    """In-memory source with the DataSource interface, over records that are already built."""
+
+    def __init__(self, records: Iterable, id_field: str = "key"):
+        """
+        Initialize record source.
+
+        Args:
+            records: Model records, such as a TestData table
+            id_field: Attribute used as the test id of a row
+        """
+        self.records = tuple(records)
+        self.id_field = id_field
+
+    def __iter__(self) -> Iterator:
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def row(self, position: int):
+        """Record at a position."""
+        return self.records[position]
+
+    def refs(self) -> Iterator[RowRef]:
+        """Position and id of every record."""
+        for position, record in enumerate(self.records):
+            yield RowRef(self, position, str(getattr(record, self.id_field, position)))
+
+    def partition(self, part: int, parts: int) -> Iterator:
+        """Every parts-th record, starting at position part."""
+        return itertools.islice(self.records, part, None, parts)
+
+
+def external_source(name: str, record_type, directory: str = EXTERNAL_DATA_DIR) -> Optional[DataSource]:
+    """
+    Find an external data set.
+
+    Args:
+        name: File name without extension, such as "products"
+        record_type: Model dataclass of its rows
+        directory: Directory searched for <name>.csv, .jsonl, .sqlite or .db
+
+    Returns:
+        DataSource: The first file found, or None
+    """
+    for suffix in SOURCE_SUFFIXES:
+        path = Path(directory) / f"{name}{suffix}"
+        if path.exists():
+            return DataSource(str(path), record_type, table=name)
+    return None
+
+
+def partition_count() -> int:
+    """Partitions giving every xdist worker of every CI shard its own share: workers x shards."""
+    workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+    shard = os.getenv(SHARD_ENV)
+    shards = parse_shard(shard)[1] if shard else 1
+    return max(1, workers * shards)
+
+
+def row_params(source) -> List:
+    """One pytest parameter per row, carrying only its RowRef."""
+    return [pytest.param(ref, id=ref.id) for ref in source.refs()]
+
+
+def partition_params(source, parts: Optional[int] = None) -> List:
+    """
+    One pytest parameter per partition of a source.
+
+    The parameter list is the same in every process, as xdist requires;
+    xdist and the shard selection then spread the partitions.
+
+    Args:
+        source: DataSource or RecordSource
+        parts: Number of partitions (default: partition_count())
+
+    Returns:
+        List: Parameters carrying Partition values
+    """
+    parts = parts or partition_count()
+    return [pytest.param(Partition(source, part, parts), id=f"rows{part + 1}of{parts}") for part in range(parts)]
@@ -0,0 +1,640 @@
+"""
+Browserless dry run of the BDD suite.
+Binds every step of every scenario in features/ to a step definition without
+importing pytest-bdd or starting a browser. Like pytest-bdd, a test module
+sees only the steps registered in its own namespace: defined in it or
+star-imported into it, in the conftest.py files above it, or in modules
+listed in pytest_plugins. Step definitions and fixtures are read with ast,
+feature files with a small Gherkin reader, and each distinct step text is
+matched once per test module.
+"""
+import ast
+import difflib
+import functools
+import re
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+STEP_TYPES = ("given", "when", "then")
+STEP_KEYWORDS = {"Given": "given", "When": "when", "Then": "then", "And": None, "But": None, "*": None}
+PARSER_NAMES = ("parse", "cfparse", "re")
+
+# Fixtures provided by pytest itself and by the plugins in requirements.txt
+BUILTIN_FIXTURES = {
+    "request", "pytestconfig", "cache", "capsys", "capsysbinary", "capfd", "capfdbinary", "caplog",
+    "monkeypatch", "recwarn", "tmp_path", "tmp_path_factory", "tmpdir", "tmpdir_factory",
+    "record_property", "record_xml_attribute", "record_testsuite_property", "doctest_namespace",
+    "worker_id", "testrun_uid", "extra", "extras"
+}
+
+# parse-library format types and the text they accept
+PARSE_TYPE_PATTERNS = {
+    "d": r"[-+]?\d+", "n": r"[-+]?[\d,]+", "f": r"[-+]?\d*\.\d+", "g": r"[-+]?[\d.eE+-]+",
+    "e": r"[-+]?[\d.]+[eE][-+]?\d+", "w": r"\w+", "W": r"\W+", "s": r"\s+", "S": r"\S+"
+}
+FORMAT_FIELD_PATTERN = re.compile(r"\{\{|\}\}|\{([^{}:]*)(?::([^{}]*))?\}")
+
+
+class StepDefinition(NamedTuple):
+    """One @given/@when/@then binding found in a Python source."""
+    step_type: str
+    parser: Optional[str]  # None for exact strings, else parse, cfparse or re
+    pattern: str
+    function: str
+    params: Tuple[str, ...]
+    target_fixture: Optional[str]
+    location: str
+
+
+class FeatureStep(NamedTuple):
+    """One Gherkin step with its effective type."""
+    step_type: Optional[str]
+    keyword: str
+    text: str
+    line: int
+
+
+class Scenario(NamedTuple):
+    """A scenario (or outline) with its background steps prepended."""
+    feature: str
+    name: str
+    line: int
+    steps: Tuple[FeatureStep, ...]
+    examples: Tuple[Dict[str, str], ...]
+    outline: bool
+
+
+def format_to_regex(pattern: str, relaxed: bool = False) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Translate a parse/cfparse format string into an anchored regular expression.
+
+    Args:
+        pattern: Format such as 'cart should have {count:d} items'
+        relaxed: Accept any text for typed fields, to tell type mismatches from missing steps
+
+    Returns:
+        Tuple[str, Tuple[str, ...]]: Regex source and the named fields in order
+    """
+    parts = []
+    names = []
+    position = 0
+    for match in FORMAT_FIELD_PATTERN.finditer(pattern):
+        parts.append(re.escape(pattern[position:match.start()]))
+        position = match.end()
+        if match.group(0) in ("{{", "}}"):
+            parts.append(re.escape(match.group(0)[0]))
+            continue
+        name = match.group(1) or ""
+        field_type = (match.group(2) or "").lstrip("<>=^0123456789.,")
+        value_pattern = ".+?" if relaxed else PARSE_TYPE_PATTERNS.get(field_type, ".+?")
+        if name.isidentifier() and name not in names:
+            names.append(name)
+            parts.append(f"(?P<{name}>{value_pattern})")
+        else:
+            parts.append(f"(?:{value_pattern})")
+    parts.append(re.escape(pattern[position:]))
+    return "".join(parts), tuple(names)
+
+
+def _decorator_name(node: ast.expr) -> Optional[str]:
+    """Name of a decorator or call target written as name or module.name."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _constant_string(node: Optional[ast.expr]) -> Optional[str]:
+    """Value of a string literal node, or None."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_module(path: Path) -> ast.Module:
+    """Parse a Python source once per dry run, however many checks read it."""
+    return ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+
+
+def _function_params(function: ast.AST) -> Tuple[str, ...]:
+    """Positional and keyword parameter names of a function definition."""
+    arguments = function.args
+    return tuple(arg.arg for arg in arguments.posonlyargs + arguments.args + arguments.kwonlyargs)
+
+
+def load_step_definitions(paths: Iterable[Path], root: Path = PROJECT_ROOT) -> List[StepDefinition]:
+    """
+    Read step bindings from Python sources without importing them.
+
+    Args:
+        paths: Step definition modules
+        root: Directory locations are reported relative to
+
+    Returns:
+        List[StepDefinition]: Bindings in source order
+    """
+    definitions = []
+    for path in paths:
+        definitions.extend(_module_step_definitions(path, root))
+    return definitions
+
+
+@functools.lru_cache(maxsize=None)
+def _module_step_definitions(path: Path, root: Path) -> Tuple[StepDefinition, ...]:
+    """Step bindings of one source, read once per dry run however many test modules see it."""
+    definitions = []
+    tree = _parse_module(path)
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            if not isinstance(decorator, ast.Call) or _decorator_name(decorator.func) not in STEP_TYPES:
+                continue
+            argument = decorator.args[0] if decorator.args else None
+            parser = None
+            pattern = _constant_string(argument)
+            if isinstance(argument, ast.Call) and _decorator_name(argument.func) in PARSER_NAMES:
+                parser = _decorator_name(argument.func)
+                pattern = _constant_string(argument.args[0] if argument.args else None)
+            if pattern is None:
+                continue  # Built dynamically; cannot be checked statically
+            target = next(
+                (_constant_string(keyword.value) for keyword in decorator.keywords if keyword.arg == "target_fixture"),
+                None
+            )
+            definitions.append(StepDefinition(
+                _decorator_name(decorator.func), parser, pattern, node.name, _function_params(node), target,
+                f"{path.relative_to(root)}:{node.lineno}"
+            ))
+    return tuple(definitions)
+
+
+def load_fixture_names(paths: Iterable[Path]) -> Set[str]:
+    """
+    Collect the names of @pytest.fixture functions in Python sources.
+
+    Args:
+        paths: Modules such as conftest.py
+
+    Returns:
+        Set[str]: Fixture names, honouring name= overrides
+    """
+    names = set()
+    for path in paths:
+        tree = _parse_module(path)
+        for node in ast.walk(tree):
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            for decorator in node.decorator_list:
+                target = decorator.func if isinstance(decorator, ast.Call) else decorator
+                if _decorator_name(target) != "fixture":
+                    continue
+                keywords = decorator.keywords if isinstance(decorator, ast.Call) else []
+                override = next((_constant_string(k.value) for k in keywords if k.arg == "name"), None)
+                names.add(override or node.name)
+    return names
+
+
+def parse_feature(path: Path, root: Path = PROJECT_ROOT) -> List[Scenario]:
+    """
+    Read the scenarios of a Gherkin feature file.
+
+    Supports Background, Scenario, Scenario Outline/Template with Examples,
+    And/But/* continuation, tags, comments, doc strings and data tables.
+
+    Args:
+        path: .feature file
+        root: Directory the feature name is reported relative to
+
+    Returns:
+        List[Scenario]: Scenarios with background steps prepended
+    """
+    feature = str(path.relative_to(root))
+    scenarios = []
+    background: List[FeatureStep] = []
+    current = None  # dict for the scenario being read
+    section = None  # "background", "scenario" or "examples"
+    previous_type = None
+    example_header = None
+    in_doc_string = None
+
+    def finish():
+        if current is not None:
+            scenarios.append(Scenario(
+                feature, current["name"], current["line"], tuple(background + current["steps"]),
+                tuple(current["examples"]), current["outline"]
+            ))
+
+    for number, raw in enumerate(path.read_text(encoding="utf-8").splitlines(), 1):
+        line = raw.strip()
+        if in_doc_string:
+            if line.startswith(in_doc_string):
+                in_doc_string = None
+            continue
+        if not line or line.startswith("#") or line.startswith("@"):
+            continue
+        if line.startswith('"""') or line.startswith("```"):
+            in_doc_string = line[:3]
+            continue
+        if line.startswith("|"):
+            if section == "examples":
+                cells = [cell.strip() for cell in line.strip("|").split("|")]
+                if example_header is None:
+                    example_header = cells
+                else:
+                    current["examples"].append(dict(zip(example_header, cells)))
+            continue  # Data tables belong to the previous step
+        keyword, colon, rest = line.partition(":")
+        if colon and keyword in ("Feature", "Rule"):
+            continue
+        if colon and keyword == "Background":
+            finish()
+            current, section, previous_type, background = None, "background", None, []
+            continue
+        if colon and keyword in ("Scenario", "Example", "Scenario Outline", "Scenario Template"):
+            finish()
+            current = {
+                "name": rest.strip(), "line": number, "steps": [], "examples": [],
+                "outline": keyword in ("Scenario Outline", "Scenario Template")
+            }
+            section, previous_type = "scenario", None
+            continue
+        if colon and keyword in ("Examples", "Scenarios"):
+            section, example_header = "examples", None
+            continue
+        word, _, text = line.partition(" ")
+        if word in STEP_KEYWORDS and section in ("background", "scenario"):
+            step_type = STEP_KEYWORDS[word] or previous_type
+            previous_type = step_type
+            step = FeatureStep(step_type, word, text.strip(), number)
+            (background if section == "background" else current["steps"]).append(step)
+    finish()
+    return scenarios
+
+
+class StepBinder:
+    """Matches step texts to definitions, caching the result per distinct text."""
+
+    def __init__(self, definitions: List[StepDefinition]):
+        """
+        Initialize binder.
+
+        Args:
+            definitions: Bindings from load_step_definitions()
+        """
+        self.exact: Dict[Tuple[str, str], List[StepDefinition]] = defaultdict(list)
+        self.patterns: Dict[str, List[Tuple[StepDefinition, Any, Any]]] = defaultdict(list)
+        for definition in definitions:
+            if definition.parser is None:
+                self.exact[(definition.step_type, definition.pattern)].append(definition)
+            elif definition.parser == "re":
+                compiled = re.compile(definition.pattern)
+                self.patterns[definition.step_type].append((definition, compiled, None))
+            else:
+                strict, _ = format_to_regex(definition.pattern)
+                relaxed, _ = format_to_regex(definition.pattern, relaxed=True)
+                self.patterns[definition.step_type].append((definition, re.compile(strict), re.compile(relaxed)))
+        self._cache: Dict[Tuple[str, str], Tuple[list, list]] = {}
+        self._suggestions: Dict[Tuple[str, str], List[str]] = {}
+
+    def bind(self, step_type: str, text: str) -> Tuple[List[Tuple[StepDefinition, Dict[str, str]]], List[StepDefinition]]:
+        """
+        Find the definitions matching a step.
+
+        Args:
+            step_type: given, when or then
+            text: Step text after the keyword
+
+        Returns:
+            Tuple: (definition, parsed arguments) matches, and definitions whose
+            text matches but whose typed arguments do not
+        """
+        key = (step_type, text)
+        if key not in self._cache:
+            # Exact strings take precedence over patterns that also match
+            matches = [(definition, {}) for definition in self.exact.get(key, [])]
+            type_mismatches = []
+            for definition, strict, relaxed in ([] if matches else self.patterns.get(step_type, [])):
+                match = strict.fullmatch(text)
+                if match is not None:
+                    matches.append((definition, match.groupdict()))
+                elif relaxed is not None and relaxed.fullmatch(text):
+                    type_mismatches.append(definition)
+            self._cache[key] = (matches, type_mismatches)
+        return self._cache[key]
+
+    def suggestions(self, step_type: str, text: str) -> List[str]:
+        """Closest definition texts of the same step type, for unbound steps."""
+        key = (step_type, text)
+        if key not in self._suggestions:
+            candidates = [pattern for kind, pattern in self.exact if kind == step_type]
+            candidates += [definition.pattern for definition, _, _ in self.patterns.get(step_type, [])]
+            self._suggestions[key] = difflib.get_close_matches(text, candidates, n=2, cutoff=0.6)
+        return self._suggestions[key]
+
+
+def module_source(name: str, importer: Path, level: int = 0, root: Path = PROJECT_ROOT) -> Optional[Path]:
+    """
+    Source file of a project module named in an import.
+
+    Args:
+        name: Dotted module name ("" for "from . import *")
+        importer: Module containing the import
+        level: Number of leading dots of a relative import
+        root: Project root absolute imports are resolved against
+
+    Returns:
+        Path: The module's .py file or package __init__.py, or None outside the project
+    """
+    base = root
+    if level:
+        base = importer.parent
+        for _ in range(level - 1):
+            base = base.parent
+    target = base.joinpath(*name.split(".")) if name else base
+    for candidate in (target.with_suffix(".py"), target / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def namespace_sources(path: Path, root: Path = PROJECT_ROOT, seen: Optional[Set[Path]] = None) -> List[Path]:
+    """
+    Modules whose step definitions end up in a module's namespace.
+
+    pytest-bdd registers a step as a fixture in the module whose decorator
+    ran it. The fixture reaches another module only through "from x import *";
+    importing the module object ("from package import steps") does not.
+
+    Args:
+        path: Module to resolve
+        root: Project root
+        seen: Modules already resolved, to stop at import cycles
+
+    Returns:
+        List[Path]: The module and every project module star-imported into it, recursively
+    """
+    seen = set() if seen is None else seen
+    if path in seen:
+        return []
+    seen.add(path)
+    sources = [path]
+    for node in _parse_module(path).body:
+        if isinstance(node, ast.ImportFrom) and any(alias.name == "*" for alias in node.names):
+            target = module_source(node.module or "", path, node.level, root)
+            if target is not None:
+                sources += namespace_sources(target, root, seen)
+    return sources
+
+
+def _plugin_modules(conftest: Path) -> List[str]:
+    """Module names listed in a conftest's pytest_plugins."""
+    for node in _parse_module(conftest).body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "pytest_plugins" for target in node.targets
+        ):
+            values = node.value.elts if isinstance(node.value, (ast.List, ast.Tuple)) else [node.value]
+            return [value for value in map(_constant_string, values) if value]
+    return []
+
+
+def visible_step_sources(test_path: Path, root: Path = PROJECT_ROOT) -> List[Path]:
+    """
+    Modules whose step definitions a test module can use.
+
+    Args:
+        test_path: Test module calling scenarios()
+        root: Project root
+
+    Returns:
+        List[Path]: The test module's namespace, the namespaces of the conftest.py
+        files from its directory up to root, and of the modules in their pytest_plugins
+    """
+    seen: Set[Path] = set()
+    sources = namespace_sources(test_path, root, seen)
+    directory = test_path.parent
+    while True:
+        conftest = directory / "conftest.py"
+        if conftest.is_file():
+            sources += namespace_sources(conftest, root, seen)
+            for plugin in _plugin_modules(conftest):
+                plugin_path = module_source(plugin, conftest, 0, root)
+                if plugin_path is not None:
+                    sources += namespace_sources(plugin_path, root, seen)
+        if directory == root or directory == directory.parent:
+            return sources
+        directory = directory.parent
+
+
+def loaded_features(test_paths: Iterable[Path], root: Path = PROJECT_ROOT) -> Set[str]:
+    """
+    Feature files passed to scenarios()/scenario() by test modules.
+
+    Args:
+        test_paths: Test modules
+        root: Directory feature names are reported relative to
+
+    Returns:
+        Set[str]: Feature paths relative to root
+    """
+    features = set()
+    for path in test_paths:
+        tree = _parse_module(path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call) and _decorator_name(node.func) in ("scenarios", "scenario"):
+                for argument in node.args[:1]:
+                    target = _constant_string(argument)
+                    if target is not None:
+                        resolved = (path.parent / target).resolve()
+                        features.update(
+                            str(feature.relative_to(root))
+                            for feature in ([resolved] if resolved.is_file() else resolved.rglob("*.feature"))
+                        )
+    return features
+
+
+def _parametrized_names(function: ast.AST) -> Set[str]:
+    """Argument names supplied by a function's @pytest.mark.parametrize decorators."""
+    names = set()
+    for decorator in function.decorator_list:
+        if isinstance(decorator, ast.Call) and _decorator_name(decorator.func) == "parametrize" and decorator.args:
+            argnames = decorator.args[0]
+            if isinstance(argnames, (ast.List, ast.Tuple)):
+                names.update(filter(None, map(_constant_string, argnames.elts)))
+            else:
+                names.update(name.strip() for name in (_constant_string(argnames) or "").split(","))
+    return names
+
+
+def _test_function_params(test_paths: Iterable[Path]) -> List[Tuple[str, str, Tuple[str, ...]]]:
+    """(location, name, fixture params) of every test function in the test modules."""
+    functions = []
+    for path in test_paths:
+        tree = _parse_module(path)
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test_"):
+                skipped = {"self", "cls"} | _parametrized_names(node)
+                params = tuple(param for param in _function_params(node) if param not in skipped)
+                functions.append((f"{path.name}:{node.lineno}", node.name, params))
+    return functions
+
+
+def run_dry_run(root: Path = PROJECT_ROOT) -> Dict[str, Any]:
+    """
+    Bind every step of every scenario and check step and test fixtures.
+
+    Each feature is bound once per test module loading it, against the steps
+    visible to that module. Features no module loads are bound against
+    step_definitions/.
+
+    Args:
+        root: Project root containing features/, step_definitions/, tests/ and conftest.py
+
+    Returns:
+        Dict[str, Any]: Counts, problems (unbound, type_mismatch, ambiguous,
+        unknown_fixture, not_loaded, no_examples) and elapsed seconds
+    """
+    started = time.perf_counter()
+    _parse_module.cache_clear()
+    _module_step_definitions.cache_clear()
+    root = Path(root)
+    step_paths = sorted((root / "step_definitions").glob("*.py"))
+    test_paths = sorted((root / "tests").glob("test_*.py"))
+    step_definitions = load_step_definitions(step_paths, root)
+    all_binder = StepBinder(step_definitions)
+    module_binders: Dict[str, StepBinder] = {}
+    definitions: Dict[StepDefinition, None] = dict.fromkeys(step_definitions)  # Ordered set
+    loaders = defaultdict(list)  # feature -> test modules loading it
+    for test_path in test_paths:
+        module = str(test_path.relative_to(root))
+        visible = load_step_definitions(visible_step_sources(test_path, root), root)
+        definitions.update(dict.fromkeys(visible))
+        module_binders[module] = StepBinder(visible)
+        for feature in sorted(loaded_features([test_path], root)):
+            loaders[feature].append(module)
+    definitions = list(definitions)
+    fixture_sources = [path for path in [root / "conftest.py", *step_paths, *test_paths] if path.exists()]
+    fixtures = BUILTIN_FIXTURES | load_fixture_names(fixture_sources)
+    fixtures |= {definition.target_fixture for definition in definitions if definition.target_fixture}
+
+    problems = defaultdict(list)
+    reported = set()  # Background steps are shared by every scenario; report each once
+
+    def report(kind, key, message):
+        """Record a problem once; message may be a callable so the text is only built for new problems."""
+        if (kind, key) not in reported:
+            reported.add((kind, key))
+            problems[kind].append(message() if callable(message) else message)
+
+    def unbound_reason(step_type, text, module):
+        if module is None:
+            hint = all_binder.suggestions(step_type, text)
+            return f"no @{step_type} step" + (f" (did you mean '{hint[0]}'?)" if hint else "")
+        elsewhere, _ = all_binder.bind(step_type, text)
+        if elsewhere:
+            return (f"no @{step_type} step visible to {module} "
+                    f"({elsewhere[0][0].location} is not star-imported by it or a conftest.py)")
+        hint = module_binders[module].suggestions(step_type, text)
+        return f"no @{step_type} step visible to {module}" + (f" (did you mean '{hint[0]}'?)" if hint else "")
+
+    used = set()
+    feature_paths = sorted((root / "features").rglob("*.feature"))
+    scenario_count = step_count = 0
+    for feature_path in feature_paths:
+        feature = str(feature_path.relative_to(root))
+        modules = loaders.get(feature) or [None]
+        if modules == [None]:
+            problems["not_loaded"].append(f"{feature}: not loaded by any scenarios() call in tests/")
+        for scenario in parse_feature(feature_path, root):
+            scenario_count += 1
+            if scenario.outline and not scenario.examples:
+                problems["no_examples"].append(f"{feature}:{scenario.line} {scenario.name}: outline has no Examples")
+            for example in scenario.examples or [{}]:
+                for step in scenario.steps:
+                    step_count += 1
+                    text = re.sub(r"<([^<>]+)>", lambda m: example.get(m.group(1), m.group(0)), step.text)
+                    where = f"{feature}:{step.line} {step.keyword} {text}"
+                    if step.step_type is None:
+                        report("unbound", (feature, step.line, text), f"{where}: no Given/When/Then before it")
+                        continue
+                    for module in modules:
+                        key = (feature, step.line, text, module)
+                        binder = all_binder if module is None else module_binders[module]
+                        matches, type_mismatches = binder.bind(step.step_type, text)
+                        if not matches:
+                            if type_mismatches:
+                                report("type_mismatch", key, f"{where}: arguments do not fit "
+                                       f"'{type_mismatches[0].pattern}' ({type_mismatches[0].location})")
+                            else:
+                                report("unbound", key,
+                                       lambda: f"{where}: {unbound_reason(step.step_type, text, module)}")
+                            continue
+                        if len({definition.location for definition, _ in matches}) > 1:
+                            locations = ", ".join(definition.location for definition, _ in matches)
+                            report("ambiguous", key, f"{where}: matches {locations}")
+                        used.update(definition for definition, _ in matches)
+
+    for definition in definitions:
+        arguments = set(format_to_regex(definition.pattern)[1]) if definition.parser in ("parse", "cfparse") else (
+            set(re.compile(definition.pattern).groupindex) if definition.parser == "re" else set()
+        )
+        for param in definition.params:
+            if param not in arguments and param not in fixtures:
+                problems["unknown_fixture"].append(
+                    f"{definition.location} {definition.function}: '{param}' is neither a step argument nor a fixture"
+                )
+    for location, name, params in _test_function_params(test_paths):
+        for param in params:
+            if param not in fixtures:
+                problems["unknown_fixture"].append(f"tests/{location} {name}: unknown fixture '{param}'")
+
+    return {
+        "features": len(feature_paths),
+        "scenarios": scenario_count,
+        "steps": step_count,
+        "definitions": len(definitions),
+        "unused_definitions": [definition for definition in definitions if definition not in used],
+        "problems": dict(problems),
+        "elapsed": time.perf_counter() - started
+    }
+
+
+def print_dry_run_report(result: Dict[str, Any], write=print) -> bool:
+    """
+    Print a dry-run result.
+
+    Args:
+        result: Result of run_dry_run()
+        write: Line writer
+
+    Returns:
+        bool: True when every step bound and every fixture exists
+    """
+    write(f"🧪 Dry run: {result['features']} feature(s), {result['scenarios']} scenario(s), "
+          f"{result['steps']} step(s), {result['definitions']} step definition(s) in {result['elapsed'] * 1000:.0f} ms")
+    titles = {
+        "unbound": "❌ Unbound steps",
+        "type_mismatch": "❌ Steps whose arguments do not fit their definition",
+        "unknown_fixture": "❌ Unknown fixtures",
+        "no_examples": "❌ Outlines without examples",
+        "ambiguous": "⚠️ Steps matching several definitions",
+        "not_loaded": "⚠️ Features not collected"
+    }
+    for kind, title in titles.items():
+        entries = result["problems"].get(kind, [])
+        if entries:
+            write(f"{title} ({len(entries)}):")
+            for entry in entries:
+                write(f"   {entry}")
+    unused = result["unused_definitions"]
+    if unused:
+        write(f"ℹ️ {len(unused)} step definition(s) not used by any feature")
+    failed = any(result["problems"].get(kind) for kind in ("unbound", "type_mismatch", "unknown_fixture", "no_examples"))
+    write("❌ Dry run found binding errors" if failed else "✅ Every step is bound")
+    return not failed
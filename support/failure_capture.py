@@ -0,0 +1,154 @@
+"""
+Failure-only trace and screencast capture.
+Keeps a bounded ring buffer of recent browser activity per context and
+persists it to the reports directory only when a test fails.
+"""
+import base64
+import json
+import os
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, List, Tuple, Union
+
+from support.artifact_paths import safe_test_name
+
+
+# Capture configuration
+CAPTURE_WINDOW_SECONDS = float(os.getenv("CAPTURE_WINDOW_SECONDS", "30"))
+CAPTURE_MAX_EVENTS = int(os.getenv("CAPTURE_MAX_EVENTS", "500"))
+CAPTURE_MAX_FRAMES = int(os.getenv("CAPTURE_MAX_FRAMES", "30"))
+# Small, infrequent frames keep the screencast cheap for the passing tests that never persist it
+SCREENCAST_OPTIONS = {
+    "format": "jpeg",
+    "quality": 40,
+    "maxWidth": int(os.getenv("CAPTURE_FRAME_MAX_WIDTH", "640")),
+    "maxHeight": int(os.getenv("CAPTURE_FRAME_MAX_HEIGHT", "360")),
+    "everyNthFrame": int(os.getenv("CAPTURE_EVERY_NTH_FRAME", "6"))
+}
+FAILURE_ARTIFACTS_DIR = "reports/failures"
+
+
+class FailureCapture:
+    """
+    Ring buffer of trace events and screencast frames for one browser context.
+
+    Recording only appends a tuple to a bounded deque, so passing tests pay
+    almost nothing. Frame decoding, window trimming and serialization happen
+    in persist(), which is only called for failing tests.
+    """
+
+    def __init__(self, window_seconds: float = CAPTURE_WINDOW_SECONDS,
+                 max_events: int = CAPTURE_MAX_EVENTS,
+                 max_frames: int = CAPTURE_MAX_FRAMES,
+                 trace: bool = True, video: bool = True):
+        """
+        Initialize failure capture.
+
+        Args:
+            window_seconds: Only the last N seconds of activity are persisted
+            max_events: Upper bound of trace events kept in memory
+            max_frames: Upper bound of screencast frames kept in memory
+            trace: Whether trace events are recorded
+            video: Whether screencast frames are recorded
+        """
+        self.window_seconds = window_seconds
+        self.trace_enabled = trace
+        self.video_enabled = video
+        self._events: Deque[Tuple[float, str, Any, float, Any]] = deque(maxlen=max_events)
+        self._frames: Deque[Tuple[float, Union[bytes, str], str]] = deque(maxlen=max_frames)
+
+    def record_event(self, operation: str, details: Any, duration: float, result: Any = None):
+        """
+        Record a client operation in the trace buffer.
+
+        Args:
+            operation: Operation name (navigate, click, type, ...)
+            details: Operation arguments
+            duration: Operation duration in seconds
+            result: Operation result
+        """
+        if self.trace_enabled:
+            self._events.append((time.time(), operation, details, duration, result))
+
+    def record_frame(self, data: Union[bytes, str], mime_type: str = "image/jpeg"):
+        """
+        Record a screencast frame in the video buffer.
+
+        Args:
+            data: Encoded frame bytes, or the base64 string CDP delivers (decoded on persist)
+            mime_type: Frame image type
+        """
+        if self.video_enabled:
+            self._frames.append((time.time(), data, mime_type))
+
+    def events(self) -> List[dict]:
+        """
+        Get trace events inside the capture window.
+
+        Returns:
+            List[dict]: Trace events, oldest first
+        """
+        cutoff = time.time() - self.window_seconds
+        return [
+            {
+                "timestamp": timestamp,
+                "operation": operation,
+                "details": details,
+                "duration": duration,
+                "result": result
+            }
+            for timestamp, operation, details, duration, result in self._events
+            if timestamp >= cutoff
+        ]
+
+    def frames(self) -> List[Tuple[float, bytes, str]]:
+        """
+        Get screencast frames inside the capture window.
+
+        Returns:
+            List[Tuple[float, bytes, str]]: (timestamp, data, mime type) tuples
+        """
+        cutoff = time.time() - self.window_seconds
+        return [
+            (timestamp, base64.b64decode(data) if isinstance(data, str) else data, mime_type)
+            for timestamp, data, mime_type in self._frames
+            if timestamp >= cutoff
+        ]
+
+    def persist(self, test_name: str, output_dir: str = FAILURE_ARTIFACTS_DIR) -> List[str]:
+        """
+        Write the buffered window to disk.
+
+        Args:
+            test_name: Test node id used to name the artifact directory
+            output_dir: Base directory for failure artifacts
+
+        Returns:
+            List[str]: Paths of written artifact files
+        """
+        safe_name = safe_test_name(test_name)
+        target_dir = Path(output_dir) / safe_name
+        target_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+
+        events = self.events()
+        if events:
+            trace_path = target_dir / "trace.jsonl"
+            with open(trace_path, "w", encoding="utf-8") as trace_file:
+                for event in events:
+                    trace_file.write(json.dumps(event, default=repr) + "\n")
+            written.append(str(trace_path))
+
+        for index, (timestamp, data, mime_type) in enumerate(self.frames()):
+            extension = "png" if mime_type == "image/png" else "jpg"
+            frame_path = target_dir / f"frame_{index:03d}_{int(timestamp * 1000)}.{extension}"
+            frame_path.write_bytes(data)
+            written.append(str(frame_path))
+
+        return written
+
+    def clear(self):
+        """Drop all buffered events and frames."""
+        self._events.clear()
+        self._frames.clear()
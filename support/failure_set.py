@@ -0,0 +1,106 @@
+"""
+Persisted set of failing tests.
+The controller adds every test that fails and removes every test that
+passes, so after a red run the set holds exactly what still needs fixing.
+Saving merges this run's changes into the file as it is on disk, so
+concurrent runs (such as the quarantine lane) keep each other's results.
+run_tests.py --failed-first/--only-failed/--loop select from it.
+"""
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+FAILED_TESTS_FILE = os.getenv("FAILED_TESTS_FILE", "reports/failed_tests.json")
+FAILED_SELECTION_ENV = "FAILED_SELECTION"  # "first" or "only"
+
+
+class FailureSet:
+    """Node ids of tests whose most recent run failed, with when they failed."""
+
+    def __init__(self, path: str = FAILED_TESTS_FILE):
+        """
+        Initialize failure set, loading it from disk if present.
+
+        Args:
+            path: JSON file the set is persisted to
+        """
+        self.path = Path(path)
+        self.failed: Dict[str, float] = self._load()
+        self._changes: Dict[str, Optional[float]] = {}  # nodeid -> failure time, None once it passed
+
+    def _load(self) -> Dict[str, float]:
+        """Read the persisted set; a missing or corrupt file is empty."""
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}  # A corrupt file only costs one full run
+
+    def __contains__(self, nodeid: str) -> bool:
+        return nodeid in self.failed
+
+    def __len__(self) -> int:
+        return len(self.failed)
+
+    def record(self, nodeid: str, outcome: str):
+        """
+        Update the set with a test outcome.
+
+        Args:
+            nodeid: Test node id
+            outcome: "failed" adds the test, "passed" removes it; other outcomes leave it as is
+        """
+        if outcome == "failed" and nodeid not in self.failed:
+            self.failed[nodeid] = self._changes[nodeid] = time.time()
+        elif outcome == "passed" and nodeid in self.failed:
+            del self.failed[nodeid]
+            self._changes[nodeid] = None
+
+    def select(self, items: List, only: bool) -> List:
+        """
+        Order or filter collected items by the failure set.
+
+        Args:
+            items: Collected pytest items
+            only: Keep only failed tests; otherwise move them to the front
+
+        Returns:
+            List: Items to run; unchanged when no collected test is in the set
+        """
+        failed = [item for item in items if item.nodeid in self.failed]
+        if not failed:
+            return items
+        if only:
+            return failed
+        return failed + [item for item in items if item.nodeid not in self.failed]
+
+    def save(self):
+        """
+        Merge this run's changes into the file and write it if anything changed.
+
+        The file is re-read first, so tests another run recorded since this
+        set was loaded are kept. It is replaced atomically so an interrupted
+        run cannot corrupt it.
+        """
+        if not self._changes:
+            return
+        merged = self._load()
+        for nodeid, failed_at in self._changes.items():
+            if failed_at is None:
+                merged.pop(nodeid, None)
+            else:
+                merged.setdefault(nodeid, failed_at)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(merged, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(temporary, self.path)
+        self.failed = merged
+        self._changes = {}
+
+    def nodeids(self) -> Iterable[str]:
+        """Failed node ids, oldest failure first."""
+        return sorted(self.failed, key=self.failed.get)
@@ -0,0 +1,64 @@
+"""
+Polling file watcher for the run_tests.py --loop fix-verify cycle.
+Compares modification times instead of using OS notifications, so it
+needs no extra dependency and behaves the same on every platform.
+"""
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+WATCH_INTERVAL = 0.5  # Seconds between polls
+SETTLE_DELAY = 0.3  # Wait for editors that write a file in several steps
+
+
+def snapshot(directories: Iterable[str], pattern: str = "*.py") -> Dict[str, float]:
+    """
+    Record the modification time of every matching file.
+
+    Args:
+        directories: Directories searched recursively
+        pattern: File name glob
+
+    Returns:
+        Dict[str, float]: Path to modification time
+    """
+    mtimes = {}
+    for directory in directories:
+        for path in Path(directory).rglob(pattern):
+            try:
+                mtimes[str(path)] = path.stat().st_mtime
+            except OSError:
+                continue  # Deleted between listing and stat
+    return mtimes
+
+
+def changed_files(before: Dict[str, float], after: Dict[str, float]) -> List[str]:
+    """Files added, removed or modified between two snapshots."""
+    return sorted(path for path in before.keys() | after.keys() if before.get(path) != after.get(path))
+
+
+def wait_for_change(directories: Iterable[str], pattern: str = "*.py", interval: float = WATCH_INTERVAL,
+                    timeout: Optional[float] = None) -> List[str]:
+    """
+    Block until a matching file changes.
+
+    Args:
+        directories: Directories searched recursively
+        pattern: File name glob
+        interval: Seconds between polls
+        timeout: Give up after this many seconds (None waits forever)
+
+    Returns:
+        List[str]: Changed files, empty on timeout
+    """
+    directories = list(directories)
+    before = snapshot(directories, pattern)
+    deadline = None if timeout is None else time.time() + timeout
+    while deadline is None or time.time() < deadline:
+        time.sleep(interval)
+        changed = changed_files(before, snapshot(directories, pattern))
+        if changed:
+            time.sleep(SETTLE_DELAY)
+            return changed_files(before, snapshot(directories, pattern)) or changed
+    return []
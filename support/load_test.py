@@ -0,0 +1,445 @@
+"""
+Load-test mode that reuses the page objects as virtual users.
+Drives a weighted mix of scripted journeys at a target arrival rate and
+reports throughput plus HDR-histogram style latency percentiles per action.
+"""
+import json
+import math
+import queue
+import random
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from mcp_integration import (
+    MCPPlaywrightClient, mcp_client, mcp_initialize_browser, mcp_close_browser, mcp_disconnect,
+    close_thread_loop
+)
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from pages.cart_page import CartPage
+from TestData.test_data import PRODUCTS, SORT_OPTIONS, TEST_USERS
+
+
+# Journey mix weights
+JOURNEY_MIX = {
+    "browse": 0.5,
+    "add_to_cart": 0.3,
+    "checkout": 0.2
+}
+# Page-object actions timed inside journeys
+ACTIONS = ("navigate", "login", "sort_products", "add_to_cart", "open_cart", "checkout")
+LOAD_REPORT_PATH = "reports/load_report.json"
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+
+    Values are recorded in microseconds into buckets whose width grows with
+    magnitude, keeping relative error below 10^-significant_digits with a
+    fixed, small memory footprint regardless of sample count.
+    """
+
+    def __init__(self, significant_digits: int = 2):
+        """
+        Initialize latency histogram.
+
+        Args:
+            significant_digits: Decimal digits of precision kept per value
+        """
+        self.sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self.counts: Dict[tuple, int] = defaultdict(int)
+        self.total_count = 0
+        self.min_us = None
+        self.max_us = 0
+        self.sum_us = 0
+        self._lock = threading.Lock()
+
+    def _bucket(self, value_us: int) -> tuple:
+        """Get the (magnitude, sub-bucket) key for a value."""
+        magnitude = max(0, value_us.bit_length() - self.sub_bucket_bits)
+        return magnitude, value_us >> magnitude
+
+    def record(self, seconds: float):
+        """
+        Record one latency sample.
+
+        Args:
+            seconds: Latency in seconds
+        """
+        value_us = max(0, int(seconds * 1_000_000))
+        with self._lock:
+            self.counts[self._bucket(value_us)] += 1
+            self.total_count += 1
+            self.sum_us += value_us
+            self.max_us = max(self.max_us, value_us)
+            self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+
+    def value_at_percentile(self, percentile: float) -> float:
+        """
+        Get the latency at a percentile.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            float: Highest value equivalent to the percentile's bucket, in milliseconds
+        """
+        with self._lock:
+            if self.total_count == 0:
+                return 0.0
+            target = max(1, math.ceil(percentile / 100.0 * self.total_count))
+            cumulative = 0
+            for magnitude, sub_bucket in sorted(self.counts):
+                cumulative += self.counts[(magnitude, sub_bucket)]
+                if cumulative >= target:
+                    highest = ((sub_bucket + 1) << magnitude) - 1
+                    return min(highest, self.max_us) / 1000.0
+            return self.max_us / 1000.0
+
+    def summary(self, elapsed: float) -> Dict[str, float]:
+        """
+        Summarize the histogram.
+
+        Args:
+            elapsed: Measurement window in seconds, used for throughput
+
+        Returns:
+            Dict[str, float]: count, throughput and latency percentiles in milliseconds
+        """
+        return {
+            "count": self.total_count,
+            "throughput_per_s": self.total_count / elapsed if elapsed > 0 else 0.0,
+            "min_ms": (self.min_us or 0) / 1000.0,
+            "mean_ms": self.sum_us / self.total_count / 1000.0 if self.total_count else 0.0,
+            "p50_ms": self.value_at_percentile(50),
+            "p95_ms": self.value_at_percentile(95),
+            "p99_ms": self.value_at_percentile(99),
+            "max_ms": self.max_us / 1000.0
+        }
+
+
+def arrival_offsets(rate: float, ramp_up: float, duration: float) -> List[float]:
+    """
+    Compute journey start offsets for an open-model arrival schedule.
+
+    The arrival rate ramps linearly from 0 to ``rate`` over ``ramp_up``
+    seconds, then holds for ``duration`` seconds. Offsets are deterministic:
+    the k-th arrival is placed where the cumulative arrival curve reaches k.
+
+    Args:
+        rate: Target arrivals per second
+        ramp_up: Ramp-up time in seconds
+        duration: Hold time at the target rate in seconds
+
+    Returns:
+        List[float]: Start offsets in seconds from the beginning of the run
+    """
+    if rate <= 0:
+        return []
+    ramp_arrivals = rate * ramp_up / 2.0
+    total_arrivals = int(ramp_arrivals + rate * duration)
+    offsets = []
+    for k in range(1, total_arrivals + 1):
+        if k <= ramp_arrivals:
+            offsets.append(math.sqrt(2.0 * k * ramp_up / rate))
+        else:
+            offsets.append(ramp_up + (k - ramp_arrivals) / rate)
+    return offsets
+
+
+class VirtualUser:
+    """One simulated shopper with its own client, event loop and page objects."""
+
+    def __init__(self, stats: Dict[str, LatencyHistogram], base_url: str):
+        """
+        Initialize virtual user.
+
+        Args:
+            stats: Shared per-action histograms
+            base_url: Application URL the journeys start from
+        """
+        self.stats = stats
+        self.base_url = base_url
+        self.client = MCPPlaywrightClient()
+        self.client.route_handlers = list(mcp_client.route_handlers)
+        self.login_page = LoginPage(self.client)
+        self.products_page = ProductsPage(self.client)
+        self.cart_page = CartPage(self.client)
+
+    def action(self, name: str, operation: Callable[[], bool]) -> bool:
+        """
+        Time one page-object action.
+
+        Args:
+            name: Action name used as histogram key
+            operation: Page-object call returning success
+
+        Returns:
+            bool: The operation result
+        """
+        started = time.perf_counter()
+        result = operation()
+        self.stats[name].record(time.perf_counter() - started)
+        if not result:
+            raise RuntimeError(f"Action '{name}' failed")
+        return result
+
+    def login(self):
+        """Open the application and sign in as the standard user."""
+        user = TEST_USERS["standard_user"]
+        self.action("navigate", lambda: self.login_page.navigate_to(self.base_url))
+        self.action("login", lambda: self.login_page.login(user.username, user.password))
+
+    def browse(self):
+        """Journey: log in and sort the catalog."""
+        self.login()
+        self.action("sort_products", lambda: self.products_page.sort_products_by_price_low_high())
+
+    def add_to_cart(self):
+        """Journey: log in, add a random product and open the cart."""
+        self.login()
+        product = random.choice(PRODUCTS.names())
+        self.action("add_to_cart", lambda: self.products_page.add_product_to_cart_by_name(product))
+        self.action("open_cart", lambda: self.products_page.click_shopping_cart())
+
+    def checkout(self):
+        """Journey: add to cart and proceed to checkout."""
+        self.add_to_cart()
+        self.action("checkout", lambda: self.cart_page.proceed_to_checkout())
+
+    def run(self, journey: str):
+        """
+        Run one journey in a fresh browser context.
+
+        Args:
+            journey: Journey name from JOURNEY_MIX
+        """
+        mcp_initialize_browser(headless=True, client=self.client)
+        try:
+            getattr(self, journey)()
+        finally:
+            mcp_close_browser(client=self.client)
+
+    def shutdown(self):
+        """Release the browser connection and this thread's event loop."""
+        mcp_disconnect(client=self.client)
+        close_thread_loop()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Minimal Sauce Demo stand-in exposing the selectors the page objects use."""
+
+    def _page(self, title: str, body: str) -> bytes:
+        return (
+            f"<!DOCTYPE html><html><head><title>Swag Labs</title></head><body>"
+            f"<div class='login_logo'>Swag Labs</div><span class='title'>{title}</span>{body}</body></html>"
+        ).encode("utf-8")
+
+    def do_GET(self):
+        """Serve login, inventory and cart pages."""
+        path = self.path.split("?", 1)[0]
+        if path in ("/", "/index.html"):
+            content = self._page("", (
+                "<input data-test='username'><input data-test='password' type='password'>"
+                "<input data-test='login-button' type='submit' value='Login' "
+                "onclick=\"location.href='/inventory.html'\">"
+            ))
+        elif path == "/inventory.html":
+            items = "".join(
+                f"<div class='inventory_item'><div class='inventory_item_name'>{product.name}</div>"
+                f"<div class='inventory_item_price'>{product.price}</div>"
+                f"<button data-test='{product.add_to_cart_id}'>Add to cart</button></div>"
+                for product in PRODUCTS
+            )
+            options = "".join(f"<option value='{option.value}'>{option.display}</option>" for option in SORT_OPTIONS)
+            content = self._page("Products", (
+                f"<select data-test='product_sort_container'>{options}</select>"
+                f"<a class='shopping_cart_link' href='/cart.html'>Cart</a><div class='inventory_list'>{items}</div>"
+            ))
+        elif path == "/cart.html":
+            content = self._page("Your Cart", (
+                "<div class='cart_list'></div>"
+                "<button data-test='continue-shopping' onclick=\"location.href='/inventory.html'\">Continue Shopping</button>"
+                "<button data-test='checkout'>Checkout</button>"
+            ))
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        """Silence per-request logging."""
+
+
+class StandInServer:
+    """Background HTTP server hosting the stand-in application."""
+
+    def __init__(self, port: int = 0):
+        """
+        Initialize stand-in server.
+
+        Args:
+            port: Port to bind (0 picks a free port)
+        """
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), StandInHandler)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="load-stand-in", daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Base URL of the stand-in."""
+        return f"http://127.0.0.1:{self._server.server_address[1]}/"
+
+    def start(self):
+        """Start serving in the background."""
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class LoadTest:
+    """
+    Open-model load generator.
+
+    Journeys start on the deterministic arrival schedule whether or not
+    earlier journeys finished. Journey latency is measured from the scheduled
+    start, so time spent waiting for a free virtual user is included and
+    saturation shows up in the percentiles instead of being hidden
+    (coordinated omission).
+    """
+
+    def __init__(self, base_url: str, users: int = 10, rate: float = 5.0, ramp_up: float = 10.0,
+                 duration: float = 60.0, journey_mix: Optional[Dict[str, float]] = None, seed: int = 0):
+        """
+        Initialize load test.
+
+        Args:
+            base_url: Application URL the journeys start from
+            users: Maximum concurrent virtual users
+            rate: Target journey arrivals per second
+            ramp_up: Seconds to ramp the arrival rate from 0 to rate
+            duration: Seconds to hold the target rate
+            journey_mix: Journey name to weight mapping
+            seed: Random seed for the journey mix
+        """
+        self.base_url = base_url
+        self.users = users
+        self.rate = rate
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.journey_mix = journey_mix or JOURNEY_MIX
+        self.random = random.Random(seed)
+        self.stats: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        for name in list(ACTIONS) + [f"journey:{name}" for name in self.journey_mix]:
+            self.stats[name]  # Create histograms up front so threads never race on insertion
+
+    def _virtual_user_loop(self, work: "queue.Queue"):
+        """Run journeys from the queue on one virtual user until a stop sentinel arrives."""
+        user = VirtualUser(self.stats, self.base_url)
+        try:
+            while True:
+                item = work.get()
+                if item is None:
+                    return
+                journey, scheduled_at = item
+                try:
+                    user.run(journey)
+                except Exception as e:
+                    with self._lock:
+                        self.errors[f"{journey}: {e}"] += 1
+                finally:
+                    # Measured from the scheduled start, including time queued for a free user
+                    self.stats[f"journey:{journey}"].record(time.perf_counter() - scheduled_at)
+        finally:
+            user.shutdown()
+
+    def run(self) -> Dict[str, object]:
+        """
+        Execute the load test.
+
+        Returns:
+            Dict[str, object]: Report with per-action summaries and errors
+        """
+        offsets = arrival_offsets(self.rate, self.ramp_up, self.duration)
+        journeys = list(self.journey_mix)
+        weights = [self.journey_mix[name] for name in journeys]
+        print(f"🏋️ Load test: {len(offsets)} journeys, up to {self.users} virtual users, "
+              f"{self.rate}/s after {self.ramp_up}s ramp-up, held {self.duration}s")
+
+        work: "queue.Queue" = queue.Queue()
+        threads = [
+            threading.Thread(target=self._virtual_user_loop, args=(work,), name=f"virtual-user-{index}")
+            for index in range(self.users)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for offset in offsets:
+            scheduled_at = started + offset
+            delay = scheduled_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            work.put((self.random.choices(journeys, weights)[0], scheduled_at))
+        for _ in threads:
+            work.put(None)
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        return {
+            "base_url": self.base_url,
+            "users": self.users,
+            "target_rate": self.rate,
+            "ramp_up": self.ramp_up,
+            "duration": self.duration,
+            "elapsed": elapsed,
+            "actions": {
+                name: histogram.summary(elapsed)
+                for name, histogram in sorted(self.stats.items()) if histogram.total_count
+            },
+            "errors": dict(self.errors)
+        }
+
+
+def print_load_report(report: Dict[str, object]):
+    """
+    Print a load test report table.
+
+    Args:
+        report: Report returned by LoadTest.run()
+    """
+    print(f"\n📈 Load test finished in {report['elapsed']:.1f}s against {report['base_url']}")
+    print(f"{'action':<24}{'count':>8}{'ops/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, summary in report["actions"].items():
+        print(f"{name:<24}{summary['count']:>8}{summary['throughput_per_s']:>9.2f}{summary['p50_ms']:>10.1f}"
+              f"{summary['p95_ms']:>10.1f}{summary['p99_ms']:>10.1f}{summary['max_ms']:>10.1f}")
+    if report["errors"]:
+        print("❌ Errors:")
+        for error, count in report["errors"].items():
+            print(f"  {count} x {error}")
+
+
+def write_load_report(report: Dict[str, object], path: str = LOAD_REPORT_PATH):
+    """
+    Write a load test report as JSON.
+
+    Args:
+        report: Report returned by LoadTest.run()
+        path: Output file
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, indent=2)
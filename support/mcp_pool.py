@@ -0,0 +1,293 @@
+"""
+Sharded pool of MCP server connections.
+Spreads client sessions across several MCP server processes. A session
+sticks to the shard it was first routed to; new sessions go to the shard
+with the fewest outstanding requests. A server drives one browser and acts
+on its selected tab, so every session gets its own tab and the sessions of
+one shard take turns selecting it.
+"""
+import asyncio
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from support.mcp_transport import MCPStdioTransport, REQUEST_TIMEOUT
+
+
+# Pool configuration
+MCP_POOL_SHARDS = int(os.getenv("MCP_POOL_SHARDS", "1"))
+LATENCY_WINDOW = 1000  # most recent calls kept per shard for percentiles
+TAB_LOCK_POLL = 0.005  # seconds between attempts to take a busy shard's tab lock
+
+
+class MCPShard:
+    """One MCP server connection with its routing and latency statistics."""
+
+    def __init__(self, index: int, command: Optional[List[str]] = None, request_timeout: float = REQUEST_TIMEOUT):
+        """
+        Initialize shard.
+
+        Args:
+            index: Shard number
+            command: MCP server command line
+            request_timeout: Default per-request timeout in seconds
+        """
+        self.index = index
+        self.transport = MCPStdioTransport(command, request_timeout)
+        self.sessions = set()
+        self.sessions_served = 0
+        self.requests = 0
+        self.max_outstanding = 0
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._tabs: List[str] = []  # Session ids in the server's tab order
+        self._selected: Optional[str] = None  # Session whose tab the server has selected
+        self._tab_lock = threading.Lock()
+
+    @property
+    def outstanding(self) -> int:
+        """Requests sent to this shard and not yet answered (queue depth)."""
+        return self.transport.in_flight
+
+    def _record(self, started: float):
+        """Record the latency of a finished call."""
+        self.requests += 1
+        self._latencies.append(time.perf_counter() - started)
+
+    def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None,
+                  timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Call a tool on this shard and record its latency."""
+        started = time.perf_counter()
+        self.max_outstanding = max(self.max_outstanding, self.outstanding + 1)
+        try:
+            return self.transport.call_tool(name, arguments, timeout)
+        finally:
+            self._record(started)
+
+    async def acall_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None,
+                         timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Awaitable call_tool()."""
+        started = time.perf_counter()
+        self.max_outstanding = max(self.max_outstanding, self.outstanding + 1)
+        try:
+            return await self.transport.acall_tool(name, arguments, timeout)
+        finally:
+            self._record(started)
+
+    async def _lock_tabs(self):
+        """Take the tab lock without blocking the event loop, which may hold other sessions' calls."""
+        while not self._tab_lock.acquire(blocking=False):
+            await asyncio.sleep(TAB_LOCK_POLL)
+
+    async def _select_tab(self, session_id: str, timeout: Optional[float]):
+        """Make the session's tab the server's selected tab, opening it on first use; tab lock held."""
+        if session_id not in self._tabs:
+            if self._tabs:
+                await self.acall_tool("browser_tab_new", {}, timeout)
+            # Otherwise the session takes the tab the server opens on its first page action
+            self._tabs.append(session_id)
+        elif self._selected != session_id:
+            await self.acall_tool("browser_tab_select", {"index": self._tabs.index(session_id)}, timeout)
+        self._selected = session_id
+
+    async def acall_session_tool(self, session_id: str, name: str, arguments: Optional[Dict[str, Any]] = None,
+                                 timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Call a tool in a session's own tab.
+
+        Selecting the tab and running the tool happen under the shard's tab
+        lock, so another session cannot switch tabs in between. Sessions on
+        one shard queue for it; sessions on different shards run in parallel.
+
+        Args:
+            session_id: Id of the client session
+            name: Tool name such as browser_navigate
+            arguments: Tool arguments
+            timeout: Per-request timeout in seconds
+        """
+        await self._lock_tabs()
+        try:
+            await self._select_tab(session_id, timeout)
+            return await self.acall_tool(name, arguments, timeout)
+        finally:
+            self._tab_lock.release()
+
+    async def aclose_session(self, session_id: str, timeout: Optional[float] = None):
+        """
+        Close a session's tab; the tabs of other sessions stay open.
+
+        Args:
+            session_id: Id of the client session
+            timeout: Per-request timeout in seconds
+        """
+        await self._lock_tabs()
+        try:
+            if session_id in self._tabs:
+                await self.acall_tool("browser_tab_close", {"index": self._tabs.index(session_id)}, timeout)
+                self._tabs.remove(session_id)
+                self._selected = None  # The server selected a neighbouring tab
+        finally:
+            self._tab_lock.release()
+
+    def open_tabs(self) -> List[str]:
+        """Sessions with an open tab, in the server's tab order."""
+        return list(self._tabs)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get routing and latency statistics.
+
+        Returns:
+            Dict[str, Any]: Sessions, queue depth, request count and latency percentiles in ms
+        """
+        latencies = sorted(self._latencies)
+        return {
+            "shard": self.index,
+            "sessions": len(self.sessions),
+            "sessions_served": self.sessions_served,
+            "outstanding": self.outstanding,
+            "max_outstanding": self.max_outstanding,
+            "requests": self.requests,
+            "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+            "p95_ms": latencies[int(0.95 * (len(latencies) - 1))] * 1000 if latencies else 0.0
+        }
+
+
+class MCPConnectionPool:
+    """
+    Pool of MCP server connections with sticky session routing.
+
+    A session keeps its shard for its whole lifetime, because the tab it
+    drives lives in that server. New sessions are assigned to the
+    shard with the fewest outstanding requests, then the fewest sessions.
+    """
+
+    def __init__(self, shards: int = MCP_POOL_SHARDS, command: Optional[List[str]] = None,
+                 request_timeout: float = REQUEST_TIMEOUT):
+        """
+        Initialize connection pool.
+
+        Args:
+            shards: Number of MCP server processes
+            command: MCP server command line (defaults to MCP_SERVER_COMMAND)
+            request_timeout: Default per-request timeout in seconds
+        """
+        self.shards = [MCPShard(index, command, request_timeout) for index in range(max(1, shards))]
+        self._affinity: Dict[str, MCPShard] = {}
+        self._lock = threading.Lock()
+
+    def start(self) -> "MCPConnectionPool":
+        """
+        Start every server connection in parallel.
+
+        Returns:
+            MCPConnectionPool: self, for chaining
+        """
+        errors = []
+
+        def start_shard(shard):
+            try:
+                shard.transport.start()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=start_shard, args=(shard,)) for shard in self.shards]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            self.close()
+            raise errors[0]
+        return self
+
+    def shard_for(self, session_id: str) -> MCPShard:
+        """
+        Route a session to its shard.
+
+        Args:
+            session_id: Stable id of the client session
+
+        Returns:
+            MCPShard: The session's sticky shard, assigned on first use
+        """
+        with self._lock:
+            shard = self._affinity.get(session_id)
+            if shard is None:
+                shard = min(self.shards, key=lambda candidate: (candidate.outstanding, len(candidate.sessions)))
+                shard.sessions.add(session_id)
+                shard.sessions_served += 1
+                self._affinity[session_id] = shard
+            return shard
+
+    def release(self, session_id: str):
+        """
+        End a session's affinity so its shard can take new sessions.
+
+        Args:
+            session_id: Id passed to shard_for()
+        """
+        with self._lock:
+            shard = self._affinity.pop(session_id, None)
+            if shard is not None:
+                shard.sessions.discard(session_id)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-shard routing and latency statistics."""
+        return [shard.stats() for shard in self.shards]
+
+    def close(self):
+        """Close every server connection."""
+        for shard in self.shards:
+            shard.transport.close()
+
+
+_shared_pool: Optional[MCPConnectionPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def shared_pool() -> MCPConnectionPool:
+    """
+    Get the process-wide pool, starting it on first use.
+
+    Returns:
+        MCPConnectionPool: Pool with MCP_POOL_SHARDS connections
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = MCPConnectionPool().start()
+        return _shared_pool
+
+
+def close_shared_pool() -> Optional[List[Dict[str, Any]]]:
+    """
+    Close the process-wide pool if it was started.
+
+    Returns:
+        List[Dict[str, Any]]: Final per-shard statistics, or None if no pool was started
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        pool, _shared_pool = _shared_pool, None
+    if pool is None:
+        return None
+    stats = pool.stats()
+    pool.close()
+    return stats
+
+
+def print_pool_stats(stats: List[Dict[str, Any]], write=print):
+    """
+    Print per-shard statistics.
+
+    Args:
+        stats: Result of MCPConnectionPool.stats()
+        write: Line writer (print or a terminal reporter's write_line)
+    """
+    write(f"{'shard':>5}{'sessions':>10}{'requests':>10}{'max queue':>11}{'p50 ms':>9}{'p95 ms':>9}")
+    for shard in stats:
+        write(f"{shard['shard']:>5}{shard['sessions_served']:>10}{shard['requests']:>10}"
+              f"{shard['max_outstanding']:>11}{shard['p50_ms']:>9.1f}{shard['p95_ms']:>9.1f}")
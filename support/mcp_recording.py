@@ -0,0 +1,221 @@
+"""
+Record and replay of MCP client command streams.
+Every traced client operation is written with its result and duration to a
+gzipped JSON-lines file per scenario. Replay serves those results back in
+sequence without a browser, so refactors of pages/ and step_definitions/
+can be checked against a known-good stream in seconds.
+"""
+import gzip
+import inspect
+import json
+import os
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from support.artifact_paths import safe_test_name
+
+
+# Recording configuration
+MCP_RECORDING = os.getenv("MCP_RECORDING", "off")  # off, record or replay
+MCP_RECORDING_DIR = os.getenv("MCP_RECORDING_DIR", "reports/mcp_recordings")
+MCP_REPLAY_LATENCY = os.getenv("MCP_REPLAY_LATENCY", "zero")  # zero or recorded
+RECORDING_MODES = ("off", "record", "replay")
+REPLAY_LATENCIES = ("zero", "recorded")
+RECORDING_FORMAT_VERSION = 1
+
+
+# Fixtures that hand a test the shared client; other tests have no command stream to record or replay
+CLIENT_FIXTURES = ("browser_context", "authenticated_user", "empty_cart", "cart_with_items")
+
+
+class ReplayMismatchError(AssertionError):
+    """The replayed scenario issued a different command stream than was recorded."""
+
+
+def recording_path(test_name: str, directory: str = MCP_RECORDING_DIR) -> Path:
+    """
+    Get the recording file of a test.
+
+    Args:
+        test_name: Test node id
+        directory: Recordings directory
+
+    Returns:
+        Path: <directory>/<sanitised node id>.jsonl.gz
+    """
+    safe_name = safe_test_name(test_name)
+    return Path(directory) / f"{safe_name}.jsonl.gz"
+
+
+def drives_client(item) -> bool:
+    """
+    Check whether a test issues client commands of its own.
+
+    BDD scenarios always do. Other tests only do when they request a client
+    fixture themselves, not merely through the autouse setup fixture.
+
+    Args:
+        item: pytest test item
+
+    Returns:
+        bool: True if the test's command stream should be recorded or replayed
+    """
+    function = getattr(item, "function", None)
+    if function is None:
+        return False
+    if getattr(function, "__scenario__", None) is not None:
+        return True
+    return any(name in CLIENT_FIXTURES for name in inspect.signature(function).parameters)
+
+
+def _normalise(value: Any) -> Any:
+    """Convert a value to its JSON form so recorded and live values compare equal."""
+    return json.loads(json.dumps(value, default=str))
+
+
+class CommandRecorder:
+    """Collects the client command stream of one scenario."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize recorder.
+
+        Args:
+            path: File written by save()
+        """
+        self.path = Path(path)
+        self.entries: List[list] = []
+
+    def record(self, operation: str, args: tuple, result: Any, duration: float):
+        """
+        Append one command and its response.
+
+        Args:
+            operation: Client operation name
+            args: Operation arguments (already redacted)
+            result: Operation result
+            duration: Seconds the operation took
+        """
+        self.entries.append([operation, _normalise(list(args)), _normalise(result), round(duration * 1000, 3)])
+
+    def save(self) -> Path:
+        """
+        Write the stream as gzipped JSON lines: a header, then one [operation, args, result, ms] per line.
+
+        Returns:
+            Path: Written file
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(".tmp")
+        with gzip.open(temporary, "wt", encoding="utf-8") as stream:
+            stream.write(json.dumps({"version": RECORDING_FORMAT_VERSION, "operations": len(self.entries)}) + "\n")
+            for entry in self.entries:
+                stream.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        os.replace(temporary, self.path)
+        return self.path
+
+
+class ReplayBackend:
+    """Serves a recorded command stream back to the client, keyed by sequence number."""
+
+    def __init__(self, entries: List[list], latency: str = MCP_REPLAY_LATENCY, source: str = ""):
+        """
+        Initialize replay backend.
+
+        Args:
+            entries: Recorded [operation, args, result, ms] entries
+            latency: "zero" to answer at once, "recorded" to wait as long as the recording did
+            source: Recording file name used in mismatch messages
+        """
+        if latency not in REPLAY_LATENCIES:
+            raise ValueError(f"Unknown replay latency '{latency}'. Available: {', '.join(REPLAY_LATENCIES)}")
+        self.entries = entries
+        self.latency = latency
+        self.source = source
+        self.position = 0
+
+    @classmethod
+    def load(cls, path: Path, latency: str = MCP_REPLAY_LATENCY) -> "ReplayBackend":
+        """
+        Read a recording written by CommandRecorder.save().
+
+        Args:
+            path: Recording file
+            latency: Replay latency mode
+
+        Returns:
+            ReplayBackend: Backend positioned at the first command
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as stream:
+            header = json.loads(stream.readline())
+            if header.get("version") != RECORDING_FORMAT_VERSION:
+                raise ValueError(f"Unsupported recording format {header.get('version')} in {path}")
+            entries = [json.loads(line) for line in stream if line.strip()]
+        return cls(entries, latency, source=str(path))
+
+    @property
+    def remaining(self) -> int:
+        """Recorded commands not replayed yet."""
+        return len(self.entries) - self.position
+
+    def next(self, operation: str, args: tuple) -> Tuple[Any, float]:
+        """
+        Answer the next command from the recording.
+
+        Args:
+            operation: Client operation name
+            args: Operation arguments (redacted the same way as when recording)
+
+        Returns:
+            Tuple[Any, float]: Recorded result and the delay to apply in seconds
+
+        Raises:
+            ReplayMismatchError: The command differs from the recorded one at this position
+        """
+        sequence = self.position
+        if sequence >= len(self.entries):
+            raise ReplayMismatchError(
+                f"Command #{sequence} {operation}{tuple(args)} is past the end of {self.source}"
+            )
+        recorded_operation, recorded_args, result, duration_ms = self.entries[sequence]
+        live_args = _normalise(list(args))
+        if (recorded_operation, recorded_args) != (operation, live_args):
+            raise ReplayMismatchError(
+                f"Command #{sequence} differs from {self.source}: "
+                f"recorded {recorded_operation}{tuple(recorded_args)}, got {operation}{tuple(live_args)}"
+            )
+        self.position += 1
+        return result, (duration_ms / 1000 if self.latency == "recorded" else 0.0)
+
+    def finish(self):
+        """
+        Check that the scenario issued every recorded command.
+
+        Raises:
+            ReplayMismatchError: Recorded commands were left unreplayed
+        """
+        if self.remaining:
+            operation, args = self.entries[self.position][:2]
+            raise ReplayMismatchError(
+                f"{self.remaining} recorded command(s) were not issued, starting with "
+                f"#{self.position} {operation}{tuple(args)} in {self.source}"
+            )
+
+
+def open_replay(test_name: str, latency: str = MCP_REPLAY_LATENCY,
+                directory: str = MCP_RECORDING_DIR) -> Optional[ReplayBackend]:
+    """
+    Load the recording of a test if one exists.
+
+    Args:
+        test_name: Test node id
+        latency: Replay latency mode
+        directory: Recordings directory
+
+    Returns:
+        ReplayBackend: Backend for the test, or None when it was never recorded
+    """
+    path = recording_path(test_name, directory)
+    if not path.exists():
+        return None
+    return ReplayBackend.load(path, latency)
@@ -0,0 +1,408 @@
+"""
+Persistent JSON-RPC transport to an MCP server over stdio.
+Keeps one server process per transport and multiplexes requests by id, so
+many calls can be in flight on the same connection. Late requests time out
+and are cancelled with notifications/cancelled.
+"""
+import asyncio
+import concurrent.futures
+import itertools
+import json
+import os
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+# Transport configuration
+MCP_SERVER_COMMAND_ENV = "MCP_SERVER_COMMAND"
+DEFAULT_MCP_SERVER_COMMAND = "npx @playwright/mcp@latest --headless"
+MCP_PROTOCOL_VERSION = "2024-11-05"
+REQUEST_TIMEOUT = float(os.getenv("MCP_REQUEST_TIMEOUT", "30"))  # seconds
+
+
+class MCPError(Exception):
+    """Error response, or transport failure, for an MCP request."""
+
+    def __init__(self, message: str, code: Optional[int] = None, data: Any = None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+class MCPTimeoutError(MCPError):
+    """An MCP request got no response within its timeout and was cancelled."""
+
+
+def server_command() -> List[str]:
+    """
+    Get the MCP server command line.
+
+    Returns:
+        List[str]: MCP_SERVER_COMMAND split into arguments, or the Playwright MCP default
+    """
+    return shlex.split(os.getenv(MCP_SERVER_COMMAND_ENV, DEFAULT_MCP_SERVER_COMMAND))
+
+
+def stub_server_command(latency_ms: float = 0.0) -> List[str]:
+    """
+    Get the command line of the bundled stub MCP server.
+
+    Args:
+        latency_ms: Artificial latency the stub adds to every tool call
+
+    Returns:
+        List[str]: Command running support/stub_mcp_server.py with this interpreter
+    """
+    stub = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub_mcp_server.py")
+    return [sys.executable, stub, "--latency-ms", str(latency_ms)]
+
+
+class MCPStdioTransport:
+    """
+    JSON-RPC 2.0 over the stdin/stdout of a long-lived MCP server process.
+
+    A reader thread resolves responses by id, so requests from any thread or
+    event loop can be pipelined without waiting for earlier ones.
+    """
+
+    def __init__(self, command: Optional[List[str]] = None, request_timeout: float = REQUEST_TIMEOUT,
+                 cwd: Optional[str] = None):
+        """
+        Initialize transport.
+
+        Args:
+            command: Server command line (defaults to server_command())
+            request_timeout: Default per-request timeout in seconds
+            cwd: Working directory of the server process
+        """
+        self.command = command or server_command()
+        self.request_timeout = request_timeout
+        self.cwd = cwd
+        self.process: Optional[subprocess.Popen] = None
+        self.server_info: Dict[str, Any] = {}
+        self.stats = {"requests": 0, "responses": 0, "timeouts": 0, "cancelled": 0, "errors": 0}
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, concurrent.futures.Future] = {}
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._reader: Optional[threading.Thread] = None
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests awaiting a response."""
+        return len(self._pending)
+
+    def start(self) -> "MCPStdioTransport":
+        """
+        Launch the server and perform the MCP initialize handshake.
+
+        Returns:
+            MCPStdioTransport: self, for chaining
+        """
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.cwd,
+            bufsize=0
+        )
+        self._reader = threading.Thread(target=self._read_loop, name="mcp-transport-reader", daemon=True)
+        self._reader.start()
+        self.server_info = self.call("initialize", {
+            "protocolVersion": MCP_PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "saucedemo-bdd-framework", "version": "1.0"}
+        })
+        self.notify("notifications/initialized")
+        return self
+
+    def _write(self, message: Dict[str, Any]):
+        """Send one newline-delimited JSON-RPC message."""
+        if self.process is None or self.process.poll() is not None:
+            raise MCPError("MCP server is not running")
+        data = (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._write_lock:
+            self.process.stdin.write(data)
+            self.process.stdin.flush()
+
+    def _read_loop(self):
+        """Resolve pending requests from server responses until the server exits."""
+        for line in self.process.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if "method" in message:
+                # Server-initiated request or notification; only ping needs an answer
+                if message.get("method") == "ping" and "id" in message:
+                    self._write({"jsonrpc": "2.0", "id": message["id"], "result": {}})
+                continue
+            with self._pending_lock:
+                future = self._pending.pop(message.get("id"), None)
+            if future is None or future.done():
+                continue  # Response to a cancelled or timed-out request
+            self.stats["responses"] += 1
+            if "error" in message:
+                self.stats["errors"] += 1
+                error = message["error"]
+                future.set_exception(MCPError(error.get("message", "MCP error"), error.get("code"), error.get("data")))
+            else:
+                future.set_result(message.get("result"))
+        self._fail_pending(MCPError("MCP server closed the connection"))
+
+    def _fail_pending(self, error: MCPError):
+        """Fail every request still waiting for a response."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def request(self, method: str, params: Optional[Dict[str, Any]] = None) -> concurrent.futures.Future:
+        """
+        Send a request without waiting for its response.
+
+        Args:
+            method: JSON-RPC method
+            params: Method parameters
+
+        Returns:
+            concurrent.futures.Future: Resolves to the result; carries the request id as request_id
+        """
+        request_id = next(self._ids)
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        future.request_id = request_id
+        with self._pending_lock:
+            self._pending[request_id] = future
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            message["params"] = params
+        try:
+            self._write(message)
+        except (OSError, MCPError) as e:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            future.set_exception(e if isinstance(e, MCPError) else MCPError(str(e)))
+        self.stats["requests"] += 1
+        return future
+
+    def notify(self, method: str, params: Optional[Dict[str, Any]] = None):
+        """
+        Send a notification (no response expected).
+
+        Args:
+            method: JSON-RPC method
+            params: Method parameters
+        """
+        message = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        self._write(message)
+
+    def cancel(self, future: concurrent.futures.Future, reason: str = "cancelled by client"):
+        """
+        Cancel an in-flight request locally and tell the server to stop working on it.
+
+        Args:
+            future: Future returned by request()
+            reason: Reason sent in notifications/cancelled
+        """
+        with self._pending_lock:
+            pending = self._pending.pop(future.request_id, None)
+        if pending is None:
+            return
+        self.stats["cancelled"] += 1
+        future.cancel()
+        try:
+            self.notify("notifications/cancelled", {"requestId": future.request_id, "reason": reason})
+        except (OSError, MCPError):
+            pass
+
+    def wait(self, future: concurrent.futures.Future, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for a response, cancelling the request if it takes too long.
+
+        Args:
+            future: Future returned by request()
+            timeout: Seconds to wait (defaults to request_timeout)
+
+        Returns:
+            Any: The JSON-RPC result
+        """
+        timeout = self.request_timeout if timeout is None else timeout
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            self.stats["timeouts"] += 1
+            self.cancel(future, reason=f"timed out after {timeout}s")
+            raise MCPTimeoutError(f"MCP request {future.request_id} timed out after {timeout}s")
+
+    def call(self, method: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> Any:
+        """
+        Send a request and wait for its result.
+
+        Args:
+            method: JSON-RPC method
+            params: Method parameters
+            timeout: Seconds to wait (defaults to request_timeout)
+
+        Returns:
+            Any: The JSON-RPC result
+        """
+        return self.wait(self.request(method, params), timeout)
+
+    async def acall(self, method: str, params: Optional[Dict[str, Any]] = None,
+                    timeout: Optional[float] = None) -> Any:
+        """
+        Awaitable call() that does not block the calling event loop.
+
+        Args:
+            method: JSON-RPC method
+            params: Method parameters
+            timeout: Seconds to wait (defaults to request_timeout)
+
+        Returns:
+            Any: The JSON-RPC result
+        """
+        timeout = self.request_timeout if timeout is None else timeout
+        future = self.request(method, params)
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            self.cancel(future, reason=f"timed out after {timeout}s")
+            raise MCPTimeoutError(f"MCP request {future.request_id} timed out after {timeout}s")
+        except asyncio.CancelledError:
+            self.cancel(future)
+            raise
+
+    def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None,
+                  timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Call an MCP tool.
+
+        Args:
+            name: Tool name such as browser_navigate
+            arguments: Tool arguments
+            timeout: Seconds to wait (defaults to request_timeout)
+
+        Returns:
+            Dict[str, Any]: Tool result with its content list
+        """
+        return check_tool_result(name, self.call("tools/call", {"name": name, "arguments": arguments or {}}, timeout))
+
+    async def acall_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None,
+                         timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Awaitable call_tool()."""
+        result = await self.acall("tools/call", {"name": name, "arguments": arguments or {}}, timeout)
+        return check_tool_result(name, result)
+
+    def close(self):
+        """Stop the server and fail any request still in flight."""
+        if self.process is not None:
+            try:
+                self.process.stdin.close()
+            except OSError:
+                pass
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.terminate()
+                self.process.wait(timeout=5)
+        if self._reader is not None:
+            self._reader.join(timeout=5)
+        self._fail_pending(MCPError("MCP transport closed"))
+        self.process = None
+
+
+def check_tool_result(name: str, result: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Raise for tool results flagged as errors.
+
+    Args:
+        name: Tool name, for the error message
+        result: tools/call result
+
+    Returns:
+        Dict[str, Any]: The result unchanged
+    """
+    result = result or {}
+    if result.get("isError"):
+        raise MCPError(f"MCP tool {name} failed: {tool_result_text(result)}")
+    return result
+
+
+def tool_result_text(result: Dict[str, Any]) -> str:
+    """
+    Join the text content of a tool result.
+
+    Args:
+        result: tools/call result
+
+    Returns:
+        str: Text parts separated by newlines
+    """
+    return "\n".join(part.get("text", "") for part in result.get("content", []) if part.get("type") == "text")
+
+
+def tool_result_value(result: Dict[str, Any]) -> Any:
+    """
+    Extract the value returned by an evaluating tool.
+
+    Playwright MCP reports it under a "### Result" heading; plain JSON text
+    is accepted as well.
+
+    Args:
+        result: tools/call result
+
+    Returns:
+        Any: Decoded JSON value, or the raw text when it is not JSON
+    """
+    text = tool_result_text(result)
+    if "### Result" in text:
+        text = text.split("### Result", 1)[1].split("\n###", 1)[0]
+    text = text.strip()
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def run_transport_benchmark(requests: int = 500, latency_ms: float = 5.0, concurrency: int = 64) -> Dict[str, float]:
+    """
+    Compare sequential and pipelined tool calls against the stub MCP server.
+
+    Args:
+        requests: Tool calls per mode
+        latency_ms: Stub latency per call
+        concurrency: Maximum pipelined requests in flight
+
+    Returns:
+        Dict[str, float]: Calls per second for each mode and the speed-up
+    """
+    transport = MCPStdioTransport(stub_server_command(latency_ms)).start()
+    try:
+        started = time.perf_counter()
+        for index in range(requests):
+            transport.call_tool("browser_navigate", {"url": f"https://example.test/{index}"})
+        sequential = requests / (time.perf_counter() - started)
+
+        started = time.perf_counter()
+        in_flight: List[concurrent.futures.Future] = []
+        for index in range(requests):
+            if len(in_flight) >= concurrency:
+                transport.wait(in_flight.pop(0))
+            in_flight.append(transport.request(
+                "tools/call", {"name": "browser_navigate", "arguments": {"url": f"https://example.test/{index}"}}
+            ))
+        for future in in_flight:
+            transport.wait(future)
+        pipelined = requests / (time.perf_counter() - started)
+    finally:
+        transport.close()
+    return {"sequential_per_second": sequential, "pipelined_per_second": pipelined, "speedup": pipelined / sequential}
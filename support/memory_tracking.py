@@ -0,0 +1,187 @@
+"""
+Per-test memory sampling and leak detection.
+Each test records the RSS of the browser processes, the JS heap of its page
+(CDP Performance.getMetrics) and the Python tracemalloc peak. The controller
+keeps one series per xdist worker and flags metrics that grow on every test
+for a whole window, recommending how many tests a browser should serve
+before it is recycled.
+"""
+import os
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+MEMORY_TRACKING_ENV = "MEMORY_TRACKING"
+LEAK_WINDOW = int(os.getenv("MEMORY_LEAK_WINDOW", "10"))  # Consecutive growing tests flagged as a leak
+LEAK_MIN_GROWTH = float(os.getenv("MEMORY_LEAK_MIN_GROWTH", "0.10"))  # Ignore growth below 10% over the window
+RECYCLE_BUDGET = float(os.getenv("MEMORY_RECYCLE_BUDGET", "0.50"))  # Growth over the first sample worth a recycle
+TRACKED_METRICS = ("browser_rss", "js_heap_used", "py_peak")
+BROWSER_METRICS = ("browser_rss", "js_heap_used")
+
+# performance.memory is Chromium-only; used where no CDP session is available (MCP_MODE=real)
+JS_HEAP_SCRIPT = """
+() => performance.memory ? {
+    js_heap_used: performance.memory.usedJSHeapSize,
+    js_heap_total: performance.memory.totalJSHeapSize
+} : null
+"""
+
+
+def memory_tracking_enabled() -> bool:
+    """Whether per-test memory sampling was requested (run_tests.py --memory)."""
+    return os.getenv(MEMORY_TRACKING_ENV, "false").lower() == "true"
+
+
+def process_rss(pids: Iterable[int]) -> Optional[int]:
+    """
+    Sum the resident set size of processes.
+
+    Args:
+        pids: Process ids
+
+    Returns:
+        int: RSS in bytes, or None where /proc is unavailable
+    """
+    if not os.path.isdir("/proc"):
+        return None
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/statm") as statm:
+                total += int(statm.read().split()[1]) * page_size
+        except (OSError, ValueError, IndexError):
+            continue  # Renderer exited between listing and reading
+    return total
+
+
+def start_python_tracking():
+    """Start tracemalloc with a single frame per allocation, the cheapest setting."""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(1)
+
+
+def reset_python_peak():
+    """Start a new peak measurement for the next test."""
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+
+
+def memory_sample(browser: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Combine browser metrics with the Python allocation counters of this process.
+
+    Args:
+        browser: Result of MCPPlaywrightClient.collect_memory_metrics
+
+    Returns:
+        Dict[str, Any]: Sample with browser_rss, js_heap_used, py_peak and py_current (None when unmeasured)
+    """
+    sample = {"browser_rss": None, "js_heap_used": None, "py_peak": None, "py_current": None}
+    sample.update(browser or {})
+    if tracemalloc.is_tracing():
+        sample["py_current"], sample["py_peak"] = tracemalloc.get_traced_memory()
+    return sample
+
+
+class LeakDetector:
+    """Per-worker memory series with monotonic-growth detection."""
+
+    def __init__(self, window: int = LEAK_WINDOW, min_growth: float = LEAK_MIN_GROWTH,
+                 budget: float = RECYCLE_BUDGET):
+        """
+        Initialize leak detector.
+
+        Args:
+            window: Consecutive growing tests needed to flag a leak
+            min_growth: Relative growth over the run below which it is treated as noise
+            budget: Relative growth over the worker's first sample that warrants a recycle
+        """
+        self.window = max(2, window)
+        self.min_growth = min_growth
+        self.budget = budget
+        self.series: Dict[str, List[tuple]] = defaultdict(list)  # worker -> [(nodeid, sample)]
+
+    def add(self, worker: str, nodeid: str, sample: Dict[str, Any]):
+        """Append a test's sample to its worker's series."""
+        self.series[worker].append((nodeid, sample))
+
+    def find_leaks(self) -> List[Dict[str, Any]]:
+        """
+        Find metrics that grew on every test for at least the window.
+
+        Returns:
+            List[Dict[str, Any]]: One finding per worker and metric with the longest growing run,
+            its growth and the recommended number of tests between browser recycles
+        """
+        leaks = []
+        for worker in sorted(self.series):
+            for metric in TRACKED_METRICS:
+                points = [
+                    (nodeid, sample[metric]) for nodeid, sample in self.series[worker]
+                    if sample.get(metric) is not None
+                ]
+                leak = self._longest_growth(points)
+                if leak is None:
+                    continue
+                leak.update(worker=worker, metric=metric, recycle_after=self._recycle_point(points, leak["tests"]))
+                leaks.append(leak)
+        return leaks
+
+    def _longest_growth(self, points: List[tuple]) -> Optional[Dict[str, Any]]:
+        """Longest run of strictly increasing values, if it is long and large enough to be a leak."""
+        best = None
+        start = 0
+        for index in range(1, len(points) + 1):
+            if index < len(points) and points[index][1] > points[index - 1][1]:
+                continue
+            length = index - start
+            if length >= self.window and (best is None or length > best[1] - best[0]):
+                best = (start, index)
+            start = index
+        if best is None:
+            return None
+        first, last = points[best[0]], points[best[1] - 1]
+        growth = last[1] - first[1]
+        if first[1] <= 0 or growth / first[1] < self.min_growth:
+            return None
+        return {
+            "tests": best[1] - best[0],
+            "first": first[0],
+            "last": last[0],
+            "growth": growth,
+            "relative": growth / first[1]
+        }
+
+    def _recycle_point(self, points: List[tuple], run_length: int) -> int:
+        """Tests after which the metric first exceeded the budget over the worker's first sample."""
+        baseline = points[0][1]
+        for index, (_nodeid, value) in enumerate(points):
+            if value > baseline * (1 + self.budget):
+                return max(1, index)
+        return run_length
+
+
+def _format_bytes(value: float) -> str:
+    return f"{value / (1024 * 1024):.1f} MiB"
+
+
+def print_leak_report(leaks: List[Dict[str, Any]], write: Callable[[str], None] = print):
+    """
+    Print leak findings with a recycle recommendation.
+
+    Args:
+        leaks: Result of LeakDetector.find_leaks
+        write: Line writer, such as a terminal reporter's write_line
+    """
+    for leak in leaks:
+        write(
+            f"{leak['worker']}: {leak['metric']} grew on {leak['tests']} consecutive tests "
+            f"(+{_format_bytes(leak['growth'])}, {leak['relative']:+.0%}) from {leak['first']} to {leak['last']}"
+        )
+        if leak["metric"] in BROWSER_METRICS:
+            write(f"   recommendation: recycle the browser every {leak['recycle_after']} test(s) on this worker")
+        else:
+            write(f"   recommendation: restart the worker every {leak['recycle_after']} test(s) "
+                  f"or look for state kept between tests")
@@ -0,0 +1,157 @@
+"""
+Browser performance metrics collection.
+Reads Navigation Timing, paint timing and long tasks from the page so steps
+can assert on latency budgets. Client-side route changes, such as login to
+inventory, fire no navigation entry; they are timed from a performance mark
+set before the triggering click until a selector of the new view appears.
+"""
+from typing import Any, Dict, List, Optional
+
+
+# Installed on every context so long tasks are buffered from the first paint
+LONG_TASK_OBSERVER_SCRIPT = """
+(() => {
+    window.__longTasks = [];
+    try {
+        new PerformanceObserver((list) => {
+            for (const entry of list.getEntries()) {
+                window.__longTasks.push({ start: entry.startTime, duration: entry.duration });
+            }
+        }).observe({ type: "longtask", buffered: true });
+    } catch (e) {
+        // Long task API is Chromium-only
+    }
+})();
+"""
+
+# Single evaluation returning every metric the framework asserts on
+PERFORMANCE_METRICS_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType("navigation")[0];
+    const paint = {};
+    for (const entry of performance.getEntriesByType("paint")) {
+        paint[entry.name] = entry.startTime;
+    }
+    return {
+        url: location.href,
+        navigation: nav ? {
+            ttfb_ms: nav.responseStart - nav.requestStart,
+            response_end_ms: nav.responseEnd,
+            dom_content_loaded_ms: nav.domContentLoadedEventEnd,
+            load_event_ms: nav.loadEventEnd,
+            transfer_size: nav.transferSize
+        } : null,
+        paint: {
+            first_paint_ms: paint["first-paint"] ?? null,
+            first_contentful_paint_ms: paint["first-contentful-paint"] ?? null
+        },
+        long_tasks: window.__longTasks || []
+    };
+}
+"""
+
+
+# Clears and sets a performance mark before an action that starts a route change
+MARK_TRANSITION_SCRIPT = """
+(name) => {
+    performance.clearMarks(name);
+    performance.mark(name);
+}
+"""
+
+# Resolves with the milliseconds from the mark until the selector appears, or null on timeout.
+# Without the mark, a full navigation replaced the document and timing starts at its navigation.
+TRANSITION_SCRIPT = """
+({ mark, selector, timeout }) => new Promise((resolve) => {
+    const start = performance.getEntriesByName(mark, "mark").pop();
+    const origin = start ? start.startTime : 0;
+    const deadline = Date.now() + timeout;
+    const poll = () => {
+        if (document.querySelector(selector)) return resolve(performance.now() - origin);
+        if (Date.now() > deadline) return resolve(null);
+        requestAnimationFrame(poll);
+    };
+    poll();
+})
+"""
+
+
+def simulated_transition_ms(operation_log: List[tuple], marked_at: float) -> float:
+    """
+    Time a route change from client operation timings when no real page exists.
+
+    Args:
+        operation_log: (operation, started, duration) tuples recorded by the client
+        marked_at: time.time() when the transition was marked
+
+    Returns:
+        float: Milliseconds from the mark to the end of the last operation after it
+    """
+    ended = max((started + duration for _operation, started, duration in operation_log if started >= marked_at),
+                default=marked_at)
+    return (ended - marked_at) * 1000
+
+
+def simulated_metrics(operation_log: List[tuple]) -> Dict[str, Any]:
+    """
+    Derive metrics from client operation timings when no real page exists.
+
+    The most recent navigation or click stands in for the page load.
+
+    Args:
+        operation_log: (operation, started, duration) tuples recorded by the client
+
+    Returns:
+        Dict[str, Any]: Metrics in the same shape as PERFORMANCE_METRICS_SCRIPT
+    """
+    load_ms = 0.0
+    for operation, _started, duration in reversed(operation_log):
+        if operation in ("navigate", "click"):
+            load_ms = duration * 1000
+            break
+    return {
+        "url": None,
+        "source": "simulation",
+        "navigation": {
+            "ttfb_ms": load_ms * 0.2,
+            "response_end_ms": load_ms * 0.4,
+            "dom_content_loaded_ms": load_ms * 0.8,
+            "load_event_ms": load_ms,
+            "transfer_size": 0
+        },
+        "paint": {
+            "first_paint_ms": load_ms * 0.5,
+            "first_contentful_paint_ms": load_ms * 0.6
+        },
+        "long_tasks": []
+    }
+
+
+def page_load_ms(metrics: Optional[Dict[str, Any]]) -> Optional[float]:
+    """
+    Get the load event time from collected metrics.
+
+    Args:
+        metrics: Collected metrics
+
+    Returns:
+        float: Milliseconds until the load event ended, or None if unavailable
+    """
+    if not metrics or not metrics.get("navigation"):
+        return None
+    return metrics["navigation"]["load_event_ms"]
+
+
+def longest_task_ms(metrics: Optional[Dict[str, Any]]) -> float:
+    """
+    Get the longest long task from collected metrics.
+
+    Args:
+        metrics: Collected metrics
+
+    Returns:
+        float: Longest task duration in milliseconds, 0 if none were observed
+    """
+    if not metrics:
+        return 0.0
+    return max((task["duration"] for task in metrics.get("long_tasks", [])), default=0.0)
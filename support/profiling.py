@@ -0,0 +1,299 @@
+"""
+Sampling CPU profiler for individual tests.
+A background thread reads the test thread's stack through
+sys._current_frames() every few milliseconds, so the test itself runs
+uninstrumented. Samples are kept as collapsed stacks ("a;b;c count"), which
+are written per test as .collapsed and speedscope JSON files, and merged
+over the run into one flamegraph.
+"""
+import html
+import json
+import os
+import sys
+import threading
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from support.artifact_paths import safe_test_name
+
+
+PROFILE_ENV = "PROFILE_TESTS"  # "all" or comma-separated node id substrings
+PROFILES_DIR = os.getenv("PROFILES_DIR", "reports/profiles")
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", "0.005"))  # Seconds between samples
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+def profile_selected(nodeid: str, selection: str) -> bool:
+    """
+    Whether a test is selected for profiling.
+
+    Args:
+        nodeid: Test node id
+        selection: "all", or comma-separated substrings of node ids
+
+    Returns:
+        bool: True when the test should be profiled
+    """
+    if not selection:
+        return False
+    if selection == "all":
+        return True
+    return any(part.strip() and part.strip() in nodeid for part in selection.split(","))
+
+
+class SamplingProfiler:
+    """Samples one thread's Python stack at a fixed interval."""
+
+    def __init__(self, thread_id: Optional[int] = None, interval: float = PROFILE_INTERVAL):
+        """
+        Initialize sampling profiler.
+
+        Args:
+            thread_id: Thread to sample (default: the calling thread)
+            interval: Seconds between samples
+        """
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._labels: Dict[object, str] = {}  # code object -> frame label
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start sampling in a daemon thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample_loop, name="test-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        """
+        Stop sampling.
+
+        Returns:
+            Counter: Collapsed stack (root first, ";"-separated) to sample count
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self.stacks
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                break  # Sampled thread has exited
+            self.stacks[self._collapse(frame)] += 1
+
+    def _collapse(self, frame) -> str:
+        """Render a frame and its callers as a root-first collapsed stack."""
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = frame_label(code.co_name, code.co_filename, code.co_firstlineno)
+            labels.append(label)
+            frame = frame.f_back
+        labels.reverse()
+        return ";".join(labels)
+
+
+def frame_label(function: str, filename: str, line: int) -> str:
+    """Frame name with a project-relative path, or the last two path parts for libraries."""
+    if filename.startswith(PROJECT_ROOT + os.sep):
+        path = os.path.relpath(filename, PROJECT_ROOT)
+    else:
+        path = "/".join(Path(filename).parts[-2:])
+    return f"{function} ({path}:{line})".replace(";", ",")
+
+
+def profile_path(test_name: str, directory: str = PROFILES_DIR) -> Path:
+    """
+    Get the profile base path of a test.
+
+    Args:
+        test_name: Test node id
+        directory: Profiles directory
+
+    Returns:
+        Path: <directory>/<sanitised node id>, without extension
+    """
+    safe_name = safe_test_name(test_name)
+    return Path(directory) / safe_name
+
+
+def speedscope_profile(stacks: Dict[str, int], name: str, interval: float = PROFILE_INTERVAL) -> Dict:
+    """
+    Convert collapsed stacks to a speedscope "sampled" profile.
+
+    Identical stacks are stored once, weighted by their sample count.
+
+    Args:
+        stacks: Collapsed stack to sample count
+        name: Profile name shown by speedscope
+        interval: Seconds between samples
+
+    Returns:
+        Dict: speedscope file contents
+    """
+    frames: List[Dict[str, str]] = []
+    frame_index: Dict[str, int] = {}
+    samples, weights = [], []
+    for stack, count in sorted(stacks.items()):
+        sample = []
+        for label in stack.split(";"):
+            if label not in frame_index:
+                frame_index[label] = len(frames)
+                frames.append({"name": label})
+            sample.append(frame_index[label])
+        samples.append(sample)
+        weights.append(count * interval * 1000)
+    return {
+        "$schema": SPEEDSCOPE_SCHEMA,
+        "name": name,
+        "exporter": "run_tests.py --profile",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "milliseconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights
+        }]
+    }
+
+
+def write_profile(stacks: Dict[str, int], base_path: Path, name: str,
+                  interval: float = PROFILE_INTERVAL) -> List[str]:
+    """
+    Write collapsed stacks and a speedscope profile.
+
+    Args:
+        stacks: Collapsed stack to sample count
+        base_path: Output path without extension
+        name: Profile name
+        interval: Seconds between samples
+
+    Returns:
+        List[str]: Written file paths
+    """
+    base_path.parent.mkdir(parents=True, exist_ok=True)
+    collapsed = base_path.with_name(base_path.name + ".collapsed")
+    collapsed.write_text(
+        "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items())), encoding="utf-8"
+    )
+    speedscope = base_path.with_name(base_path.name + ".speedscope.json")
+    speedscope.write_text(json.dumps(speedscope_profile(stacks, name, interval)), encoding="utf-8")
+    return [str(collapsed), str(speedscope)]
+
+
+def read_collapsed(path: str) -> Counter:
+    """
+    Read a collapsed-stacks file.
+
+    Args:
+        path: File written by write_profile
+
+    Returns:
+        Counter: Collapsed stack to sample count
+    """
+    stacks = Counter()
+    with open(path, encoding="utf-8") as collapsed:
+        for line in collapsed:
+            stack, _, count = line.rstrip("\n").rpartition(" ")
+            if stack:
+                stacks[stack] += int(count)
+    return stacks
+
+
+def hot_frames(stacks: Dict[str, int], limit: int = 10) -> List[Tuple[str, int]]:
+    """Frames with the most samples at the top of the stack (self time), highest first."""
+    self_samples = Counter()
+    for stack, count in stacks.items():
+        self_samples[stack.rsplit(";", 1)[-1]] += count
+    return self_samples.most_common(limit)
+
+
+def render_flamegraph(stacks: Dict[str, int], title: str, width: int = 1200, row_height: int = 16) -> str:
+    """
+    Render collapsed stacks as a self-contained SVG flamegraph.
+
+    Frame widths are proportional to sample counts; hover a frame for its
+    full name and share of the samples.
+
+    Args:
+        stacks: Collapsed stack to sample count
+        title: Heading drawn above the graph
+        width: Image width in pixels
+        row_height: Height of one stack level in pixels
+
+    Returns:
+        str: SVG document
+    """
+    root = {"count": 0, "children": {}}
+    for stack, count in stacks.items():
+        node = root
+        node["count"] += count
+        for label in stack.split(";"):
+            node = node["children"].setdefault(label, {"count": 0, "children": {}})
+            node["count"] += count
+    total = root["count"] or 1
+
+    rects = []  # (x, depth, width, label, count)
+    pending = [(root, 0.0, -1)]
+    while pending:
+        node, x, depth = pending.pop()
+        for label, child in sorted(node["children"].items()):
+            child_width = child["count"] / total * width
+            if child_width >= 0.5:  # Narrower frames would not be visible
+                rects.append((x, depth + 1, child_width, label, child["count"]))
+                pending.append((child, x, depth + 1))
+            x += child_width
+
+    levels = max((rect[1] for rect in rects), default=0) + 1
+    height = (levels + 2) * row_height
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" font-family="monospace" font-size="11">',
+        f'<text x="4" y="{row_height - 4}">{html.escape(title)} ({root["count"]} samples)</text>'
+    ]
+    for x, depth, rect_width, label, count in rects:
+        y = height - (depth + 1) * row_height
+        hue = zlib.crc32(label.split(" (")[0].encode()) % 60  # Stable warm colour per function
+        name = html.escape(label)
+        parts.append(
+            f'<g><title>{name}: {count} samples ({count / total:.1%})</title>'
+            f'<rect x="{x:.1f}" y="{y}" width="{rect_width:.1f}" height="{row_height - 1}" '
+            f'fill="hsl({hue}, 80%, 60%)"/>'
+        )
+        characters = int(rect_width / 7)
+        if characters >= 3:
+            text = label if len(label) <= characters else label[:characters - 2] + ".."
+            parts.append(f'<text x="{x + 2:.1f}" y="{y + row_height - 4}">{html.escape(text)}</text>')
+        parts.append("</g>")
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def write_run_profile(stacks: Dict[str, int], directory: str = PROFILES_DIR,
+                      interval: float = PROFILE_INTERVAL) -> List[str]:
+    """
+    Write the merged profile of every profiled test of the run.
+
+    Args:
+        stacks: Collapsed stack to sample count, summed over tests
+        directory: Profiles directory
+        interval: Seconds between samples
+
+    Returns:
+        List[str]: Written file paths (collapsed stacks, speedscope JSON and SVG flamegraph)
+    """
+    written = write_profile(stacks, Path(directory) / "run", "whole run", interval)
+    flamegraph = Path(directory) / "flamegraph.svg"
+    flamegraph.write_text(render_flamegraph(stacks, "Profiled tests"), encoding="utf-8")
+    return written + [str(flamegraph)]
@@ -0,0 +1,137 @@
+"""
+Request-blocking profiles for functional runs.
+Aborts resource types and URL patterns that a profile marks as unneeded
+and counts what was skipped for each test. An aborted request never
+downloads its body, so bytes saved come from the asset cache when it holds
+the URL. Sizing other URLs with a HEAD request after the abort is opt-in,
+since it contacts the hosts the profile is meant to avoid. Sizes are
+remembered per URL for the session.
+"""
+import os
+from fnmatch import fnmatch
+from typing import Callable, Dict, Optional
+
+from TestData.test_data import BLOCKING_PROFILES
+
+
+DEFAULT_BLOCKING_PROFILE = os.getenv("BLOCKING_PROFILE", "functional")
+BLOCKED_SIZE_LOOKUP = os.getenv("BLOCKED_SIZE_LOOKUP", "false").lower() == "true"  # HEAD requests to blocked hosts
+HEAD_TIMEOUT = 5000  # ms allowed for the HEAD request sizing a blocked URL
+
+
+class RequestBlocker:
+    """
+    Playwright route handler that aborts requests matching the active profile.
+
+    One blocker is installed per session; the active profile and statistics
+    are switched per test by the ``blocking_profile`` fixture.
+    """
+
+    def __init__(self, profiles: Dict[str, dict] = BLOCKING_PROFILES,
+                 profile: str = DEFAULT_BLOCKING_PROFILE,
+                 size_hint: Optional[Callable[[str], int]] = None, head_lookup: bool = BLOCKED_SIZE_LOOKUP):
+        """
+        Initialize request blocker.
+
+        Args:
+            profiles: Named blocking profiles
+            profile: Initially active profile name
+            size_hint: Callable returning the known body size for a URL, or 0 when unknown
+            head_lookup: Size URLs the hint does not know from the Content-Length of a HEAD request
+        """
+        self.profiles = profiles
+        self.size_hint = size_hint
+        self.head_lookup = head_lookup
+        self._sizes: Dict[str, int] = {}  # url -> body size, for the whole session
+        self.profile = None
+        self.stats = {}
+        self.use_profile(profile)
+
+    def use_profile(self, name: str):
+        """
+        Activate a blocking profile and reset statistics.
+
+        Args:
+            name: Profile name (functional, visual, full)
+        """
+        if name not in self.profiles:
+            raise ValueError(f"Unknown blocking profile '{name}'. Available: {', '.join(self.profiles)}")
+        self.profile = name
+        self._resource_types = set(self.profiles[name]["resource_types"])
+        self._url_patterns = list(self.profiles[name]["url_patterns"])
+        self.stats = {
+            "profile": name,
+            "blocked_requests": 0,
+            "blocked_bytes": 0,
+            "by_type": {}
+        }
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """
+        Check whether a request is blocked by the active profile.
+
+        Args:
+            resource_type: Playwright resource type (image, font, script, ...)
+            url: Request URL
+
+        Returns:
+            bool: True if the request should be aborted
+        """
+        if resource_type in self._resource_types:
+            return True
+        return any(fnmatch(url, pattern) for pattern in self._url_patterns)
+
+    def record_blocked(self, resource_type: str, url: str, size: int = 0):
+        """
+        Count a blocked request.
+
+        Args:
+            resource_type: Playwright resource type
+            url: Request URL
+            size: Body size the request would have downloaded, 0 if unknown
+        """
+        self.stats["blocked_requests"] += 1
+        self.stats["by_type"][resource_type] = self.stats["by_type"].get(resource_type, 0) + 1
+        self.stats["blocked_bytes"] += size
+
+    async def blocked_size(self, route) -> int:
+        """
+        Body size of a blocked request's URL.
+
+        Args:
+            route: Playwright Route of the aborted request
+
+        Returns:
+            int: Size from the asset cache or a HEAD request's Content-Length, 0 if unknown
+        """
+        url = route.request.url
+        if url not in self._sizes:
+            size = self.size_hint(url) if self.size_hint is not None else 0
+            if not size and self.head_lookup:
+                try:
+                    response = await route.request.frame.page.context.request.head(url, timeout=HEAD_TIMEOUT)
+                    size = int(response.headers.get("content-length", 0))
+                except Exception:
+                    size = 0  # No frame (service worker request), unreachable host or no length
+            self._sizes[url] = size
+        return self._sizes[url]
+
+    async def handle_route(self, route):
+        """
+        Abort blocked requests; pass everything else to the next handler.
+
+        The request is aborted before its size is looked up, so the page never
+        waits for a HEAD request. Its bytes go to the statistics of the test
+        that made it, even when the lookup finishes after that test.
+
+        Args:
+            route: Playwright Route object
+        """
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            stats = self.stats
+            await route.abort("blockedbyclient")
+            self.record_blocked(request.resource_type, request.url)
+            stats["blocked_bytes"] += await self.blocked_size(route)
+        else:
+            await route.fallback()
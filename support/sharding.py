@@ -0,0 +1,139 @@
+"""
+Duration-balanced test sharding for CI.
+Splits the collected tests across n shards with the longest-processing-time
+rule: tests are taken longest first and each goes to the shard with the
+least estimated work so far. Costs come from the test history, falling back
+to scenario step counts, so every shard job computes the same split.
+"""
+import heapq
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+SHARD_ENV = "TEST_SHARD"
+SHARD_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+DEFAULT_SECONDS_PER_STEP = 1.0  # Used when no test has history yet
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification.
+
+    Args:
+        spec: "i/n" with 1 <= i <= n
+
+    Returns:
+        Tuple[int, int]: (i, n)
+
+    Raises:
+        ValueError: The specification is malformed or out of range
+    """
+    match = SHARD_PATTERN.match(spec or "")
+    if match is None:
+        raise ValueError(f"Invalid shard '{spec}'. Expected i/n, for example 2/4")
+    index, count = int(match.group(1)), int(match.group(2))
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{spec}'. The shard number must be between 1 and {count}")
+    return index, count
+
+
+def scenario_step_count(item) -> int:
+    """
+    Number of Gherkin steps (background included) behind a pytest-bdd test item.
+
+    Args:
+        item: Collected pytest item
+
+    Returns:
+        int: Step count, or 1 for tests that are not generated from a scenario
+    """
+    scenario = getattr(getattr(item, "obj", None), "__scenario__", None)
+    try:
+        steps = getattr(scenario, "steps", None) or getattr(scenario, "_steps", None) or ()
+        return max(1, len(steps))
+    except TypeError:
+        return 1
+
+
+def estimate_costs(step_counts: Dict[str, int], durations: Dict[str, float]) -> Dict[str, float]:
+    """
+    Estimate the run time of every test in seconds.
+
+    Tests with history use their median duration. The rest are priced by
+    step count at the seconds-per-step rate of the tests with history.
+
+    Args:
+        step_counts: Node id to step count
+        durations: Node id to historical median duration
+
+    Returns:
+        Dict[str, float]: Node id to estimated seconds
+    """
+    known = [nodeid for nodeid in step_counts if nodeid in durations]
+    known_steps = sum(step_counts[nodeid] for nodeid in known)
+    seconds_per_step = (
+        sum(durations[nodeid] for nodeid in known) / known_steps if known_steps else DEFAULT_SECONDS_PER_STEP
+    )
+    return {
+        nodeid: durations[nodeid] if nodeid in durations else steps * seconds_per_step
+        for nodeid, steps in step_counts.items()
+    }
+
+
+def assign_shards(costs: Dict[str, float], count: int) -> Dict[str, int]:
+    """
+    Assign tests to shards, longest first, each to the least-loaded shard.
+
+    Ties are broken by node id and shard number, so the result depends only
+    on the inputs.
+
+    Args:
+        costs: Node id to estimated seconds
+        count: Number of shards
+
+    Returns:
+        Dict[str, int]: Node id to 1-based shard number
+    """
+    loads = [(0.0, shard) for shard in range(1, count + 1)]
+    assignment = {}
+    for nodeid in sorted(costs, key=lambda nodeid: (-costs[nodeid], nodeid)):
+        load, shard = heapq.heappop(loads)
+        assignment[nodeid] = shard
+        heapq.heappush(loads, (load + costs[nodeid], shard))
+    return assignment
+
+
+def shard_loads(costs: Dict[str, float], assignment: Dict[str, int], count: int) -> List[float]:
+    """Estimated seconds of work per shard, in shard order."""
+    loads = [0.0] * count
+    for nodeid, shard in assignment.items():
+        loads[shard - 1] += costs[nodeid]
+    return loads
+
+
+def select_shard(items: Iterable, spec: str, durations: Optional[Dict[str, float]] = None) -> Tuple[list, list, Dict]:
+    """
+    Split collected items into this shard's tests and the rest.
+
+    Args:
+        items: Collected pytest items
+        spec: Shard specification "i/n"
+        durations: Historical median durations by node id
+
+    Returns:
+        Tuple: (selected items, deselected items, summary with shard, count, tests and loads)
+    """
+    index, count = parse_shard(spec)
+    items = list(items)
+    costs = estimate_costs({item.nodeid: scenario_step_count(item) for item in items}, durations or {})
+    assignment = assign_shards(costs, count)
+    selected = [item for item in items if assignment[item.nodeid] == index]
+    deselected = [item for item in items if assignment[item.nodeid] != index]
+    summary = {
+        "shard": index,
+        "count": count,
+        "tests": len(selected),
+        "loads": shard_loads(costs, assignment, count),
+        "history": sum(1 for item in items if item.nodeid in (durations or {}))
+    }
+    return selected, deselected, summary
@@ -0,0 +1,159 @@
+"""
+Stub MCP server for offline transport tests and benchmarks.
+Speaks newline-delimited JSON-RPC on stdin/stdout, answers tool calls
+concurrently after a configurable latency and honours notifications/cancelled.
+Page actions are answered with an ARIA snapshot of a small inventory page,
+formatted like Playwright MCP's, whose cart badge counts the clicks. Each
+tab keeps its own URL and clicks; actions apply to the selected tab.
+
+Run with: python support/stub_mcp_server.py --latency-ms 5
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from typing import Any, Dict
+
+
+TOOLS = [
+    "browser_navigate", "browser_click", "browser_type", "browser_select_option",
+    "browser_evaluate", "browser_snapshot", "browser_take_screenshot", "browser_close",
+    "browser_tab_new", "browser_tab_select", "browser_tab_close"
+]
+SNAPSHOT_TOOLS = (
+    "browser_navigate", "browser_click", "browser_type", "browser_select_option", "browser_evaluate", "browser_snapshot"
+)
+INVENTORY_ITEMS = 50
+
+
+class StubMCPServer:
+    """Minimal MCP server that echoes tool calls."""
+
+    def __init__(self, latency_ms: float = 0.0):
+        """
+        Initialize stub server.
+
+        Args:
+            latency_ms: Delay before each tool call is answered
+        """
+        self.latency = latency_ms / 1000
+        self._write_lock = threading.Lock()
+        self._cancelled = set()
+        self._state_lock = threading.Lock()
+        self.tabs = []  # {"url", "clicks"} per open tab
+        self.current = 0  # Index of the selected tab
+
+    def tab(self) -> Dict[str, Any]:
+        """Selected tab, opened on first use like Playwright MCP does."""
+        if not self.tabs:
+            self.tabs.append({"url": "about:blank", "clicks": 0})
+            self.current = 0
+        return self.tabs[self.current]
+
+    def apply(self, name: str, arguments: Dict[str, Any]):
+        """Apply a tool call to the tab state."""
+        if name == "browser_tab_new":
+            self.tabs.append({"url": arguments.get("url", "about:blank"), "clicks": 0})
+            self.current = len(self.tabs) - 1
+        elif name == "browser_tab_select":
+            self.current = arguments["index"]
+            self.tab()
+        elif name == "browser_tab_close":
+            if self.tabs:
+                self.tabs.pop(arguments.get("index", self.current))
+                self.current = min(self.current, max(len(self.tabs) - 1, 0))
+        elif name == "browser_close":
+            self.tabs = []
+        elif name == "browser_navigate":
+            self.tab()["url"] = arguments.get("url", self.tab()["url"])
+        elif name == "browser_click":
+            self.tab()["clicks"] += 1
+
+    def page_state(self) -> str:
+        """Render the page URL and ARIA snapshot the way Playwright MCP appends them to tool results."""
+        tab = self.tab()
+        lines = [
+            "- generic [ref=e1]:",
+            '  - heading "Swag Labs" [level=1] [ref=e2]',
+            '  - link "Cart" [ref=e3]:',
+            f"    - text: \"{tab['clicks']}\"",
+            '  - text: "Products"',
+            "  - list [ref=e4]:"
+        ]
+        for index in range(INVENTORY_ITEMS):
+            lines.append(f'    - listitem [ref=e{5 + 2 * index}]:')
+            lines.append(f'      - button "Add to cart item {index}" [ref=e{6 + 2 * index}]')
+        snapshot = "\n".join(lines)
+        return f"### Page state\n- Page URL: {tab['url']}\n- Page Snapshot:\n```yaml\n{snapshot}\n```"
+
+    def _send(self, message: Dict[str, Any]):
+        """Write one JSON-RPC message to stdout."""
+        with self._write_lock:
+            sys.stdout.write(json.dumps(message, separators=(",", ":")) + "\n")
+            sys.stdout.flush()
+
+    def _answer_tool_call(self, request_id: Any, params: Dict[str, Any]):
+        """Answer a tools/call after the configured latency unless it was cancelled."""
+        name = params.get("name")
+        arguments = params.get("arguments", {})
+        # The sleep tool lets tests hold a request open to exercise timeouts
+        time.sleep(arguments.get("ms", 0) / 1000 if name == "sleep" else self.latency)
+        if request_id in self._cancelled:
+            self._cancelled.discard(request_id)
+            return
+        if name not in TOOLS and name != "sleep":
+            result = {"content": [{"type": "text", "text": f"Unknown tool: {name}"}], "isError": True}
+        else:
+            text = json.dumps({"tool": name, "arguments": arguments})
+            with self._state_lock:
+                self.apply(name, arguments)
+                if name in SNAPSHOT_TOOLS:
+                    text = f"### Result\n{text}\n\n{self.page_state()}"
+            result = {"content": [{"type": "text", "text": text}]}
+        self._send({"jsonrpc": "2.0", "id": request_id, "result": result})
+
+    def handle(self, message: Dict[str, Any]):
+        """Dispatch one incoming message."""
+        method = message.get("method")
+        request_id = message.get("id")
+        if method == "notifications/cancelled":
+            self._cancelled.add(message.get("params", {}).get("requestId"))
+        elif method == "initialize":
+            self._send({"jsonrpc": "2.0", "id": request_id, "result": {
+                "protocolVersion": message.get("params", {}).get("protocolVersion"),
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": "stub-mcp-server", "version": "1.0"}
+            }})
+        elif method == "tools/list":
+            self._send({"jsonrpc": "2.0", "id": request_id, "result": {
+                "tools": [{"name": name, "inputSchema": {"type": "object"}} for name in TOOLS + ["sleep"]]
+            }})
+        elif method == "tools/call":
+            threading.Thread(
+                target=self._answer_tool_call, args=(request_id, message.get("params", {})), daemon=True
+            ).start()
+        elif method == "ping":
+            self._send({"jsonrpc": "2.0", "id": request_id, "result": {}})
+        elif request_id is not None:
+            self._send({"jsonrpc": "2.0", "id": request_id,
+                        "error": {"code": -32601, "message": f"Method not found: {method}"}})
+
+    def serve(self):
+        """Serve until stdin is closed."""
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                self.handle(json.loads(line))
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Stub MCP server for offline transport tests")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay before answering each tool call")
+    args = parser.parse_args()
+    StubMCPServer(args.latency_ms).serve()
+
+
+if __name__ == "__main__":
+    main()
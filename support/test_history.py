@@ -0,0 +1,401 @@
+"""
+Local SQLite history of test, step and MCP-operation timings.
+Every run appends its results so trends, regressions, scheduling and
+timeouts can be derived from past runs.
+"""
+import functools
+import os
+import sqlite3
+import statistics
+import subprocess
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# History configuration
+TEST_HISTORY_DB = os.getenv("TEST_HISTORY_DB", "reports/test_history.db")
+RUN_ID_ENV = "TEST_RUN_ID"
+FLAKY_THRESHOLD = float(os.getenv("FLAKY_THRESHOLD", "0.2"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started REAL NOT NULL,
+    git_revision TEXT
+);
+CREATE TABLE IF NOT EXISTS test_results (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    worker TEXT,
+    git_revision TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS step_results (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    step TEXT NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS mcp_operations (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    calls INTEGER NOT NULL,
+    total_duration REAL NOT NULL,
+    max_duration REAL NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS memory_samples (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    worker TEXT,
+    browser_rss INTEGER,
+    js_heap_used INTEGER,
+    py_peak INTEGER,
+    py_current INTEGER,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_test_results_nodeid ON test_results(nodeid, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_test_results_run ON test_results(run_id);
+CREATE INDEX IF NOT EXISTS idx_step_results_step ON step_results(step, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_mcp_operations_operation ON mcp_operations(operation, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_memory_samples_run ON memory_samples(run_id, worker, recorded_at);
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def current_git_revision() -> Optional[str]:
+    """
+    Get the git revision under test.
+
+    Returns:
+        str: Commit hash, or None outside a git checkout
+    """
+    if os.getenv("GITHUB_SHA"):
+        return os.getenv("GITHUB_SHA")
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5, check=True
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def current_run_id() -> str:
+    """
+    Get the id shared by the controller and all workers of this run.
+
+    Returns:
+        str: Run id, created and published on first use
+    """
+    if not os.getenv(RUN_ID_ENV):
+        os.environ[RUN_ID_ENV] = time.strftime("%Y%m%d-%H%M%S-") + uuid.uuid4().hex[:8]
+    return os.environ[RUN_ID_ENV]
+
+
+class RunHistory:
+    """SQLite store of per-run test, step and MCP-operation timings."""
+
+    def __init__(self, path: str = TEST_HISTORY_DB):
+        """
+        Initialize run history.
+
+        Args:
+            path: SQLite database file
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def start_run(self, run_id: str, git_revision: Optional[str]):
+        """
+        Register a run.
+
+        Args:
+            run_id: Run id
+            git_revision: Commit hash under test
+        """
+        with self._db:
+            self._db.execute(
+                "INSERT OR IGNORE INTO runs VALUES (?, ?, ?)", (run_id, time.time(), git_revision)
+            )
+
+    def record_test(self, run_id: str, nodeid: str, outcome: str, duration: float,
+                    worker: Optional[str] = None, git_revision: Optional[str] = None,
+                    steps: Iterable[Dict[str, Any]] = (),
+                    operations: Optional[Dict[str, Dict[str, float]]] = None,
+                    memory: Optional[Dict[str, Any]] = None):
+        """
+        Append one test result with its steps, MCP operations and memory sample.
+
+        Args:
+            run_id: Run id
+            nodeid: Test node id
+            outcome: passed, failed, error, skipped or rerun
+            duration: Test duration in seconds
+            worker: xdist worker id
+            git_revision: Commit hash under test
+            steps: Step records with step, duration and error keys
+            operations: Operation name to calls/total/max aggregates
+            memory: Memory sample with browser_rss, js_heap_used, py_peak and py_current bytes
+        """
+        now = time.time()
+        with self._db:
+            self._db.execute(
+                "INSERT INTO test_results (run_id, nodeid, outcome, duration, worker, git_revision, recorded_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (run_id, nodeid, outcome, duration, worker, git_revision, now)
+            )
+            self._db.executemany(
+                "INSERT INTO step_results (run_id, nodeid, step, duration, outcome, recorded_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, nodeid, step["step"], step["duration"], "failed" if step.get("error") else "passed", now)
+                    for step in steps
+                ]
+            )
+            self._db.executemany(
+                "INSERT INTO mcp_operations (run_id, nodeid, operation, calls, total_duration, max_duration, recorded_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, nodeid, operation, stats["calls"], stats["total"], stats["max"], now)
+                    for operation, stats in (operations or {}).items()
+                ]
+            )
+            if memory:
+                self._db.execute(
+                    "INSERT INTO memory_samples (run_id, nodeid, worker, browser_rss, js_heap_used, py_peak, py_current,"
+                    " recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (run_id, nodeid, worker, memory.get("browser_rss"), memory.get("js_heap_used"),
+                     memory.get("py_peak"), memory.get("py_current"), now)
+                )
+
+    def durations(self, nodeid: str, limit: int = 20, exclude_run: Optional[str] = None,
+                  outcomes: tuple = ("passed",)) -> List[float]:
+        """
+        Get the most recent durations of a test, newest first.
+
+        Args:
+            nodeid: Test node id
+            limit: Maximum number of results
+            exclude_run: Run id to leave out (usually the current run)
+            outcomes: Outcomes to include
+
+        Returns:
+            List[float]: Durations in seconds
+        """
+        placeholders = ",".join("?" * len(outcomes))
+        rows = self._db.execute(
+            f"SELECT duration FROM test_results WHERE nodeid = ? AND run_id != ? AND outcome IN ({placeholders})"
+            " ORDER BY recorded_at DESC, id DESC LIMIT ?",
+            (nodeid, exclude_run or "", *outcomes, limit)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def median_durations(self, exclude_run: Optional[str] = None, limit: int = 20) -> Dict[str, float]:
+        """
+        Get the median recent passing duration of every known test.
+
+        Args:
+            exclude_run: Run id to leave out (usually the current run)
+            limit: Number of recent results per test
+
+        Returns:
+            Dict[str, float]: Node id to median duration in seconds
+        """
+        nodeids = [row[0] for row in self._db.execute("SELECT DISTINCT nodeid FROM test_results")]
+        medians = {}
+        for nodeid in nodeids:
+            durations = self.durations(nodeid, limit, exclude_run)
+            if durations:
+                medians[nodeid] = statistics.median(durations)
+        return medians
+
+    def expected_duration(self, nodeid: str, exclude_run: Optional[str] = None) -> Optional[float]:
+        """
+        Get the expected duration of a test from its recent history.
+
+        Args:
+            nodeid: Test node id
+            exclude_run: Run id to leave out
+
+        Returns:
+            float: Median recent duration in seconds, or None without history
+        """
+        durations = self.durations(nodeid, exclude_run=exclude_run)
+        return statistics.median(durations) if durations else None
+
+    def suggested_timeout(self, nodeid: str, factor: float = 3.0, floor: float = 30.0,
+                          exclude_run: Optional[str] = None) -> float:
+        """
+        Suggest a timeout for a test from the slowest of its recent passes.
+
+        Args:
+            nodeid: Test node id
+            factor: Multiple of the slowest recent duration
+            floor: Minimum timeout in seconds
+            exclude_run: Run id to leave out
+
+        Returns:
+            float: Timeout in seconds
+        """
+        durations = self.durations(nodeid, exclude_run=exclude_run)
+        return max(floor, factor * max(durations)) if durations else floor
+
+    def detect_regressions(self, threshold: float = 0.25, recent_runs: int = 5, baseline_runs: int = 20,
+                           min_samples: int = 3) -> List[Dict[str, Any]]:
+        """
+        Flag tests whose recent median duration regressed against a rolling baseline.
+
+        Args:
+            threshold: Relative slowdown that counts as a regression (0.25 = 25%)
+            recent_runs: Number of newest passing results forming the recent window
+            baseline_runs: Number of passing results before the window forming the baseline
+            min_samples: Minimum results required in each window
+
+        Returns:
+            List[Dict[str, Any]]: Regressions sorted by relative change, largest first
+        """
+        regressions = []
+        nodeids = [row[0] for row in self._db.execute("SELECT DISTINCT nodeid FROM test_results")]
+        for nodeid in nodeids:
+            durations = self.durations(nodeid, limit=recent_runs + baseline_runs)
+            recent, baseline = durations[:recent_runs], durations[recent_runs:]
+            if len(recent) < min_samples or len(baseline) < min_samples:
+                continue
+            recent_median = statistics.median(recent)
+            baseline_median = statistics.median(baseline)
+            if baseline_median <= 0:
+                continue
+            change = (recent_median - baseline_median) / baseline_median
+            if change > threshold:
+                regressions.append({
+                    "nodeid": nodeid,
+                    "baseline_median": baseline_median,
+                    "recent_median": recent_median,
+                    "change": change,
+                    "samples": len(durations)
+                })
+        return sorted(regressions, key=lambda regression: regression["change"], reverse=True)
+
+    def flakiness_scores(self, window: int = 20, min_runs: int = 3,
+                         exclude_run: Optional[str] = None) -> Dict[str, float]:
+        """
+        Score every test by how often it flaked in its recent runs.
+
+        A run counts as flaky when the test failed and then passed on retry within
+        the run, or when its final outcome differs from the previous run on the
+        same git revision.
+
+        Args:
+            window: Number of recent runs per test to consider
+            min_runs: Minimum runs before a test is scored
+            exclude_run: Run id to leave out (usually the current run)
+
+        Returns:
+            Dict[str, float]: Node id to fraction of flaky runs (0.0 to 1.0)
+        """
+        rows = self._db.execute(
+            "SELECT nodeid, run_id, git_revision, outcome FROM test_results"
+            " WHERE run_id != ? AND outcome IN ('passed', 'failed', 'error', 'rerun')"
+            " ORDER BY nodeid, recorded_at, id",
+            (exclude_run or "",)
+        ).fetchall()
+
+        # nodeid -> ordered [run_id, git_revision, outcomes]
+        runs: Dict[str, List[list]] = {}
+        for nodeid, run_id, git_revision, outcome in rows:
+            test_runs = runs.setdefault(nodeid, [])
+            if not test_runs or test_runs[-1][0] != run_id:
+                test_runs.append([run_id, git_revision, []])
+            test_runs[-1][2].append(outcome)
+
+        scores = {}
+        for nodeid, test_runs in runs.items():
+            test_runs = test_runs[-window:]
+            if len(test_runs) < min_runs:
+                continue
+            flaky = 0
+            previous = None
+            for _run_id, git_revision, outcomes in test_runs:
+                final = outcomes[-1]
+                passed_on_retry = "rerun" in outcomes and final == "passed"
+                flipped = (
+                    previous is not None and previous[0] == git_revision and git_revision is not None
+                    and (previous[1] == "passed") != (final == "passed")
+                )
+                if passed_on_retry or flipped:
+                    flaky += 1
+                previous = (git_revision, final)
+            scores[nodeid] = flaky / len(test_runs)
+        return scores
+
+    def flaky_tests(self, threshold: float = FLAKY_THRESHOLD, exclude_run: Optional[str] = None) -> List[str]:
+        """
+        Get the tests whose flakiness score exceeds a threshold.
+
+        Args:
+            threshold: Score above which a test is quarantined
+            exclude_run: Run id to leave out (usually the current run)
+
+        Returns:
+            List[str]: Node ids, most flaky first
+        """
+        scores = self.flakiness_scores(exclude_run=exclude_run)
+        flaky = [nodeid for nodeid, score in scores.items() if score > threshold]
+        return sorted(flaky, key=lambda nodeid: scores[nodeid], reverse=True)
+
+    def close(self):
+        """Close the database."""
+        self._db.close()
+
+
+def aggregate_operations(operation_log: Iterable[tuple]) -> Dict[str, Dict[str, float]]:
+    """
+    Aggregate client operation timings per operation.
+
+    Args:
+        operation_log: (operation, started, duration) tuples
+
+    Returns:
+        Dict[str, Dict[str, float]]: Operation name to calls, total and max duration
+    """
+    aggregates: Dict[str, Dict[str, float]] = {}
+    for operation, _started, duration in operation_log:
+        stats = aggregates.setdefault(operation, {"calls": 0, "total": 0.0, "max": 0.0})
+        stats["calls"] += 1
+        stats["total"] += duration
+        stats["max"] = max(stats["max"], duration)
+    return aggregates
+
+
+def print_perf_report(history: RunHistory, threshold: float = 0.25):
+    """
+    Print duration regressions found in the history.
+
+    Args:
+        history: Run history to analyse
+        threshold: Relative slowdown that counts as a regression
+    """
+    regressions = history.detect_regressions(threshold=threshold)
+    if not regressions:
+        print(f"✅ No test regressed more than {threshold:.0%} against its baseline")
+        return
+    print(f"🐢 {len(regressions)} test(s) regressed more than {threshold:.0%}:")
+    print(f"{'change':>8}{'baseline s':>12}{'recent s':>10}  test")
+    for regression in regressions:
+        print(f"{regression['change']:>+8.0%}{regression['baseline_median']:>12.2f}"
+              f"{regression['recent_median']:>10.2f}  {regression['nodeid']}")
@@ -0,0 +1,145 @@
+"""
+Multi-pattern page-text index.
+Scans one capture of the page text for every expected text at once
+(Aho-Corasick) so repeated text assertions on an unchanged page are
+dictionary lookups instead of browser round trips.
+"""
+import functools
+import re
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+from TestData.test_data import EXPECTED_TEXTS
+
+
+FEATURES_DIR = Path(__file__).resolve().parent.parent / "features"
+STEP_LITERAL_PATTERN = re.compile(r'"([^"]+)"')
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton reporting which patterns occur in a text."""
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Build the automaton.
+
+        Args:
+            patterns: Substrings to search for; empty strings and duplicates are ignored
+        """
+        self.patterns: List[str] = list(dict.fromkeys(pattern for pattern in patterns if pattern))
+        self.pattern_set: Set[str] = set(self.patterns)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for index, pattern in enumerate(self.patterns):
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = next_node
+            self._output[node].append(index)
+
+        # Breadth-first so every failure target is finished before its dependants
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def search(self, text: str) -> Set[str]:
+        """
+        Find every pattern occurring in a text with one pass over it.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set[str]: Patterns found
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Set[int] = set()
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+                if len(found) == len(self.patterns):
+                    break
+        return {self.patterns[index] for index in found}
+
+
+class PageTextIndex:
+    """Answers substring queries against one capture of the page text."""
+
+    def __init__(self, text: str, automaton: AhoCorasick, version: int):
+        """
+        Index a page-text capture.
+
+        Args:
+            text: Captured page text
+            automaton: Automaton over the known expected texts
+            version: Page version the text was captured at
+        """
+        self.text = text
+        self.version = version
+        self.automaton = automaton
+        self._found = automaton.search(text)
+        self._adhoc: Dict[str, bool] = {}
+
+    def contains(self, pattern: str) -> bool:
+        """
+        Check whether the captured text contains a substring.
+
+        Known patterns were answered by the initial scan; other patterns fall
+        back to a substring search whose result is memoised.
+
+        Args:
+            pattern: Text to look for
+
+        Returns:
+            bool: True if the text occurs in the capture
+        """
+        if pattern in self.automaton.pattern_set:
+            return pattern in self._found
+        result = self._adhoc.get(pattern)
+        if result is None:
+            result = self._adhoc[pattern] = pattern in self.text
+        return result
+
+
+def step_literals(features_dir: Path = FEATURES_DIR) -> List[str]:
+    """
+    Collect quoted literals from feature files, such as the texts in 'verify page has text' steps.
+
+    Args:
+        features_dir: Directory holding .feature files
+
+    Returns:
+        List[str]: Quoted literals in file order
+    """
+    literals = []
+    for feature in sorted(features_dir.glob("*.feature")):
+        for line in feature.read_text(encoding="utf-8").splitlines():
+            literals.extend(STEP_LITERAL_PATTERN.findall(line))
+    return literals
+
+
+@functools.lru_cache(maxsize=1)
+def default_automaton() -> AhoCorasick:
+    """Automaton over TestData.EXPECTED_TEXTS and feature-file literals, built once per process."""
+    return AhoCorasick(list(EXPECTED_TEXTS.values()) + step_literals())
@@ -0,0 +1,128 @@
+"""
+Data-driven login matrix over TestData.TEST_USERS.
+Expands one example row per user profile and runs all rows concurrently,
+each in its own client and browser context, within a single worker.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+from mcp_integration import (
+    MCPPlaywrightClient, mcp_client, mcp_initialize_browser, mcp_close_browser, mcp_disconnect,
+    close_thread_loop
+)
+from pages.login_page import LoginPage
+from TestData.models import User
+from TestData.test_data import EXPECTED_TEXTS, TEST_USERS
+
+
+def expected_login_error(user: User) -> Optional[str]:
+    """
+    Get the error a user's login is expected to show.
+
+    Args:
+        user: User profile
+
+    Returns:
+        Optional[str]: Error text from EXPECTED_TEXTS, or None when login should succeed
+    """
+    if user.expected_result == "locked":
+        return EXPECTED_TEXTS["error_locked_user"]
+    if user.expected_result != "failed":
+        return None
+    if not user.username:
+        return EXPECTED_TEXTS["error_username_required"]
+    if not user.password:
+        return EXPECTED_TEXTS["error_password_required"]
+    return EXPECTED_TEXTS["error_invalid_credentials"]
+
+
+def expand_user_examples(users: Iterable[User] = TEST_USERS) -> List[Dict[str, str]]:
+    """
+    Expand test users into Scenario Outline style example rows.
+
+    Args:
+        users: User profiles
+
+    Returns:
+        List[Dict[str, str]]: One row per profile with user_key, username, password,
+        expected_result and expected_error
+    """
+    return [
+        {
+            "user_key": user.key,
+            "username": user.username,
+            "password": user.password,
+            "expected_result": user.expected_result,
+            "expected_error": expected_login_error(user)
+        }
+        for user in users
+    ]
+
+
+def run_login_example(row: Dict[str, str], browser_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Run one login example in an isolated client and context.
+
+    Args:
+        row: Example row from expand_user_examples()
+        browser_config: Browser configuration from the browser_config fixture
+
+    Returns:
+        Dict[str, Any]: The row extended with passed, duration and error
+    """
+    browser_config = browser_config or {}
+    client = MCPPlaywrightClient()
+    client.route_handlers = list(mcp_client.route_handlers)
+    result = dict(row, passed=False, duration=0.0, error=None)
+    started = time.time()
+    try:
+        mcp_initialize_browser(
+            browser_config.get("browser_type", "chromium"),
+            browser_config.get("headless", False),
+            browser_config.get("viewport"),
+            client=client
+        )
+        login_page = LoginPage(client)
+        if not login_page.navigate_to_login_page():
+            result["error"] = "Failed to navigate to login page"
+        elif not login_page.login(row["username"], row["password"]):
+            result["error"] = "Failed to submit login form"
+        elif row["expected_result"] == "success":
+            result["passed"] = login_page.verify_login_successful()
+            if not result["passed"]:
+                result["error"] = "Login was not successful"
+        else:
+            result["passed"] = login_page.verify_login_error(row["expected_error"])
+            if not result["passed"]:
+                result["error"] = f"Login did not fail with '{row['expected_error']}' ({row['expected_result']})"
+    except Exception as e:
+        result["error"] = str(e)
+    finally:
+        mcp_close_browser(client=client)
+        mcp_disconnect(client=client)
+        close_thread_loop()
+        result["duration"] = time.time() - started
+    return result
+
+
+def run_user_matrix(rows: List[Dict[str, str]], browser_config: Optional[Dict[str, Any]] = None,
+                    max_concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Run all example rows concurrently.
+
+    Each row runs on its own thread with its own event loop, client and
+    browser context, so total time tracks the slowest user rather than the sum.
+
+    Args:
+        rows: Example rows from expand_user_examples()
+        browser_config: Browser configuration from the browser_config fixture
+        max_concurrency: Upper bound of rows in flight (defaults to all rows)
+
+    Returns:
+        List[Dict[str, Any]]: Results in row order
+    """
+    if not rows:
+        return []
+    with ThreadPoolExecutor(max_workers=max_concurrency or len(rows), thread_name_prefix="user-matrix") as pool:
+        return list(pool.map(lambda row: run_login_example(row, browser_config), rows))
@@ -0,0 +1,121 @@
+"""
+Tests for per-worker result and log shards and their streaming merge.
+"""
+import logging
+import xml.etree.ElementTree as ElementTree
+from types import SimpleNamespace
+
+from support.artifact_merge import (
+    LOG_TIMESTAMP_PATTERN, SHARD_LOG_DATE_FORMAT, SHARD_LOG_FORMAT, ResultShardWriter, iter_log_records,
+    junit_names, merge_logs, merge_worker_artifacts, merged_results
+)
+
+
+def report(nodeid, when, outcome="passed", duration=0.1, longrepr=None, user_properties=()):
+    """Minimal stand-in for a pytest TestReport."""
+    return SimpleNamespace(
+        nodeid=nodeid, when=when, outcome=outcome, duration=duration, longrepr=longrepr,
+        longreprtext=str(longrepr or ""), failed=outcome == "failed", skipped=outcome == "skipped",
+        user_properties=list(user_properties)
+    )
+
+
+def run_test(shard, nodeid, call_outcome="passed", longrepr=None):
+    """Feed setup, call and teardown reports of one test."""
+    shard.add_report(report(nodeid, "setup"))
+    shard.add_report(report(nodeid, "call", call_outcome, 1.0, longrepr))
+    shard.add_report(report(nodeid, "teardown"))
+
+
+class TestResultShards:
+    """Shard writing and merging into JUnit and HTML."""
+
+    def test_records_are_merged_in_start_order(self, tmp_path, monkeypatch):
+        """Tests of two workers interleave by when they started."""
+        clock = iter(range(100, 200))
+        monkeypatch.setattr("support.artifact_merge.time.time", lambda: next(clock))
+        gw0 = ResultShardWriter(str(tmp_path / "gw0.jsonl"), "gw0")
+        gw1 = ResultShardWriter(str(tmp_path / "gw1.jsonl"), "gw1")
+        run_test(gw0, "tests/test_cart.py::test_a")
+        run_test(gw1, "tests/test_cart.py::test_b")
+        run_test(gw0, "tests/test_cart.py::test_c")
+        gw0.close()
+        gw1.close()
+
+        merged = [record["nodeid"][-1] for record in merged_results([str(tmp_path / "gw0.jsonl"),
+                                                                      str(tmp_path / "gw1.jsonl")])]
+        assert merged == ["a", "b", "c"]
+
+    def test_junit_and_html_from_shards(self, tmp_path):
+        """Counts, failure messages and skip reasons reach the merged reports."""
+        shard = ResultShardWriter(str(tmp_path / "shards" / "gw0.jsonl"), "gw0")
+        run_test(shard, "tests/test_cart.py::TestCart::test_ok")
+        run_test(shard, "tests/test_cart.py::TestCart::test_bad", "failed", "Traceback\nAssertionError: <total>")
+        run_test(shard, "tests/test_cart.py::TestCart::test_skip", "skipped", ("file", 1, "Skipped: no recording"))
+        shard.close()
+
+        junit, page = merge_worker_artifacts(
+            str(tmp_path / "shards"), junit=str(tmp_path / "junit.xml"), html_report=str(tmp_path / "report.html")
+        )
+        suite = ElementTree.parse(junit).getroot().find("testsuite")
+        assert (suite.get("tests"), suite.get("failures"), suite.get("skipped")) == ("3", "1", "1")
+        cases = suite.findall("testcase")
+        assert [case.get("name") for case in cases] == ["test_ok", "test_bad", "test_skip"]
+        assert cases[0].get("classname") == "tests.test_cart.TestCart"
+        assert cases[1].find("failure").get("message") == "AssertionError: <total>"
+        assert cases[2].find("skipped").get("message") == "Skipped: no recording"
+        assert "AssertionError: &lt;total&gt;" in open(page).read()
+
+    def test_html_keeps_report_columns_and_failure_artifacts(self, tmp_path):
+        """The merged HTML report has the Module, Tags and Isolation columns and links failure artifacts."""
+        shard = ResultShardWriter(str(tmp_path / "shards" / "gw0.jsonl"), "gw0")
+        nodeid = "tests/test_cart.py::TestCart::test_bad"
+        properties = [("markers", ["cart", "smoke"]), ("isolation_tier", "new-context")]
+        trace = str(tmp_path / "failure_artifacts" / "test_bad" / "trace.jsonl")
+        captured = properties + [("failure_artifacts", [trace])]
+        shard.add_report(report(nodeid, "setup", user_properties=properties))
+        shard.add_report(report(nodeid, "call", "failed", 1.0, "AssertionError", user_properties=captured))
+        shard.add_report(report(nodeid, "teardown", user_properties=captured))
+        shard.close()
+
+        (page,) = merge_worker_artifacts(str(tmp_path / "shards"), html_report=str(tmp_path / "report.html"))
+        content = open(page).read()
+        assert "<th>Module</th><th>Tags</th><th>Isolation</th>" in content
+        assert "<td>Cart</td><td>cart, smoke</td><td>new-context</td>" in content
+        assert '<a href="failure_artifacts/test_bad/trace.jsonl">trace.jsonl</a>' in content
+
+    def test_junit_names(self):
+        """Node ids map to the classname and name pytest's junitxml uses."""
+        assert junit_names("tests/test_auth.py::test_login[standard_user]") == ("tests.test_auth", "test_login[standard_user]")
+
+
+class TestLogMerge:
+    """Timestamp-ordered log merge."""
+
+    def test_interleaves_by_timestamp_and_keeps_tracebacks(self, tmp_path):
+        """Continuation lines stay with their record; each record names its worker."""
+        (tmp_path / "gw0.log").write_text(
+            "2024-05-01 10:00:01 [    INFO] a.py:1 f(): first\n"
+            "2024-05-01 10:00:03 [   ERROR] a.py:2 f(): boom\nTraceback line\n"
+        )
+        (tmp_path / "gw1.log").write_text("2024-05-01 10:00:02 [    INFO] b.py:1 g(): second\n")
+
+        output = merge_logs([str(tmp_path / "gw0.log"), str(tmp_path / "gw1.log")], str(tmp_path / "pytest.log"))
+        assert open(output).read().splitlines() == [
+            "2024-05-01 10:00:01 [gw0] [    INFO] a.py:1 f(): first",
+            "2024-05-01 10:00:02 [gw1] [    INFO] b.py:1 g(): second",
+            "2024-05-01 10:00:03 [gw0] [   ERROR] a.py:2 f(): boom",
+            "Traceback line"
+        ]
+
+    def test_shard_log_format_is_timestamped(self):
+        """Records written in the shard log format start with the timestamp the merge orders by."""
+        record = logging.LogRecord("tests", logging.INFO, "a.py", 1, "message", None, None, "f")
+        line = logging.Formatter(SHARD_LOG_FORMAT, SHARD_LOG_DATE_FORMAT).format(record)
+        assert LOG_TIMESTAMP_PATTERN.match(line)
+
+    def test_records_are_streamed(self, tmp_path):
+        """Records come out one at a time."""
+        (tmp_path / "gw0.log").write_text("2024-05-01 10:00:01 one\n2024-05-01 10:00:02 two\n")
+        records = iter_log_records(str(tmp_path / "gw0.log"), "gw0")
+        assert next(records) == ("2024-05-01 10:00:01", "2024-05-01 10:00:01 [gw0] one\n")
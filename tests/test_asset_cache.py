@@ -0,0 +1,127 @@
+"""
+Tests for the disk-backed static asset cache.
+Routes and responses are stand-ins, so no browser or network is needed.
+"""
+import asyncio
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+from support import asset_cache
+from support.asset_cache import AssetCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Deterministic time.time() for the cache: every call is one second later."""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(asset_cache, "time", SimpleNamespace(time=lambda: float(next(ticks))))
+
+
+def make_cache(tmp_path, **options):
+    """Cache in a temporary directory."""
+    return AssetCache(str(tmp_path / "assets"), **options)
+
+
+class FakeRoute:
+    """Route for one request; fetch() answers from a list of (status, headers, body) responses."""
+
+    def __init__(self, url, responses, resource_type="image", method="GET"):
+        self.request = SimpleNamespace(url=url, resource_type=resource_type, method=method, headers={})
+        self.responses = list(responses)
+        self.fetched_headers = None
+        self.fulfilled = None
+        self.fell_back = False
+
+    async def fetch(self, headers=None):
+        self.fetched_headers = headers
+        status, response_headers, body = self.responses.pop(0)
+
+        async def read_body():
+            return body
+
+        return SimpleNamespace(status=status, headers=response_headers, body=read_body)
+
+    async def fulfill(self, status=None, headers=None, body=None, response=None):
+        self.fulfilled = {"status": status if response is None else response.status, "body": body}
+
+    async def fallback(self):
+        self.fell_back = True
+
+
+def route(cache, url, responses=(), **request):
+    """Send one request through the cache's route handler."""
+    fake = FakeRoute(url, responses, **request)
+    asyncio.run(cache.handle_route(fake))
+    return fake
+
+
+class TestAssetCache:
+    """Storage, LRU eviction and byte accounting."""
+
+    def test_store_and_lookup(self, tmp_path):
+        """Bodies round-trip; validators are kept and hop-by-hop headers dropped."""
+        cache = make_cache(tmp_path)
+        cache.store("https://x/a.png", b"png", {"ETag": '"v1"', "Content-Length": "3", "Content-Type": "image/png"})
+        entry = cache.lookup("https://x/a.png")
+        assert entry["body"] == b"png"
+        assert entry["etag"] == '"v1"'
+        assert entry["headers"] == {"etag": '"v1"', "content-type": "image/png"}
+        assert cache.size_of("https://x/a.png") == 3
+        assert cache.lookup("https://x/missing.png") is None
+        cache.close()
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path, clock):
+        """Going over the limit evicts by last access down to 90% of it."""
+        cache = make_cache(tmp_path, max_bytes=250)
+        cache.store("a", b"a" * 100, {})
+        cache.store("b", b"b" * 100, {})
+        cache.touch("a")
+        cache.store("c", b"c" * 100, {})
+
+        assert [url for url in "abc" if cache.lookup(url)] == ["a", "c"]
+        assert cache.stats["evictions"] == 1
+        assert cache.size_bytes() == 200
+        assert len([path for path in (tmp_path / "assets" / "blobs").rglob("*") if path.is_file()]) == 2
+        cache.close()
+
+    def test_shared_blobs_are_counted_once(self, tmp_path, clock):
+        """URLs with identical bodies share one blob, which counts once and survives until its last URL goes."""
+        cache = make_cache(tmp_path, max_bytes=250)
+        cache.store("a", b"x" * 100, {})
+        cache.store("b", b"x" * 100, {})
+        assert cache.size_bytes() == 100
+        assert cache.stats["evictions"] == 0
+
+        cache.store("c", b"c" * 100, {})
+        cache.store("d", b"d" * 100, {})
+        # a and b free nothing until both are gone, so both are evicted to get under 225 bytes
+        assert [url for url in "abcd" if cache.lookup(url)] == ["c", "d"]
+        assert cache.size_bytes() == 200
+        cache.close()
+
+    def test_route_hits_misses_and_revalidation(self, tmp_path, clock):
+        """A miss is stored, a fresh hit is served locally and a stale entry is revalidated with its ETag."""
+        cache = make_cache(tmp_path, ttl=5)
+        miss = route(cache, "https://x/a.png", [(200, {"etag": '"v1"'}, b"png")])
+        hit = route(cache, "https://x/a.png")
+        assert miss.fulfilled["body"] == hit.fulfilled["body"] == b"png"
+        assert (cache.stats["misses"], cache.stats["hits"], cache.stats["bytes_served"]) == (1, 1, 3)
+
+        for _ in range(5):
+            cache.touch("https://x/other")  # Let the entry go stale
+        stale = route(cache, "https://x/a.png", [(304, {}, b"")])
+        assert stale.fetched_headers["if-none-match"] == '"v1"'
+        assert stale.fulfilled == {"status": 200, "body": b"png"}
+        assert cache.stats["revalidated"] == 1
+        assert cache.hit_rate() == pytest.approx(2 / 3)
+        cache.close()
+
+    def test_non_static_requests_fall_through(self, tmp_path):
+        """Documents and non-GET requests are left to the next handler."""
+        cache = make_cache(tmp_path)
+        assert route(cache, "https://x/", resource_type="document").fell_back
+        assert route(cache, "https://x/a.png", method="POST").fell_back
+        assert cache.stats["misses"] == 0
+        cache.close()
@@ -6,8 +6,9 @@ import pytest
 from pytest_bdd import scenarios
 
 
-# Import step definitions
-from step_definitions import common_steps, auth_steps
+# Import step definitions into this module, where pytest-bdd looks for them
+from step_definitions.common_steps import *
+from step_definitions.auth_steps import *
 
 # Load all scenarios from the authentication feature file
 scenarios('../features/authentication.feature')
@@ -81,3 +82,30 @@ class TestAuthentication:
         
         # Test is implemented through BDD steps
         pass
+        
+    @pytest.mark.auth
+    def test_login_outcome_for_every_test_user(self, browser_context, test_metadata):
+        """Test login outcomes for every user in TEST_USERS."""
+        test_metadata.update({
+            "test_id": "TC_AUTH_05",
+            "module": "Authentication",
+            "tags": ["auth"],
+            "description": "Run the TEST_USERS login matrix concurrently and verify each expected result"
+        })
+        
+        # Test is implemented through BDD steps
+        pass
+        
+    @pytest.mark.auth
+    @pytest.mark.performance
+    def test_performance_glitch_user_latency_budget(self, browser_context, test_metadata):
+        """Test login latency budget for performance_glitch_user."""
+        test_metadata.update({
+            "test_id": "TC_AUTH_06",
+            "module": "Authentication",
+            "tags": ["auth", "performance"],
+            "description": "Login as performance_glitch_user and verify page load stays within budget"
+        })
+        
+        # Test is implemented through BDD steps
+        pass
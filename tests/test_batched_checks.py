@@ -0,0 +1,161 @@
+"""
+Tests for batched page checks: CHECK_MANY_SCRIPT, the client's check_many()
+and BasePage.expect_all()/describe_check().
+The script runs under Node against a stand-in DOM when Node is installed;
+everything else uses stand-in pages, so no browser is needed.
+"""
+import asyncio
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from mcp_integration import CHECK_MANY_SCRIPT, MCPPlaywrightClient
+from pages.base_page import BasePage, describe_check
+
+
+# Minimal DOM: selector -> elements with size, visibility and text
+DOM_HARNESS = """
+const elements = {
+    ".inventory_list": [{ offsetWidth: 800, offsetHeight: 600, visibility: "visible", innerText: "Sauce Labs Backpack" }],
+    ".inventory_item": [1, 2, 3].map(() => ({ offsetWidth: 200, offsetHeight: 50, visibility: "visible", innerText: "" })),
+    ".hidden_menu": [{ offsetWidth: 100, offsetHeight: 40, visibility: "hidden", innerText: "All Items" }],
+    ".collapsed": [{ offsetWidth: 0, offsetHeight: 0, visibility: "visible", innerText: "" }]
+};
+for (const list of Object.values(elements)) {
+    for (const element of list) element.getClientRects = () => (element.offsetWidth ? [{}] : []);
+}
+const check = (selector) => {
+    if (selector.startsWith("[")) throw new SyntaxError("'" + selector + "' is not a valid selector");
+};
+global.document = {
+    body: { innerText: "Products\\nSauce Labs Backpack" },
+    querySelector: (selector) => { check(selector); return (elements[selector] || [null])[0]; },
+    querySelectorAll: (selector) => { check(selector); return elements[selector] || []; }
+};
+global.getComputedStyle = (element) => ({ visibility: element.visibility });
+const predicates = JSON.parse(require("fs").readFileSync(0, "utf-8"));
+console.log(JSON.stringify((CHECK_MANY_SCRIPT)(predicates)));
+"""
+
+
+def run_check_script(predicates):
+    """Evaluate CHECK_MANY_SCRIPT under Node against the stand-in DOM."""
+    completed = subprocess.run(
+        ["node", "-e", DOM_HARNESS.replace("CHECK_MANY_SCRIPT", CHECK_MANY_SCRIPT)], input=json.dumps(predicates),
+        capture_output=True, text=True, timeout=30, check=True
+    )
+    return json.loads(completed.stdout)
+
+
+class FakePage:
+    """Page whose evaluate() returns canned outcomes or raises."""
+
+    def __init__(self, outcomes=None, error=None):
+        self.outcomes = outcomes
+        self.error = error
+        self.evaluated = []
+
+    async def evaluate(self, script, predicates):
+        self.evaluated.append(predicates)
+        if self.error is not None:
+            raise self.error
+        return self.outcomes
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node is not installed")
+class TestCheckManyScript:
+    """Predicate evaluation in the page."""
+
+    def test_visible(self):
+        """Rendered elements pass; hidden, zero-size and missing ones fail."""
+        results = run_check_script([
+            BasePage.visible(".inventory_list"), BasePage.visible(".hidden_menu"),
+            BasePage.visible(".collapsed"), BasePage.visible(".missing")
+        ])
+        assert [(result["passed"], result["actual"]) for result in results] == [
+            (True, True), (False, False), (False, False), (False, False)
+        ]
+
+    def test_has_text(self):
+        """Page text is searched without a selector; with one, its text is returned as actual."""
+        results = run_check_script([
+            BasePage.has_text("Products"), BasePage.has_text("Checkout"),
+            BasePage.has_text("Backpack", ".inventory_list"), BasePage.has_text("Onesie", ".inventory_list"),
+            BasePage.has_text("Products", ".missing")
+        ])
+        assert [result["passed"] for result in results] == [True, False, True, False, False]
+        assert [result["actual"] for result in results] == [None, None, "Sauce Labs Backpack", "Sauce Labs Backpack", ""]
+
+    def test_count_of(self):
+        """The match count is compared exactly and returned as actual."""
+        results = run_check_script([
+            BasePage.count_of(".inventory_item", 3), BasePage.count_of(".inventory_item", 6),
+            BasePage.count_of(".missing", 0)
+        ])
+        assert [(result["passed"], result["actual"]) for result in results] == [(True, 3), (False, 3), (True, 0)]
+
+    def test_errors_fail_only_their_predicate(self):
+        """An invalid selector or unknown kind fails with an error; the other predicates are still evaluated."""
+        results = run_check_script([
+            BasePage.visible("[data-test="), {"kind": "focused", "selector": "#a"}, BasePage.has_text("Products")
+        ])
+        assert [result["passed"] for result in results] == [False, False, True]
+        assert "not a valid selector" in results[0]["error"]
+        assert results[1]["error"] == "Unknown predicate kind: focused"
+
+
+class TestClientCheckMany:
+    """Structured results from the client."""
+
+    def test_outcomes_are_merged_into_the_predicates(self):
+        """Each predicate comes back with passed, actual and error, in order."""
+        client = MCPPlaywrightClient()
+        client.page = FakePage([{"passed": True, "actual": True}, {"passed": False, "actual": 5}])
+        results = asyncio.run(client.check_many([BasePage.visible("#a"), BasePage.count_of(".item", 6)]))
+        assert results == [
+            {"kind": "visible", "selector": "#a", "passed": True, "actual": True, "error": None},
+            {"kind": "count", "selector": ".item", "count": 6, "passed": False, "actual": 5, "error": None}
+        ]
+
+    def test_evaluation_error_fails_every_predicate(self):
+        """A failed round trip reports each predicate as failed with the error."""
+        client = MCPPlaywrightClient()
+        client.page = FakePage(error=RuntimeError("Target closed"))
+        results = asyncio.run(client.check_many([BasePage.visible("#a"), BasePage.has_text("Products")]))
+        assert [(result["passed"], result["error"]) for result in results] == [(False, "Target closed")] * 2
+
+
+class TestExpectAll:
+    """Page-object assertions over batched checks."""
+
+    def test_all_passing(self):
+        """One round trip for all predicates; True when every one holds."""
+        page = BasePage(MCPPlaywrightClient())
+        page.client.page = FakePage([{"passed": True}, {"passed": True}])
+        assert page.expect_all([page.visible("#a"), page.has_text("Products")])
+        assert len(page.client.page.evaluated) == 1
+
+    def test_failures_are_described(self, capsys):
+        """Each failing predicate is printed with what was found."""
+        page = BasePage(MCPPlaywrightClient())
+        page.client.page = FakePage([{"passed": True}, {"passed": False, "actual": 2}, {"passed": False}])
+        assert not page.expect_all([
+            page.visible("#a"), page.count_of(".inventory_item", 6), page.has_text("Checkout", ".cart")
+        ])
+        output = capsys.readouterr().out
+        assert "Check failed: 6 x .inventory_item (found 2)" in output
+        assert "Check failed: text 'Checkout' in .cart" in output
+        assert "#a visible" not in output
+
+    @pytest.mark.parametrize("result, description", [
+        ({"kind": "visible", "selector": "#menu"}, "#menu visible"),
+        ({"kind": "text", "text": "Products", "selector": None}, "text 'Products'"),
+        ({"kind": "text", "text": "Products", "selector": ".title"}, "text 'Products' in .title"),
+        ({"kind": "count", "selector": ".item", "count": 6, "actual": 0}, "6 x .item (found 0)"),
+        ({"kind": "visible", "selector": "#menu", "error": "Target closed"}, "#menu visible - Target closed")
+    ])
+    def test_describe_check(self, result, description):
+        """Each predicate kind reads as a short assertion message."""
+        assert describe_check(result) == description
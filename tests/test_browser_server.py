@@ -0,0 +1,182 @@
+"""
+Tests for the shared browser server pool.
+Browser processes and the DevTools health probe are stand-ins, so no browser is needed.
+"""
+import io
+import json
+import time
+
+import pytest
+
+from support import browser_server
+from support.browser_server import (
+    BROWSER_SERVER_ENDPOINTS_ENV, BrowserServer, BrowserServerPool, endpoint_for_worker, is_healthy
+)
+
+
+class FakeProcess:
+    """Popen stand-in that runs until terminated or killed by the test."""
+
+    launched = []
+
+    def __init__(self, args, **_):
+        self.args = args
+        self.returncode = None
+        FakeProcess.launched.append(self)
+
+    def poll(self):
+        return self.returncode
+
+    def terminate(self):
+        self.returncode = -15
+
+    def kill(self):
+        self.returncode = -9
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+
+@pytest.fixture
+def fake_browsers(monkeypatch):
+    """Fake processes whose ports answer the health probe while they run."""
+    FakeProcess.launched = []
+    unhealthy_ports = set()
+
+    def probe(endpoint, timeout=2.0):
+        port = int(endpoint.rsplit(":", 1)[1])
+        running = [process for process in FakeProcess.launched
+                   if f"--remote-debugging-port={port}" in process.args and process.poll() is None]
+        return bool(running) and port not in unhealthy_ports
+
+    monkeypatch.setattr(browser_server.subprocess, "Popen", FakeProcess)
+    monkeypatch.setattr(browser_server, "is_healthy", probe)
+    monkeypatch.setattr(browser_server, "_chromium_executable", lambda: "chromium")
+    monkeypatch.setattr(browser_server, "HEALTH_CHECK_INTERVAL", 0.01)
+    return unhealthy_ports
+
+
+def wait_until(condition, timeout=2.0):
+    """Poll a condition; True once it holds, False on timeout."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestEndpointForWorker:
+    """Worker id to pool member mapping."""
+
+    @pytest.mark.parametrize("worker_id, expected", [
+        ("gw0", "a"), ("gw1", "b"), ("gw2", "c"), ("gw3", "a"), ("gw11", "c"), ("master", "a")
+    ])
+    def test_workers_are_spread_round_robin(self, worker_id, expected):
+        """The worker number picks the endpoint modulo the pool size; ids without digits use the first."""
+        assert endpoint_for_worker(["a", "b", "c"], worker_id) == expected
+
+    def test_worker_id_from_environment(self, monkeypatch):
+        """Without an explicit id the xdist worker variable is used."""
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw5")
+        assert endpoint_for_worker(["a", "b"]) == "b"
+
+    def test_no_endpoints(self):
+        """No published server means no endpoint."""
+        assert endpoint_for_worker([], "gw1") is None
+
+
+class TestIsHealthy:
+    """DevTools version probe."""
+
+    def probe_with(self, monkeypatch, respond):
+        monkeypatch.setattr(browser_server.urllib.request, "urlopen", respond)
+        return is_healthy("http://127.0.0.1:9333")
+
+    def test_version_with_websocket_url_is_healthy(self, monkeypatch):
+        """A version document naming the DevTools WebSocket is healthy."""
+        body = json.dumps({"Browser": "Chrome/120", "webSocketDebuggerUrl": "ws://127.0.0.1:9333/devtools"})
+        assert self.probe_with(monkeypatch, lambda url, timeout: io.BytesIO(body.encode()))
+
+    @pytest.mark.parametrize("body", ['{"Browser": "Chrome/120"}', "<html>starting</html>"])
+    def test_incomplete_or_invalid_answers_are_unhealthy(self, monkeypatch, body):
+        """A version document without the WebSocket URL, or not JSON at all, is unhealthy."""
+        assert not self.probe_with(monkeypatch, lambda url, timeout: io.BytesIO(body.encode()))
+
+    def test_refused_connection_is_unhealthy(self, monkeypatch):
+        """Connection errors are reported as unhealthy rather than raised."""
+        def refuse(url, timeout):
+            raise ConnectionRefusedError(url)
+        assert not self.probe_with(monkeypatch, refuse)
+
+
+class TestBrowserServer:
+    """Process lifecycle of one server."""
+
+    def test_start_launches_on_its_port(self, fake_browsers):
+        """The browser gets its debugging port and a headless flag, and the endpoint is stable."""
+        server = BrowserServer(9400, headless=True, executable="chromium")
+        server.start()
+        assert "--remote-debugging-port=9400" in server.process.args
+        assert server.process.args[1] == "--headless=new"
+        assert server.endpoint == "http://127.0.0.1:9400"
+        assert server.is_alive()
+        server.stop()
+        assert server.process is None and not server.is_alive()
+
+    def test_exited_process_fails_start(self, fake_browsers, monkeypatch):
+        """A browser that exits during startup raises with its exit code."""
+        class CrashingProcess(FakeProcess):
+            def __init__(self, args, **kwargs):
+                super().__init__(args, **kwargs)
+                self.returncode = 1
+
+        monkeypatch.setattr(browser_server.subprocess, "Popen", CrashingProcess)
+        with pytest.raises(RuntimeError, match="exited with code 1"):
+            BrowserServer(9401, executable="chromium").start()
+
+
+class TestBrowserServerPool:
+    """Publishing and supervision."""
+
+    def test_start_publishes_and_stop_unpublishes(self, fake_browsers, monkeypatch):
+        """Endpoints on consecutive ports are published for workers while the pool runs."""
+        monkeypatch.delenv(BROWSER_SERVER_ENDPOINTS_ENV, raising=False)
+        pool = BrowserServerPool(size=2, base_port=9410)
+        pool.start()
+        try:
+            assert browser_server.published_endpoints() == ["http://127.0.0.1:9410", "http://127.0.0.1:9411"]
+        finally:
+            pool.stop()
+        assert browser_server.published_endpoints() == []
+
+    def test_supervisor_restarts_a_dead_server_on_the_same_port(self, fake_browsers, monkeypatch):
+        """A crashed member is relaunched on its port; healthy members are left alone."""
+        monkeypatch.delenv(BROWSER_SERVER_ENDPOINTS_ENV, raising=False)
+        pool = BrowserServerPool(size=2, base_port=9420)
+        pool.start()
+        try:
+            crashed, healthy = pool.servers
+            first_process, healthy_process = crashed.process, healthy.process
+            first_process.kill()
+            assert wait_until(lambda: crashed.restarts == 1)
+            assert crashed.process is not first_process and crashed.is_alive()
+            assert crashed.endpoint == "http://127.0.0.1:9420"
+            assert healthy.process is healthy_process and healthy.restarts == 0
+        finally:
+            pool.stop()
+
+    def test_hung_server_is_restarted(self, fake_browsers, monkeypatch):
+        """A running process whose DevTools probe stops answering is restarted too."""
+        monkeypatch.delenv(BROWSER_SERVER_ENDPOINTS_ENV, raising=False)
+        pool = BrowserServerPool(size=1, base_port=9430)
+        pool.start()
+        try:
+            [server] = pool.servers
+            hung_process = server.process
+            fake_browsers.add(9430)
+            assert wait_until(lambda: hung_process.poll() is not None)  # Terminated by the restart
+            fake_browsers.discard(9430)
+            assert wait_until(lambda: server.restarts >= 1 and server.is_alive())
+        finally:
+            pool.stop()
@@ -6,8 +6,9 @@ import pytest
 from pytest_bdd import scenarios
 
 
-# Import step definitions
-from step_definitions import common_steps, cart_steps
+# Import step definitions into this module, where pytest-bdd looks for them
+from step_definitions.common_steps import *
+from step_definitions.cart_steps import *
 
 # Load all scenarios from the cart feature file
 scenarios('../features/cart.feature')
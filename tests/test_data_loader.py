@@ -0,0 +1,114 @@
+"""
+Tests for the streaming test-data loader and its hash-keyed row cache.
+"""
+import json
+import sqlite3
+
+import pytest
+
+from support.data_loader import DataSource, RecordSource, external_source, partition_count, partition_params
+from TestData.models import Product, User
+from TestData.test_data import PRODUCTS, TEST_USERS
+
+
+def write_products_csv(path):
+    """Two catalog rows with displayed prices."""
+    path.write_text(
+        "key,name,product_id,price,description,data_test\n"
+        "backpack,Backpack,4,$29.99,Carry all,sauce-labs-backpack\n"
+        "onesie,Onesie,2,$7.99,Rompers,sauce-labs-onesie\n"
+    )
+    return path
+
+
+class TestDataSources:
+    """Reading, coercion and the parsed-row cache."""
+
+    def test_csv_rows_become_records(self, tmp_path):
+        """Text columns are coerced to the model's fields; price_cents comes from price."""
+        source = DataSource(str(write_products_csv(tmp_path / "products.csv")), Product,
+                            cache_dir=str(tmp_path / "cache"))
+        backpack, onesie = source
+        assert backpack == Product("backpack", "Backpack", 4, 2999, "Carry all", "sauce-labs-backpack")
+        assert onesie.price == "$7.99"
+        assert len(source) == 2
+        assert [ref.id for ref in source.refs()] == ["backpack", "onesie"]
+        assert next(iter(source.refs())).load() == backpack
+
+    def test_jsonl_and_sqlite_sources(self, tmp_path):
+        """JSON lines and SQLite tables stream the same records."""
+        users = tmp_path / "users.jsonl"
+        users.write_text("".join(json.dumps({
+            "key": user.key, "username": user.username, "password": user.password,
+            "expected_result": user.expected_result
+        }) + "\n" for user in TEST_USERS))
+        db = sqlite3.connect(tmp_path / "users.sqlite")
+        db.execute("CREATE TABLE users (key, username, password, expected_result)")
+        db.executemany("INSERT INTO users VALUES (?, ?, ?, ?)",
+                       [(user.key, user.username, user.password, user.expected_result) for user in TEST_USERS])
+        db.commit()
+        db.close()
+
+        from_jsonl = DataSource(str(users), User, cache_dir=str(tmp_path / "cache"))
+        from_sqlite = DataSource(str(tmp_path / "users.sqlite"), User, table="users", cache_dir=str(tmp_path / "cache"))
+        assert list(from_jsonl) == list(from_sqlite) == list(TEST_USERS)
+        assert from_sqlite.row(2) == TEST_USERS["problem_user"]
+        with pytest.raises(IndexError):
+            from_sqlite.row(len(TEST_USERS))
+        (tmp_path / "users.xml").write_text("<users/>")
+        with pytest.raises(ValueError, match="Unsupported test-data file"):
+            list(DataSource(str(tmp_path / "users.xml"), User, cache_dir=str(tmp_path / "cache")))
+
+    def test_cache_is_reused_until_the_file_changes(self, tmp_path, monkeypatch):
+        """Unchanged content is read from the cache; edited content gets a new cache."""
+        path = write_products_csv(tmp_path / "products.csv")
+        cache_dir = str(tmp_path / "cache")
+        first = DataSource(str(path), Product, cache_dir=cache_dir)
+        assert len(first) == 2
+        first_cache = first.cache_path()
+
+        def no_parsing(*args):
+            raise AssertionError("source parsed again")
+        monkeypatch.setattr("support.data_loader.read_source", no_parsing)
+        second = DataSource(str(path), Product, cache_dir=cache_dir)
+        assert second.cache_path() == first_cache
+        assert list(second) == list(first)
+
+        monkeypatch.undo()
+        with path.open("a") as source:
+            source.write("jacket,Jacket,5,$49.99,Warm,sauce-labs-fleece-jacket\n")
+        third = DataSource(str(path), Product, cache_dir=cache_dir)
+        assert third.cache_path() != first_cache
+        assert len(third) == 3
+
+
+class TestPartitions:
+    """Spreading rows across workers and shards."""
+
+    def test_partitions_cover_every_row_once(self, tmp_path):
+        """Partitions are disjoint, complete and agree between file and in-memory sources."""
+        path = tmp_path / "users.jsonl"
+        path.write_text("".join(json.dumps({
+            "key": f"user{index}", "username": f"user{index}", "password": "secret", "expected_result": "failed"
+        }) + "\n" for index in range(10)))
+        source = DataSource(str(path), User, cache_dir=str(tmp_path / "cache"))
+        partitions = [list(source.partition(index, 3)) for index in range(3)]
+        assert sorted(user.key for part in partitions for user in part) == sorted(f"user{index}" for index in range(10))
+        assert [len(part) for part in partitions] == [4, 3, 3]
+        in_memory = RecordSource(list(source))
+        assert [list(in_memory.partition(index, 3)) for index in range(3)] == partitions
+
+    def test_partition_count_and_params(self, monkeypatch):
+        """Each xdist worker of each shard gets a partition; ids name the partition."""
+        monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "4")
+        monkeypatch.setenv("TEST_SHARD", "1/2")
+        assert partition_count() == 8
+        params = partition_params(RecordSource(PRODUCTS), 3)
+        assert [param.id for param in params] == ["rows1of3", "rows2of3", "rows3of3"]
+        assert [product.key for product in params[1].values[0].rows()] == list(PRODUCTS.keys())[1::3]
+
+    def test_external_source_lookup(self, tmp_path):
+        """Data sets are found by name in the external data directory."""
+        write_products_csv(tmp_path / "products.csv")
+        assert external_source("products", Product, str(tmp_path)).path.endswith("products.csv")
+        assert external_source("users", User, str(tmp_path)) is None
@@ -0,0 +1,56 @@
+"""
+Tests for the immutable, indexed test-data model in TestData.
+"""
+import dataclasses
+
+import pytest
+
+from TestData.models import Product, ProductCatalog, format_price, parse_price
+from TestData.test_data import PRODUCTS, SORT_OPTIONS, TEST_CASES, TEST_USERS
+
+
+class TestDataModel:
+    """Records, indexes and price handling."""
+
+    def test_records_are_frozen_and_slotted(self):
+        """Records cannot be changed and carry no per-instance __dict__."""
+        backpack = PRODUCTS["sauce_labs_backpack"]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            backpack.price_cents = 0
+        assert not hasattr(backpack, "__dict__")
+
+    def test_product_indexes(self):
+        """Products are found by display name, data-test id and price rank."""
+        shirt = PRODUCTS.by_name("Test.allTheThings() T-Shirt (Red)")
+        assert shirt.add_to_cart_id == "add-to-cart-test.allthethings()-t-shirt-(red)"
+        assert PRODUCTS.by_test_id(shirt.remove_id) is shirt
+        assert PRODUCTS.by_test_id("sauce-labs-onesie").name == "Sauce Labs Onesie"
+        assert PRODUCTS.by_price_rank(0).name == "Sauce Labs Onesie"
+        assert PRODUCTS.by_price_rank(-1).name == "Sauce Labs Fleece Jacket"
+        prices = [product.price_cents for product in PRODUCTS.by_price(descending=True)]
+        assert prices == sorted(prices, reverse=True)
+        with pytest.raises(KeyError, match="Unknown product 'Hat'"):
+            PRODUCTS.by_name("Hat")
+
+    def test_user_sort_option_and_test_case_indexes(self):
+        """Users by expected result, sort options by value and test cases by module."""
+        assert [user.key for user in TEST_USERS.by_expected_result("locked")] == ["locked_out_user"]
+        assert len(TEST_USERS.by_expected_result("failed")) == 3
+        assert SORT_OPTIONS.by_value("hilo").display == "Price (high to low)"
+        assert [case.test_id for case in TEST_CASES.by_module("Authentication Module")] == ["TC_AUTH_01", "TC_AUTH_01b"]
+        assert TEST_CASES.by_module("Checkout Module") == ()
+
+    def test_prices_are_integer_cents(self):
+        """Displayed prices round-trip through integer cents."""
+        assert parse_price("$29.99") == 2999
+        assert parse_price("$7.9") == 790
+        assert parse_price("$1,049.00") == 104900
+        assert format_price(799) == "$7.99"
+        assert PRODUCTS["sauce_labs_bike_light"].price == "$9.99"
+
+    def test_duplicate_keys_are_rejected(self):
+        """A second product with the same name fails when the catalog is built."""
+        product = PRODUCTS["sauce_labs_onesie"]
+        with pytest.raises(ValueError, match="Duplicate Product.name"):
+            ProductCatalog([product, dataclasses.replace(product, key="other", data_test="other")])
+        assert isinstance(product, Product)
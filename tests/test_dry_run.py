@@ -0,0 +1,179 @@
+"""
+Tests for the browserless dry run that binds feature steps to step definitions.
+Builds a small project in a temporary directory, so no browser or pytest-bdd is needed.
+"""
+import time
+
+import pytest
+
+from support.dry_run import run_dry_run, format_to_regex, PROJECT_ROOT
+
+
+STEPS = '''
+from pytest_bdd import given, when, then, parsers
+
+
+@given('user is on login page')
+def on_login_page(browser_context):
+    pass
+
+
+@when(parsers.parse('user adds {count:d} items'))
+def add_items(browser_context, count):
+    pass
+
+
+@then(parsers.parse('cart item should have price "{price}"'))
+def item_price(browser_context, price, price_table):
+    pass
+'''
+
+CONFTEST = '''
+import pytest
+
+
+@pytest.fixture
+def browser_context():
+    return {}
+'''
+
+TESTS = '''
+from pytest_bdd import scenarios
+
+from step_definitions.cart_steps import *
+
+scenarios('../features/cart.feature')
+
+
+def test_cart(browser_context):
+    pass
+'''
+
+FEATURE = '''
+@cart
+Feature: Cart
+  Background:
+    Given user is on login page
+
+  Scenario: Typed argument
+    When user adds 2 items
+    And user adds two items
+    Then cart item should have price "$29.99"
+
+  Scenario Outline: Outline
+    When user adds <count> items
+    But user clicks Add to cart
+
+    Examples:
+      | count |
+      | 1     |
+      | 3     |
+'''
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Minimal project with one feature, one step module, a conftest and a test module."""
+    for relative, content in {
+        "step_definitions/cart_steps.py": STEPS,
+        "conftest.py": CONFTEST,
+        "tests/test_cart.py": TESTS,
+        "features/cart.feature": FEATURE
+    }.items():
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return tmp_path
+
+
+class TestDryRun:
+    """Static step binding."""
+
+    def test_format_to_regex(self):
+        """parse formats become anchored patterns with typed fields."""
+        pattern, names = format_to_regex('cart should have {count:d} items and "{name}"')
+        assert names == ("count", "name")
+        assert pattern.startswith("cart\\ should")
+
+    def test_reports_unbound_steps_once(self, project):
+        """An unbound outline step is reported once, not once per example row."""
+        unbound = run_dry_run(project)["problems"]["unbound"]
+        assert unbound == [
+            "features/cart.feature:14 But user clicks Add to cart: no @when step visible to tests/test_cart.py"
+        ]
+
+    def test_reports_type_mismatches(self, project):
+        """Text that fits a pattern except for a typed field is a type mismatch."""
+        mismatches = run_dry_run(project)["problems"]["type_mismatch"]
+        assert len(mismatches) == 1
+        assert "user adds two items" in mismatches[0]
+
+    def test_reports_unknown_fixtures(self, project):
+        """Step parameters must be parser arguments or fixtures."""
+        unknown = run_dry_run(project)["problems"]["unknown_fixture"]
+        assert len(unknown) == 1
+        assert "'price_table'" in unknown[0]
+
+    def test_parametrized_arguments_are_not_fixtures(self, project):
+        """Names supplied by @pytest.mark.parametrize are not reported as unknown fixtures."""
+        (project / "tests" / "test_cart.py").write_text(TESTS + '''
+
+import pytest
+
+
+@pytest.mark.parametrize("count, name", [(1, "a")])
+def test_counts(browser_context, count, name):
+    pass
+''', encoding="utf-8")
+        unknown = run_dry_run(project)["problems"]["unknown_fixture"]
+        assert len(unknown) == 1
+        assert "'price_table'" in unknown[0]
+
+    def test_counts_outline_rows(self, project):
+        """Outline steps are bound once per example row, with the background prepended."""
+        result = run_dry_run(project)
+        assert (result["features"], result["scenarios"]) == (1, 2)
+        assert result["steps"] == 4 + 2 * 3
+
+    def test_module_import_does_not_bind(self, project):
+        """Importing a step module, rather than its names, leaves its steps invisible as pytest-bdd does."""
+        (project / "tests" / "test_cart.py").write_text(
+            TESTS.replace("from step_definitions.cart_steps import *", "from step_definitions import cart_steps"),
+            encoding="utf-8"
+        )
+        unbound = run_dry_run(project)["problems"]["unbound"]
+        assert "features/cart.feature:5 Given user is on login page: no @given step visible to tests/test_cart.py " \
+               "(step_definitions/cart_steps.py:6 is not star-imported by it or a conftest.py)" in unbound
+
+    @pytest.mark.parametrize("conftest", [
+        "from step_definitions.cart_steps import *\n",
+        "pytest_plugins = ['step_definitions.cart_steps']\n"
+    ], ids=["star_import", "pytest_plugins"])
+    def test_conftest_steps_bind(self, project, conftest):
+        """Steps star-imported into a conftest.py or listed in its pytest_plugins are visible to the tests below it."""
+        (project / "tests" / "test_cart.py").write_text(
+            TESTS.replace("from step_definitions.cart_steps import *", ""), encoding="utf-8"
+        )
+        (project / "tests" / "conftest.py").write_text(conftest, encoding="utf-8")
+        unbound = run_dry_run(project)["problems"]["unbound"]
+        assert unbound == [
+            "features/cart.feature:14 But user clicks Add to cart: no @when step visible to tests/test_cart.py"
+        ]
+
+    def test_repository_runs_quickly(self):
+        """The repository's own suite is checked well under a second."""
+        started = time.perf_counter()
+        result = run_dry_run(PROJECT_ROOT)
+        assert result["steps"] > 0
+        assert time.perf_counter() - started < 1.0
+
+    def test_hundreds_of_features_run_quickly(self, project):
+        """Hints for unbound steps are worked out once per distinct step, not per feature."""
+        feature = (project / "features" / "cart.feature").read_text(encoding="utf-8")
+        for index in range(300):
+            (project / "features" / f"cart_{index}.feature").write_text(feature, encoding="utf-8")
+        started = time.perf_counter()
+        result = run_dry_run(project)
+        assert time.perf_counter() - started < 1.0
+        assert len(result["problems"]["not_loaded"]) == 300
+        assert len(result["problems"]["unbound"]) > 300
@@ -0,0 +1,56 @@
+"""
+Data-driven tests fed by the streaming test-data loader.
+With products.<csv|jsonl|sqlite> or users.<csv|jsonl|sqlite> in
+EXTERNAL_DATA_DIR they run over those files; otherwise over the TestData tables.
+"""
+import itertools
+import json
+
+import pytest
+
+from pages.base_page import describe_check
+from pages.cart_page import CartPage
+from pages.login_page import LoginPage
+from support.user_matrix import expand_user_examples, run_user_matrix
+from TestData.test_data import BASE_URL, CART_URL, TEST_USERS
+
+
+# Users of a partition run this many at a time, so a large partition is never held in memory at once
+USER_BATCH_SIZE = 8
+
+
+class TestExternalData:
+    """Catalog rows and user partitions."""
+
+    @pytest.mark.cart
+    def test_catalog_row_in_cart(self, product_record, browser_context):
+        """A catalog row seeded into the cart is the one cart item, shown with its name and price."""
+        cart_page = CartPage()
+        assert cart_page.seed_local_storage(
+            BASE_URL, {CartPage.CART_STORAGE_KEY: json.dumps([product_record.product_id])}
+        ), "Failed to seed cart"
+        standard_user = TEST_USERS["standard_user"]
+        login_page = LoginPage()
+        assert login_page.navigate_to_login_page(), "Failed to navigate to login page"
+        assert login_page.login(standard_user.username, standard_user.password), "Failed to log in"
+        assert cart_page.navigate_to(CART_URL), "Failed to open cart"
+        results = cart_page.check_many([
+            cart_page.count_of(CartPage.CART_ITEMS, 1),
+            cart_page.has_text(product_record.name, CartPage.CART_LIST),
+            cart_page.has_text(product_record.price, CartPage.CART_LIST)
+        ])
+        failed = [describe_check(result) for result in results if not result["passed"]]
+        assert not failed, f"Cart does not show {product_record.name}: {', '.join(failed)}"
+
+    @pytest.mark.auth
+    def test_user_partition_login_results(self, user_partition, browser_config):
+        """Every user of the partition gets the expected login result."""
+        failures = []
+        checked = 0
+        for batch in iter(lambda: list(itertools.islice(user_partition, USER_BATCH_SIZE)), []):
+            results = run_user_matrix(expand_user_examples(batch), browser_config)
+            checked += len(results)
+            failures += [f"{result['user_key']}: {result['error']}" for result in results if not result["passed"]]
+        if not checked:
+            pytest.skip("Partition has no users")
+        assert not failures, "Unexpected login outcomes:\n" + "\n".join(failures)
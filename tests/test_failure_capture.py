@@ -0,0 +1,81 @@
+"""
+Tests for the failure-only trace and screencast ring buffer.
+Frames are stand-in bytes, so no browser is needed.
+"""
+import base64
+import itertools
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from support import failure_capture
+from support.failure_capture import FailureCapture
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Deterministic time.time() for the capture: every call is one second later."""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(failure_capture, "time", SimpleNamespace(time=lambda: float(next(ticks))))
+
+
+class TestFailureCapture:
+    """Window trimming, buffer bounds and the persisted layout."""
+
+    def test_only_the_window_is_kept(self, clock):
+        """Events and frames older than the window are left out."""
+        capture = FailureCapture(window_seconds=3)
+        for index in range(5):
+            capture.record_event("click", {"index": index}, 0.1)  # t = 1000..1004
+        capture.record_frame(b"frame")  # t = 1005
+        assert [event["details"]["index"] for event in capture.events()] == [3, 4]  # cutoff 1006 - 3
+        assert [frame[1] for frame in capture.frames()] == [b"frame"]  # cutoff 1007 - 3
+
+    def test_buffers_are_bounded(self, clock):
+        """Only the newest max_events events and max_frames frames are held."""
+        capture = FailureCapture(window_seconds=1000, max_events=3, max_frames=2)
+        for index in range(10):
+            capture.record_event("type", index, 0.0)
+            capture.record_frame(bytes([index]))
+        assert [event["details"] for event in capture.events()] == [7, 8, 9]
+        assert [frame[1] for frame in capture.frames()] == [b"\x08", b"\x09"]
+
+    def test_disabled_streams_record_nothing(self):
+        """A capture without trace or video ignores that stream."""
+        capture = FailureCapture(trace=False, video=False)
+        capture.record_event("navigate", "https://x/", 1.0)
+        capture.record_frame(b"frame")
+        assert capture.events() == [] and capture.frames() == []
+
+    def test_base64_frames_are_decoded_on_read(self):
+        """Frames kept as CDP delivers them are decoded only when read."""
+        capture = FailureCapture()
+        capture.record_frame(base64.b64encode(b"\xff\xd8jpeg").decode())
+        assert capture.frames()[0][1] == b"\xff\xd8jpeg"
+
+    def test_persist_layout(self, tmp_path, clock):
+        """A directory per test holds trace.jsonl and numbered, timestamped frames."""
+        capture = FailureCapture(window_seconds=1000)
+        capture.record_event("navigate", ("https://x/",), 0.5, result=True)  # t = 1000
+        capture.record_frame(b"jpeg")  # t = 1001
+        capture.record_frame(b"png", mime_type="image/png")  # t = 1002
+
+        written = capture.persist("tests/test_cart.py::test_view[chromium]", str(tmp_path))
+        target = tmp_path / "tests_test_cart.py_test_view_chromium"
+        assert written == [
+            str(target / "trace.jsonl"),
+            str(target / "frame_000_1001000.jpg"),
+            str(target / "frame_001_1002000.png")
+        ]
+        [event] = [json.loads(line) for line in (target / "trace.jsonl").read_text().splitlines()]
+        assert event == {"timestamp": 1000.0, "operation": "navigate", "details": ["https://x/"],
+                         "duration": 0.5, "result": True}
+        assert (target / "frame_001_1002000.png").read_bytes() == b"png"
+
+    def test_nothing_recorded_writes_no_files(self, tmp_path):
+        """An empty buffer persists no artifacts; clear() empties both buffers."""
+        capture = FailureCapture()
+        capture.record_event("click", "#a", 0.1)
+        capture.clear()
+        assert capture.persist("test", str(tmp_path)) == []
@@ -0,0 +1,79 @@
+"""
+Tests for the persisted failure set and the file watcher behind run_tests.py --loop.
+"""
+import threading
+import time
+from types import SimpleNamespace
+
+from support.failure_set import FailureSet
+from support.file_watch import wait_for_change
+
+
+ITEMS = [SimpleNamespace(nodeid=f"tests/test_cart.py::test_{index}") for index in range(4)]
+
+
+class TestFailureSet:
+    """Failure set persistence and selection."""
+
+    def test_failures_persist_until_they_pass(self, tmp_path):
+        """Failed tests are saved; a later pass removes them."""
+        path = tmp_path / "failed_tests.json"
+        failures = FailureSet(path)
+        failures.record(ITEMS[1].nodeid, "failed")
+        failures.record(ITEMS[2].nodeid, "failed")
+        failures.record(ITEMS[3].nodeid, "skipped")
+        failures.save()
+
+        reloaded = FailureSet(path)
+        assert set(reloaded.nodeids()) == {ITEMS[1].nodeid, ITEMS[2].nodeid}
+        reloaded.record(ITEMS[1].nodeid, "passed")
+        reloaded.save()
+        assert list(FailureSet(path).nodeids()) == [ITEMS[2].nodeid]
+
+    def test_concurrent_runs_merge_on_save(self, tmp_path):
+        """Two runs loaded from the same file keep each other's failures and passes."""
+        path = tmp_path / "failed_tests.json"
+        seeded = FailureSet(path)
+        seeded.record(ITEMS[0].nodeid, "failed")
+        seeded.save()
+
+        main_lane, quarantine_lane = FailureSet(path), FailureSet(path)
+        main_lane.record(ITEMS[0].nodeid, "passed")
+        main_lane.record(ITEMS[1].nodeid, "failed")
+        quarantine_lane.record(ITEMS[2].nodeid, "failed")
+        main_lane.save()
+        quarantine_lane.save()
+
+        assert set(FailureSet(path).nodeids()) == {ITEMS[1].nodeid, ITEMS[2].nodeid}
+
+    def test_select_failed_first_and_only(self, tmp_path):
+        """Failed tests move to the front, or are the only ones kept."""
+        failures = FailureSet(tmp_path / "failed_tests.json")
+        failures.record(ITEMS[2].nodeid, "failed")
+
+        assert failures.select(ITEMS, only=False) == [ITEMS[2], ITEMS[0], ITEMS[1], ITEMS[3]]
+        assert failures.select(ITEMS, only=True) == [ITEMS[2]]
+
+    def test_empty_set_keeps_everything(self, tmp_path):
+        """With no recorded failure every collected test runs."""
+        assert FailureSet(tmp_path / "missing.json").select(ITEMS, only=True) == ITEMS
+
+
+class TestFileWatch:
+    """Polling watcher."""
+
+    def test_detects_modified_file(self, tmp_path):
+        """A write to a watched file ends the wait and is reported."""
+        page = tmp_path / "cart_page.py"
+        page.write_text("A = 1\n")
+
+        def edit():
+            time.sleep(0.2)
+            page.write_text("A = 2\n# edited\n")
+
+        threading.Thread(target=edit).start()
+        assert wait_for_change([str(tmp_path)], interval=0.05, timeout=5) == [str(page)]
+
+    def test_times_out_without_changes(self, tmp_path):
+        """Nothing changing returns an empty list after the timeout."""
+        assert wait_for_change([str(tmp_path)], interval=0.05, timeout=0.2) == []
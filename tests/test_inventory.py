@@ -6,8 +6,8 @@ import pytest
 from pytest_bdd import scenarios
 
 
-# Import step definitions
-from step_definitions import common_steps
+# Import step definitions into this module, where pytest-bdd looks for them
+from step_definitions.common_steps import *
 
 # Load all scenarios from the inventory feature file
 scenarios('../features/inventory.feature')
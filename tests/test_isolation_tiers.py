@@ -0,0 +1,147 @@
+"""
+Tests for the pooled isolation tiers (reset-context and shared-page).
+The browser context and its pages are stand-ins, so no browser is needed.
+"""
+import asyncio
+
+import pytest
+
+from mcp_integration import MCPPlaywrightClient
+
+
+class FakePage:
+    """Tab with a URL and per-origin sessionStorage."""
+
+    def __init__(self, context, url="about:blank"):
+        self.context = context
+        self.url = url
+        self.session_storage = {}
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def evaluate(self, script):
+        assert script == "() => location.origin"
+        return "/".join(self.url.split("/")[:3])
+
+    async def close(self):
+        self.closed = True
+        self.context.open_pages.remove(self)
+
+
+class FakeCDPSession:
+    """CDP session that clears the context's per-origin storage."""
+
+    def __init__(self, context):
+        self.context = context
+        self.detached = False
+
+    async def send(self, method, params):
+        assert method == "Storage.clearDataForOrigin"
+        assert "local_storage" in params["storageTypes"] and "indexeddb" in params["storageTypes"]
+        self.context.cleared.append(params["origin"])
+        self.context.storage.pop(params["origin"], None)
+
+    async def detach(self):
+        self.detached = True
+
+
+class FakeContext:
+    """Browser context holding cookies, per-origin storage, tabs and route handlers."""
+
+    def __init__(self):
+        self.cookies = []
+        self.storage = {}  # origin -> {"localStorage": {...}, "indexedDB": [...]}
+        self.open_pages = []
+        self.routes = []
+        self.cleared = []
+
+    @property
+    def pages(self):
+        return list(self.open_pages)  # A copy, as Playwright returns
+
+    async def storage_state(self):
+        return {
+            "cookies": list(self.cookies),
+            "origins": [
+                {"origin": origin, "localStorage": [{"name": k, "value": v} for k, v in data["localStorage"].items()]}
+                for origin, data in self.storage.items() if data.get("localStorage")
+            ]
+        }
+
+    async def new_cdp_session(self, page):
+        return FakeCDPSession(self)
+
+    async def clear_cookies(self):
+        self.cookies = []
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.open_pages.append(page)
+        return page
+
+    async def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+
+@pytest.fixture
+def used_context():
+    """A pooled context as a previous test left it: logged in, with state on three origins and a second tab."""
+    context = FakeContext()
+    context.cookies = [{"name": "session-username", "value": "standard_user"}]
+    context.storage = {
+        "https://www.saucedemo.com": {"localStorage": {"cart-contents": "[4]"}},
+        "https://accounts.example.com": {"localStorage": {"token": "t"}},
+        "https://cdn.example.com": {"indexedDB": ["assets"]}  # Only found through the current page
+    }
+    page = FakePage(context, "https://cdn.example.com/inventory.html")
+    page.session_storage = {"https://www.saucedemo.com": {"step": "2"}}
+    context.open_pages = [page, FakePage(context, "https://www.saucedemo.com/cart.html")]
+    return context
+
+
+def pooled_client(context, tier):
+    """Client holding the pooled context and page under the given tier."""
+    client = MCPPlaywrightClient()
+    client.context = context
+    client.page = context.pages[0]
+    client.isolation = tier
+    return client
+
+
+class TestPooledTiers:
+    """What the next test starts from on a pooled context."""
+
+    def test_reset_context_starts_clean(self, used_context):
+        """No cookies, no storage on any origin the context used, and a single blank tab."""
+        client = pooled_client(used_context, "reset-context")
+        old_pages = list(used_context.pages)
+        asyncio.run(client._open_page("http://127.0.0.1:9333", headless=True))
+
+        assert used_context.cookies == []
+        assert used_context.storage == {}
+        assert sorted(used_context.cleared) == [
+            "https://accounts.example.com", "https://cdn.example.com", "https://www.saucedemo.com"
+        ]
+        assert used_context.pages == [client.page]
+        assert client.page.url == "about:blank" and client.page.session_storage == {}
+        assert all(page.closed for page in old_pages)
+
+    def test_shared_page_keeps_everything(self, used_context):
+        """The same page, cookies and storage are handed to the next test."""
+        client = pooled_client(used_context, "shared-page")
+        page = client.page
+        asyncio.run(client._open_page("http://127.0.0.1:9333", headless=True))
+
+        assert client.page is page and not page.closed
+        assert page.session_storage == {"https://www.saucedemo.com": {"step": "2"}}
+        assert used_context.cookies and len(used_context.storage) == 3 and len(used_context.pages) == 2
+
+    def test_pooled_context_gets_new_route_handlers(self, used_context):
+        """Handlers registered after the context was opened are installed once."""
+        client = pooled_client(used_context, "shared-page")
+        client.route_handlers = [("**/*", lambda route: None)]
+        asyncio.run(client._open_page("http://127.0.0.1:9333", headless=True))
+        asyncio.run(client._open_page("http://127.0.0.1:9333", headless=True))
+        assert used_context.routes == ["**/*"]
@@ -0,0 +1,90 @@
+"""
+Tests for the load-test latency histogram and arrival schedule.
+Pure computations, so no browser or virtual users are started.
+"""
+import math
+import random
+import threading
+
+import pytest
+
+from support.load_test import LatencyHistogram, arrival_offsets
+
+
+def exact_percentile_us(values_us, percentile):
+    """Nearest-rank percentile of exact microsecond values, the oracle for the histogram."""
+    ordered = sorted(values_us)
+    return ordered[max(1, math.ceil(percentile / 100.0 * len(ordered))) - 1]
+
+
+class TestLatencyHistogram:
+    """Percentiles within the histogram's precision."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_percentiles_match_exact_values_within_precision(self, seed):
+        """Each percentile is at or just above the exact value, within 10^-2 relative error."""
+        rng = random.Random(seed)
+        seconds = [rng.lognormvariate(-3, 1.2) for _ in range(5000)]
+        histogram = LatencyHistogram(significant_digits=2)
+        for value in seconds:
+            histogram.record(value)
+        values_us = [int(value * 1_000_000) for value in seconds]
+
+        for percentile in (1, 25, 50, 90, 95, 99, 99.9, 100):
+            exact = exact_percentile_us(values_us, percentile)
+            reported = histogram.value_at_percentile(percentile) * 1000
+            assert exact <= reported <= exact * 1.01 + 1, percentile
+
+    def test_summary(self):
+        """Count, throughput, min, mean and max are exact; percentiles never exceed the max."""
+        histogram = LatencyHistogram()
+        for ms in (10, 20, 30, 40):
+            histogram.record(ms / 1000)
+        summary = histogram.summary(elapsed=2.0)
+        assert (summary["count"], summary["throughput_per_s"]) == (4, 2.0)
+        assert (summary["min_ms"], summary["mean_ms"], summary["max_ms"]) == (10.0, 25.0, 40.0)
+        assert summary["p50_ms"] == pytest.approx(20, rel=0.01)
+        assert summary["p99_ms"] == 40.0
+
+    def test_empty_histogram(self):
+        """An empty histogram reports zeros."""
+        summary = LatencyHistogram().summary(elapsed=0)
+        assert summary["count"] == summary["p95_ms"] == summary["throughput_per_s"] == summary["min_ms"] == 0
+
+    def test_concurrent_recording(self):
+        """Virtual-user threads may record at once without losing samples."""
+        histogram = LatencyHistogram()
+        threads = [
+            threading.Thread(target=lambda: [histogram.record(0.001 * n) for n in range(1, 1001)]) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert histogram.total_count == sum(histogram.counts.values()) == 8000
+        assert histogram.max_us == 1_000_000
+
+
+class TestArrivalOffsets:
+    """Open-model arrival schedule."""
+
+    def test_constant_rate(self):
+        """Without ramp-up arrivals are evenly spaced at 1/rate."""
+        assert arrival_offsets(rate=4, ramp_up=0, duration=1) == [0.25, 0.5, 0.75, 1.0]
+
+    def test_ramp_up_follows_the_cumulative_arrival_curve(self):
+        """During a linear ramp the arrivals by time t are rate * t^2 / (2 * ramp_up)."""
+        rate, ramp_up, duration = 10, 8, 4
+        offsets = arrival_offsets(rate, ramp_up, duration)
+        assert len(offsets) == int(rate * ramp_up / 2 + rate * duration)
+        assert offsets == sorted(offsets)
+        for t in (2, 4, 6, 8):
+            arrived = sum(1 for offset in offsets if offset <= t + 1e-9)
+            assert arrived == math.floor(rate * t * t / (2 * ramp_up) + 1e-9)
+        assert offsets[-1] == pytest.approx(ramp_up + duration)
+        gaps = [later - earlier for earlier, later in zip(offsets, offsets[1:])]
+        assert gaps[-1] == pytest.approx(1 / rate)  # Held at the target rate after the ramp
+
+    def test_no_rate_no_arrivals(self):
+        """A zero rate schedules nothing."""
+        assert arrival_offsets(rate=0, ramp_up=5, duration=10) == []
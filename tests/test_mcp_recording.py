@@ -0,0 +1,127 @@
+"""
+Offline tests for recording and replaying MCP client command streams.
+Records in simulation mode, so no browser or network is needed.
+"""
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_integration import MCPPlaywrightClient, mcp_navigate, mcp_type, mcp_verify_text, mcp_check_many
+from pages.base_page import BasePage, reports_failure
+from pages.login_page import LoginPage
+from support.mcp_recording import CommandRecorder, ReplayBackend, ReplayMismatchError, drives_client, recording_path
+
+
+def login_stream(client, password="secret_sauce"):
+    """Issue a short login-like command stream."""
+    return [
+        mcp_navigate("https://www.saucedemo.com/", client=client),
+        mcp_type("[data-test='password']", password, "password field", client=client),
+        mcp_check_many([{"kind": "visible", "selector": ".inventory_list"}], client=client),
+        mcp_verify_text("Products", client=client)
+    ]
+
+
+@pytest.fixture
+def recording(tmp_path, monkeypatch):
+    """Path of a command stream recorded from the simulated login stream."""
+    monkeypatch.setenv("MCP_MODE", "simulation")
+    client = MCPPlaywrightClient()
+    client.recorder = CommandRecorder(recording_path("features/login.feature::test_login", str(tmp_path)))
+    recorded = login_stream(client)
+    return client.recorder.save(), recorded
+
+
+class TestMCPRecording:
+    """Record and replay of client command streams."""
+
+    def test_replay_serves_recorded_results(self, recording):
+        """Replay at zero latency returns the recorded results without running the operations."""
+        path, recorded = recording
+        client = MCPPlaywrightClient()
+        client.replay = ReplayBackend.load(path)
+
+        started = time.time()
+        assert login_stream(client) == recorded
+        assert time.time() - started < 0.05  # simulation sleeps several hundred ms
+        client.replay.finish()
+
+    def test_passwords_are_not_recorded(self, recording):
+        """Typed passwords are stored redacted."""
+        path, _ = recording
+        assert "secret_sauce" not in str(ReplayBackend.load(path).entries)
+
+    def test_changed_stream_is_reported(self, recording):
+        """A command that differs from the recording raises with its sequence number."""
+        path, _ = recording
+        client = MCPPlaywrightClient()
+        client.replay = ReplayBackend.load(path)
+
+        assert mcp_navigate("https://www.saucedemo.com/", client=client)
+        with pytest.raises(ReplayMismatchError, match="#1"):
+            mcp_verify_text("Products", client=client)
+
+    def test_page_objects_do_not_swallow_mismatches(self, recording):
+        """Page objects turn failed actions into False but let a replay mismatch fail the test."""
+        path, _ = recording
+        client = MCPPlaywrightClient()
+        client.replay = ReplayBackend.load(path)
+        page = LoginPage(client)
+
+        assert page.navigate_to("https://www.saucedemo.com/")
+        with pytest.raises(ReplayMismatchError, match="#1"):
+            page.click_login_button()
+        with pytest.raises(ReplayMismatchError):
+            page.login("standard_user", "secret_sauce")
+
+    def test_missing_commands_are_reported(self, recording):
+        """Commands left unissued fail the replay."""
+        path, _ = recording
+        client = MCPPlaywrightClient()
+        client.replay = ReplayBackend.load(path)
+
+        mcp_navigate("https://www.saucedemo.com/", client=client)
+        with pytest.raises(ReplayMismatchError, match="3 recorded command"):
+            client.replay.finish()
+
+    def test_recorded_latency(self, recording):
+        """Replay at recorded latency takes about as long as the recording."""
+        path, _ = recording
+        client = MCPPlaywrightClient()
+        client.replay = ReplayBackend.load(path, latency="recorded")
+        recorded_seconds = sum(entry[3] for entry in client.replay.entries) / 1000
+
+        started = time.time()
+        login_stream(client)
+        assert time.time() - started >= recorded_seconds * 0.9
+
+    def test_only_tests_driving_the_client_are_replayed(self):
+        """Scenarios and tests asking for a browser fixture are replayed; unit tests are not."""
+        def scenario(request):
+            pass
+        scenario.__scenario__ = object()
+
+        def browser_test(self, browser_context):
+            pass
+
+        def unit_test(self, tmp_path):
+            pass
+
+        assert drives_client(SimpleNamespace(function=scenario))
+        assert drives_client(SimpleNamespace(function=browser_test))
+        assert not drives_client(SimpleNamespace(function=unit_test))
+        assert not drives_client(SimpleNamespace())
+
+    def test_reports_failure(self, capsys):
+        """Errors become the default and are printed with the arguments; replay mismatches propagate."""
+        class Page(BasePage):
+            @reports_failure("Failed on {selector}: {error}", default=lambda selector, **_: [selector])
+            def operation(self, selector, exception):
+                raise exception
+
+        page = Page()
+        assert page.operation("#menu", RuntimeError("gone")) == ["#menu"]
+        assert "Failed on #menu: gone" in capsys.readouterr().out
+        with pytest.raises(ReplayMismatchError):
+            page.operation("#menu", ReplayMismatchError("#3"))
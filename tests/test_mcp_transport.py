@@ -0,0 +1,287 @@
+"""
+Offline tests for the persistent MCP JSON-RPC transport.
+Runs against the bundled stub MCP server, so no browser or network is needed.
+"""
+import asyncio
+import random
+import re
+import threading
+import time
+
+import pytest
+
+from mcp_integration import (
+    MCPPlaywrightClient, mcp_navigate, mcp_click, mcp_verify_text, mcp_disconnect, mcp_snapshot_stats
+)
+from support.aria_snapshot import SnapshotTree, parse_line
+from support.mcp_pool import MCPConnectionPool, close_shared_pool
+from support.mcp_transport import (
+    MCPStdioTransport, MCPError, MCPTimeoutError, stub_server_command, tool_result_value, run_transport_benchmark
+)
+
+
+@pytest.fixture
+def transport():
+    """Transport connected to a stub MCP server with 20 ms latency per tool call."""
+    transport = MCPStdioTransport(stub_server_command(latency_ms=20)).start()
+    yield transport
+    transport.close()
+
+
+class TestMCPTransport:
+    """Transport behaviour against the stub MCP server."""
+
+    def test_initialize_handshake(self, transport):
+        """The initialize handshake returns the server info."""
+        assert transport.server_info["serverInfo"]["name"] == "stub-mcp-server"
+
+    def test_pipelined_requests_resolve_by_id(self, transport):
+        """Many in-flight requests on one connection each get their own response."""
+        started = time.time()
+        futures = [
+            transport.request("tools/call", {"name": "browser_navigate", "arguments": {"url": f"/page/{index}"}})
+            for index in range(50)
+        ]
+        results = [tool_result_value(transport.wait(future)) for future in futures]
+
+        assert [result["arguments"]["url"] for result in results] == [f"/page/{index}" for index in range(50)]
+        # 50 calls at 20 ms each would take a second if they were serialised
+        assert time.time() - started < 0.5
+        assert transport.in_flight == 0
+
+    def test_async_calls_share_the_connection(self, transport):
+        """Awaitable calls from one event loop are pipelined too."""
+        async def click_all():
+            return await asyncio.gather(*[
+                transport.acall_tool("browser_click", {"index": index}) for index in range(10)
+            ])
+
+        results = asyncio.run(click_all())
+        assert [tool_result_value(result)["arguments"]["index"] for result in results] == list(range(10))
+
+    def test_timeout_cancels_request(self, transport):
+        """A late request times out, is cancelled, and the connection stays usable."""
+        with pytest.raises(MCPTimeoutError):
+            transport.call_tool("sleep", {"ms": 500}, timeout=0.1)
+
+        assert transport.stats["cancelled"] == 1
+        assert transport.in_flight == 0
+        assert tool_result_value(transport.call_tool("browser_snapshot"))["tool"] == "browser_snapshot"
+
+    def test_errors_are_raised(self, transport):
+        """JSON-RPC errors and failed tool results raise MCPError."""
+        with pytest.raises(MCPError) as error:
+            transport.call("unknown/method")
+        assert error.value.code == -32601
+
+        with pytest.raises(MCPError):
+            transport.call_tool("not_a_tool")
+
+    def test_client_uses_transport_in_real_mode(self, monkeypatch):
+        """MCP_MODE=real routes client operations through the transport."""
+        monkeypatch.setenv("MCP_MODE", "real")
+        monkeypatch.setenv("MCP_SERVER_COMMAND", " ".join(stub_server_command()))
+        client = MCPPlaywrightClient()
+        try:
+            assert mcp_navigate("https://www.saucedemo.com/", client=client)
+            assert client.transport.stats["responses"] >= 2  # initialize + browser_navigate
+        finally:
+            mcp_disconnect(client=client)
+            close_shared_pool()
+
+    def test_pipelining_benchmark(self):
+        """Pipelined calls outperform sequential calls on the same connection."""
+        result = run_transport_benchmark(requests=100, latency_ms=5)
+        print(f"sequential {result['sequential_per_second']:.0f}/s, "
+              f"pipelined {result['pipelined_per_second']:.0f}/s ({result['speedup']:.1f}x)")
+        assert result["speedup"] > 2
+
+
+class TestMCPConnectionPool:
+    """Routing across several stub MCP servers."""
+
+    @pytest.fixture
+    def pool(self):
+        """Pool of three stub servers with 20 ms latency per tool call."""
+        pool = MCPConnectionPool(shards=3, command=stub_server_command(latency_ms=20)).start()
+        yield pool
+        pool.close()
+
+    def test_sessions_are_sticky(self, pool):
+        """A session is routed to the same shard until released."""
+        shard = pool.shard_for("session-a")
+        shard.call_tool("browser_navigate", {"url": "/"})
+        assert pool.shard_for("session-a") is shard
+
+        pool.release("session-a")
+        assert "session-a" not in shard.sessions
+
+    def test_new_sessions_avoid_busy_shards(self, pool):
+        """New sessions go to the shard with the fewest outstanding requests."""
+        busy = pool.shard_for("busy")
+        futures = [
+            busy.transport.request("tools/call", {"name": "sleep", "arguments": {"ms": 300}}) for _ in range(5)
+        ]
+        assigned = {pool.shard_for(f"session-{index}") for index in range(4)}
+        for future in futures:
+            busy.transport.wait(future)
+
+        assert busy not in assigned
+        assert len(assigned) == 2  # spread over the two idle shards
+
+    def test_idle_shards_share_sessions_evenly(self):
+        """With no requests in flight, new sessions go to the shard with the fewest sessions."""
+        pool = MCPConnectionPool(shards=3, command=stub_server_command())  # Routing needs no running servers
+        routed = {session: pool.shard_for(session).index for session in "abcdef"}
+        assert sorted(routed.values()) == [0, 0, 1, 1, 2, 2]
+
+        pool.release("a")
+        pool.release("d")
+        assert {pool.shard_for("g").index, pool.shard_for("h").index} == {routed["a"], routed["d"]}
+        assert sum(shard.sessions_served for shard in pool.shards) == 8
+        assert [len(shard.sessions) for shard in pool.shards] == [2, 2, 2]
+
+    def test_concurrent_routing_keeps_one_shard_per_session(self):
+        """Threads routing the same sessions at once agree on each session's shard."""
+        pool = MCPConnectionPool(shards=4, command=stub_server_command())
+        routes = []
+
+        def route_all():
+            routes.append({session: pool.shard_for(session) for session in map(str, range(40))})
+
+        threads = [threading.Thread(target=route_all) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(route == routes[0] for route in routes)
+        assert sum(shard.sessions_served for shard in pool.shards) == 40
+        assert sorted(len(shard.sessions) for shard in pool.shards) == [10, 10, 10, 10]
+
+    def test_stats_report_queue_depth_and_latency(self, pool):
+        """Per-shard stats include request counts, peak queue depth and latency."""
+        shard = pool.shard_for("session")
+
+        async def navigate_all():
+            await asyncio.gather(*[shard.acall_tool("browser_navigate", {"url": f"/{index}"}) for index in range(8)])
+
+        asyncio.run(navigate_all())
+        stats = pool.stats()[shard.index]
+        assert stats["requests"] == 8
+        assert stats["max_outstanding"] == 8
+        assert stats["p50_ms"] >= 20
+
+
+class TestSessionTabs:
+    """Sessions sharing one MCP server keep separate tabs."""
+
+    @pytest.fixture
+    def shard(self):
+        """Only shard of a one-server pool, so every session lands on it."""
+        pool = MCPConnectionPool(shards=1, command=stub_server_command(latency_ms=5)).start()
+        yield pool.shard_for("a")
+        pool.close()
+
+    @staticmethod
+    def page_url(result):
+        """Page URL the stub server appends to a tool result."""
+        return re.search(r"Page URL: (\S+)", result["content"][0]["text"]).group(1)
+
+    def test_concurrent_sessions_do_not_share_a_page(self, shard):
+        """Interleaved sessions each see only their own navigations."""
+        async def session(name):
+            urls = []
+            for step in range(5):
+                await shard.acall_session_tool(name, "browser_navigate", {"url": f"/{name}/{step}"})
+                urls.append(self.page_url(await shard.acall_session_tool(name, "browser_snapshot")))
+            return urls
+
+        async def run_sessions():
+            return await asyncio.gather(session("a"), session("b"), session("c"))
+
+        for name, urls in zip("abc", asyncio.run(run_sessions())):
+            assert urls == [f"/{name}/{step}" for step in range(5)]
+        assert shard.open_tabs() == ["a", "b", "c"]
+
+    def test_closing_a_session_keeps_other_tabs(self, shard):
+        """Closing a session closes its tab only; the others continue where they were."""
+        async def run_sessions():
+            for name in "abc":
+                await shard.acall_session_tool(name, "browser_navigate", {"url": f"/{name}"})
+            await shard.aclose_session("b")
+            return [self.page_url(await shard.acall_session_tool(name, "browser_snapshot")) for name in "ca"]
+
+        assert asyncio.run(run_sessions()) == ["/c", "/a"]
+        assert shard.open_tabs() == ["a", "c"]
+
+
+class TestAccessibilitySnapshots:
+    """Incremental ARIA snapshot tree kept from MCP tool responses."""
+
+    def test_parse_line(self):
+        """Role, name, ref and inline text are read from a snapshot line."""
+        node = parse_line('    - button "Add to cart" [ref=e12]')
+        assert (node.depth, node.role, node.name, node.ref) == (2, "button", "Add to cart", "e12")
+        assert parse_line('  - text: "Products"').text == "Products"
+
+    def test_delta_reparses_changed_lines_only(self):
+        """Applying a snapshot that differs in one line parses only that line."""
+        lines = [f'- button "Item {index}" [ref=e{index}]' for index in range(100)]
+        tree = SnapshotTree()
+        first = tree.apply("\n".join(lines), version=1)
+        lines[40] = '- button "Remove" [ref=e40]'
+        second = tree.apply("\n".join(lines), version=2)
+
+        assert first["changed_lines"] == 100
+        assert second["changed_lines"] == 1
+        assert second["delta_bytes"] == len(lines[40]) + 1
+        assert tree.find(role="button", name="Remove")[0].ref == "e40"
+        assert not tree.find(name="Item 40")
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_incremental_apply_matches_full_parse(self, seed):
+        """After random inserts, deletes, edits and moves the tree equals a full parse of the snapshot."""
+        rng = random.Random(seed)
+        roles = ["button", "link", "heading", "text", "listitem"]
+
+        def random_line():
+            return f'{"  " * rng.randint(0, 3)}- {rng.choice(roles)} "Item {rng.randint(0, 20)}" [ref=e{rng.randint(0, 99)}]'
+
+        lines = [random_line() for _ in range(30)]
+        tree = SnapshotTree()
+        tree.apply("\n".join(lines), version=0)
+        for version in range(1, 40):
+            for _ in range(rng.randint(1, 4)):
+                edit = rng.choice(["insert", "delete", "replace", "move"])
+                if edit == "insert" or not lines:
+                    lines.insert(rng.randint(0, len(lines)), random_line())
+                elif edit == "delete":
+                    lines.pop(rng.randrange(len(lines)))
+                elif edit == "replace":
+                    lines[rng.randrange(len(lines))] = random_line()
+                else:
+                    lines.insert(rng.randint(0, len(lines) - 1), lines.pop(rng.randrange(len(lines))))
+            tree.apply("\n".join(lines), version=version)
+            assert tree.nodes == [parse_line(line) for line in lines], (seed, version)
+            assert tree.lines == lines
+
+    def test_client_answers_text_checks_from_tree(self, monkeypatch):
+        """In real mode text checks after an action need no extra evaluate call."""
+        monkeypatch.setenv("MCP_MODE", "real")
+        monkeypatch.setenv("MCP_SERVER_COMMAND", " ".join(stub_server_command()))
+        client = MCPPlaywrightClient()
+        try:
+            assert mcp_navigate("https://www.saucedemo.com/inventory.html", client=client)
+            assert mcp_snapshot_stats(client=client)["snapshots"] == 1
+            assert mcp_click("[data-test='add-to-cart']", client=client)
+            requests = client.transport.stats["requests"]
+            assert mcp_verify_text("Products", client=client)
+            assert client.transport.stats["requests"] == requests
+
+            stats = mcp_snapshot_stats(client=client)
+            assert stats["snapshots"] == 1
+            assert stats["delta_bytes"] < stats["bytes"] / 10  # the page barely changed on click
+            assert mcp_snapshot_stats(client=client) is None
+        finally:
+            mcp_disconnect(client=client)
+            close_shared_pool()
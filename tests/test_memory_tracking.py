@@ -0,0 +1,73 @@
+"""
+Tests for per-test memory samples and the per-worker leak detector.
+"""
+import os
+import tracemalloc
+
+from support.memory_tracking import LeakDetector, memory_sample, process_rss, reset_python_peak, start_python_tracking
+
+MIB = 1024 * 1024
+
+
+def feed(detector, worker, values, metric="browser_rss"):
+    """Add one sample per value to a worker's series."""
+    for index, value in enumerate(values):
+        detector.add(worker, f"tests/test_cart.py::test_{worker}_{index}", {metric: value})
+
+
+class TestLeakDetector:
+    """Monotonic-growth detection and recycle recommendation."""
+
+    def test_flags_growth_over_window_with_recycle_point(self):
+        """A metric growing on every test is flagged, recycling where it passed the budget."""
+        detector = LeakDetector(window=5, min_growth=0.1, budget=0.5)
+        feed(detector, "gw0", [100 * MIB + step * 10 * MIB for step in range(12)])
+
+        [leak] = detector.find_leaks()
+        assert leak["worker"] == "gw0" and leak["metric"] == "browser_rss"
+        assert leak["tests"] == 12
+        assert leak["growth"] == 110 * MIB
+        assert leak["recycle_after"] == 6  # 160 MiB is the first sample above 150 MiB
+
+    def test_ignores_short_runs_and_noise(self):
+        """Growth interrupted before the window, or too small, is not a leak."""
+        detector = LeakDetector(window=5, min_growth=0.1)
+        feed(detector, "gw0", [100, 110, 120, 130, 90, 100, 110, 120, 80])
+        feed(detector, "gw1", [1000, 1001, 1002, 1003, 1004, 1005])
+        assert detector.find_leaks() == []
+
+    def test_series_are_kept_per_worker(self):
+        """Interleaved workers do not hide each other's growth."""
+        detector = LeakDetector(window=4, min_growth=0.1)
+        for step in range(6):
+            detector.add("gw0", f"a{step}", {"js_heap_used": 10 * MIB + step * MIB})
+            detector.add("gw1", f"b{step}", {"js_heap_used": 10 * MIB - step * MIB})
+
+        assert [leak["worker"] for leak in detector.find_leaks()] == ["gw0"]
+
+
+class TestMemorySample:
+    """Python and process counters."""
+
+    def test_python_peak_is_reset_per_test(self):
+        """tracemalloc's peak covers only allocations since the last reset."""
+        was_tracing = tracemalloc.is_tracing()
+        start_python_tracking()
+        try:
+            reset_python_peak()
+            block = bytearray(4 * MIB)
+            del block
+            first = memory_sample({"browser_rss": 1})
+            reset_python_peak()
+            second = memory_sample()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        assert first["browser_rss"] == 1 and second["browser_rss"] is None
+        assert first["py_peak"] >= 4 * MIB > second["py_peak"]
+
+    def test_process_rss_of_this_process(self):
+        """RSS of a live process is read from /proc where it exists."""
+        rss = process_rss([os.getpid()])
+        assert rss is None or rss > 0
@@ -0,0 +1,60 @@
+"""
+Offline tests for page-object helpers.
+Runs the client in simulation mode, so no browser or network is needed.
+"""
+import json
+
+import pytest
+
+from mcp_integration import MCPPlaywrightClient
+from pages.cart_page import CartPage
+from pages.products_page import ProductsPage
+from TestData.test_data import BASE_URL, PRODUCTS
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Client in simulation mode."""
+    monkeypatch.setenv("MCP_MODE", "simulation")
+    return MCPPlaywrightClient()
+
+
+class TestCartSeeding:
+    """Cart state written to localStorage."""
+
+    def test_product_ids_keep_the_given_order(self):
+        """Names map to the application's product ids in order."""
+        names = ["Sauce Labs Onesie", "Sauce Labs Backpack"]
+        assert CartPage.product_ids(names) == [PRODUCTS.get_by_name(name).product_id for name in names]
+
+    def test_unknown_product_names_are_rejected(self):
+        """Unknown names are listed in the error with the names that exist."""
+        with pytest.raises(ValueError, match="Unknown product\\(s\\): Sauce Labs Kayak") as error:
+            CartPage.product_ids(["Sauce Labs Backpack", "Sauce Labs Kayak"])
+        assert "Sauce Labs Backpack" in str(error.value)
+
+    def test_seed_cart_writes_ids_and_empties_the_cart(self, client):
+        """Seeding stores the ids as a JSON list; an empty list removes the key."""
+        cart_page = CartPage(client)
+        names = ["Sauce Labs Backpack", "Sauce Labs Bike Light"]
+        assert cart_page.seed_cart(names)
+        stored = client.local_storage[BASE_URL][CartPage.CART_STORAGE_KEY]
+        assert json.loads(stored) == CartPage.product_ids(names)
+
+        assert cart_page.seed_cart([])
+        assert CartPage.CART_STORAGE_KEY not in client.local_storage[BASE_URL]
+
+
+class TestProductButtons:
+    """Add and remove buttons looked up by product name."""
+
+    def test_known_products_are_clicked(self, client):
+        """A product from the catalogue is added and removed through its data-test button."""
+        assert ProductsPage(client).add_product_to_cart_by_name("Sauce Labs Backpack")
+        assert CartPage(client).remove_item_from_cart("Sauce Labs Backpack")
+
+    def test_unknown_products_fail_without_raising(self, client, capsys):
+        """An unknown name reports False, so the step fails its assertion instead of crashing."""
+        assert ProductsPage(client).add_product_to_cart_by_name("Sauce Labs Kayak") is False
+        assert CartPage(client).remove_item_from_cart("Sauce Labs Kayak") is False
+        assert "Unknown product: Sauce Labs Kayak" in capsys.readouterr().out
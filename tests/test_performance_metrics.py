@@ -0,0 +1,67 @@
+"""
+Tests for the performance metrics behind the latency-budget steps.
+Metrics are derived from operation logs, so no browser is needed.
+"""
+import pytest
+
+from mcp_integration import MCPPlaywrightClient, mcp_click, mcp_mark_transition, mcp_measure_transition
+from support.performance_metrics import longest_task_ms, page_load_ms, simulated_metrics, simulated_transition_ms
+
+
+class TestSimulatedMetrics:
+    """Metrics derived from client operation timings."""
+
+    def test_latest_navigation_or_click_is_the_page_load(self):
+        """The most recent navigate or click sets the load time; other operations are ignored."""
+        log = [("navigate", 0.0, 2.0), ("click", 2.0, 0.5), ("type", 2.5, 3.0)]
+        metrics = simulated_metrics(log)
+        assert metrics["source"] == "simulation"
+        assert page_load_ms(metrics) == 500.0
+        assert metrics["navigation"]["ttfb_ms"] < metrics["navigation"]["dom_content_loaded_ms"] < 500.0
+        assert metrics["paint"]["first_paint_ms"] < metrics["paint"]["first_contentful_paint_ms"] < 500.0
+        assert longest_task_ms(metrics) == 0.0
+
+    def test_no_page_operations(self):
+        """Without a navigation or click every timing is zero."""
+        assert page_load_ms(simulated_metrics([("type", 0.0, 1.0)])) == 0.0
+        assert page_load_ms(simulated_metrics([])) == 0.0
+
+
+class TestSimulatedTransition:
+    """Route-change timing from the operation log."""
+
+    def test_ends_with_the_last_operation_after_the_mark(self):
+        """Operations started before the mark do not count; the latest end after it does."""
+        log = [("navigate", 0.0, 5.0), ("click", 10.0, 0.25), ("wait_for_element", 10.25, 0.5)]
+        assert simulated_transition_ms(log, marked_at=10.0) == pytest.approx(750.0)
+
+    def test_nothing_after_the_mark(self):
+        """A mark with no later operations measures zero."""
+        assert simulated_transition_ms([("navigate", 0.0, 5.0)], marked_at=10.0) == 0.0
+
+    def test_client_measures_marked_transitions(self, monkeypatch):
+        """In simulation the client times a marked transition and knows nothing of unmarked ones."""
+        monkeypatch.setenv("MCP_MODE", "simulation")
+        client = MCPPlaywrightClient()
+        assert mcp_mark_transition("login-click", client=client)
+        assert mcp_click("#login-button", "login button", client=client)
+        elapsed = mcp_measure_transition("login-click", ".inventory_list", client=client)
+        assert elapsed > 0
+        assert mcp_measure_transition("never-marked", ".inventory_list", client=client) is None
+
+
+class TestMetricAccessors:
+    """Reading budgets out of collected metrics."""
+
+    def test_page_load(self):
+        """The load event time, or None when no navigation timing was collected."""
+        assert page_load_ms({"navigation": {"load_event_ms": 812.5}}) == 812.5
+        assert page_load_ms({"navigation": None}) is None
+        assert page_load_ms(None) is None
+
+    def test_longest_task(self):
+        """The longest observed long task, or 0 when there were none."""
+        metrics = {"long_tasks": [{"duration": 63.0}, {"duration": 250.5}, {"duration": 51.0}]}
+        assert longest_task_ms(metrics) == 250.5
+        assert longest_task_ms({"long_tasks": []}) == 0.0
+        assert longest_task_ms(None) == 0.0
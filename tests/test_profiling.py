@@ -0,0 +1,60 @@
+"""
+Tests for the sampling profiler behind run_tests.py --profile.
+"""
+import json
+import time
+
+from support.profiling import (
+    SamplingProfiler, hot_frames, profile_selected, read_collapsed, render_flamegraph, write_profile,
+    write_run_profile
+)
+
+
+def busy_wait(seconds):
+    """Burn CPU in a recognisable frame."""
+    deadline = time.time() + seconds
+    while time.time() < deadline:
+        pass
+
+
+class TestSamplingProfiler:
+    """Sampling and output formats."""
+
+    def test_samples_the_calling_thread(self):
+        """The busy frame dominates the samples of the thread that started the profiler."""
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        busy_wait(0.2)
+        stacks = profiler.stop()
+
+        assert sum(stacks.values()) > 20
+        frame, _count = hot_frames(stacks, limit=1)[0]
+        assert frame.startswith("busy_wait (tests/test_profiling.py:")
+
+    def test_collapsed_and_speedscope_round_trip(self, tmp_path):
+        """Collapsed files read back unchanged; speedscope weights follow the interval."""
+        stacks = {"main;run;step": 3, "main;run": 1}
+        collapsed, speedscope = write_profile(stacks, tmp_path / "test_cart", "test_cart", interval=0.01)
+
+        assert read_collapsed(collapsed) == stacks
+        document = json.loads(open(speedscope).read())
+        profile = document["profiles"][0]
+        assert [frame["name"] for frame in document["shared"]["frames"]] == ["main", "run", "step"]
+        assert profile["samples"] == [[0, 1], [0, 1, 2]]
+        assert profile["endValue"] == 40
+
+    def test_run_flamegraph(self, tmp_path):
+        """The merged profile includes an SVG with one rectangle per visible frame."""
+        files = write_run_profile({"main;run;step": 3, "main;other": 1}, str(tmp_path))
+
+        assert [path.rsplit("/", 1)[-1] for path in files] == ["run.collapsed", "run.speedscope.json", "flamegraph.svg"]
+        svg = render_flamegraph({"main;run;step": 3, "main;other": 1}, "title")
+        assert svg.count("<rect") == 4 and "main: 4 samples (100.0%)" in svg
+
+    def test_selection(self):
+        """Tests are selected by 'all' or by node id substrings."""
+        nodeid = "tests/test_cart.py::test_checkout"
+        assert profile_selected(nodeid, "all")
+        assert profile_selected(nodeid, "sort, checkout")
+        assert not profile_selected(nodeid, "sort")
+        assert not profile_selected(nodeid, "")
@@ -0,0 +1,113 @@
+"""
+Tests for request-blocking profiles and the bytes they save.
+Routes are stand-ins, so no browser is needed.
+"""
+import asyncio
+from types import SimpleNamespace
+
+from support.request_blocking import RequestBlocker
+
+
+PROFILES = {
+    "functional": {"resource_types": ["image"], "url_patterns": ["*://ads.example.com/*"]},
+    "full": {"resource_types": [], "url_patterns": []}
+}
+
+
+class FakeRoute:
+    """Route whose page context answers HEAD requests from a size table."""
+
+    def __init__(self, url, resource_type, sizes, heads):
+        async def head(url, timeout=None):
+            heads.append(url)
+            if url not in sizes:
+                raise RuntimeError("unreachable")
+            return SimpleNamespace(headers={"content-length": str(sizes[url])})
+
+        context = SimpleNamespace(request=SimpleNamespace(head=head))
+        self.request = SimpleNamespace(url=url, resource_type=resource_type,
+                                       frame=SimpleNamespace(page=SimpleNamespace(context=context)))
+        self.outcome = None
+
+    async def abort(self, error_code=None):
+        self.outcome = "aborted"
+
+    async def fallback(self):
+        self.outcome = "fallback"
+
+
+def route_all(blocker, requests, sizes, heads):
+    """Send (url, resource_type) requests through the blocker; returns the routes."""
+    routes = [FakeRoute(url, resource_type, sizes, heads) for url, resource_type in requests]
+
+    async def run():
+        for route in routes:
+            await blocker.handle_route(route)
+
+    asyncio.run(run())
+    return routes
+
+
+class TestRequestBlocker:
+    """Blocking decisions and blocked-byte accounting."""
+
+    def test_blocked_hosts_are_not_contacted_by_default(self):
+        """Without opting in, only the asset cache sizes blocked URLs."""
+        heads = []
+        blocker = RequestBlocker(PROFILES, "functional", size_hint=lambda url: 0)
+        routes = route_all(blocker, [("https://ads.example.com/pixel", "xhr")], {"https://ads.example.com/pixel": 90},
+                           heads)
+        assert routes[0].outcome == "aborted"
+        assert heads == []
+        assert (blocker.stats["blocked_requests"], blocker.stats["blocked_bytes"]) == (1, 0)
+
+    def test_late_sizes_go_to_the_test_that_blocked_them(self):
+        """A HEAD lookup finishing after a profile switch does not count toward the next test."""
+        blocker = RequestBlocker(PROFILES, "functional", head_lookup=True)
+        first_test = blocker.stats
+
+        async def head(url, timeout=None):
+            blocker.use_profile("functional")  # The next test starts while HEAD is in flight
+            return SimpleNamespace(headers={"content-length": "400"})
+
+        route = FakeRoute("https://shop.example.com/a.png", "image", {}, [])
+        route.request.frame.page.context.request.head = head
+        asyncio.run(blocker.handle_route(route))
+        assert (first_test["blocked_requests"], first_test["blocked_bytes"]) == (1, 400)
+        assert (blocker.stats["blocked_requests"], blocker.stats["blocked_bytes"]) == (0, 0)
+
+    def test_blocked_bytes_from_head_content_length(self):
+        """A blocked URL is sized once by HEAD; passed requests are not sized."""
+        heads = []
+        blocker = RequestBlocker(PROFILES, "functional", head_lookup=True)
+        routes = route_all(blocker, [
+            ("https://shop.example.com/a.png", "image"),
+            ("https://shop.example.com/a.png", "image"),
+            ("https://shop.example.com/app.js", "script")
+        ], {"https://shop.example.com/a.png": 1500}, heads)
+        assert [route.outcome for route in routes] == ["aborted", "aborted", "fallback"]
+        assert blocker.stats["blocked_requests"] == 2
+        assert blocker.stats["blocked_bytes"] == 3000
+        assert heads == ["https://shop.example.com/a.png"]
+
+    def test_size_hint_comes_before_head(self):
+        """Sizes the asset cache knows need no HEAD request; failed lookups count 0 bytes."""
+        heads = []
+        blocker = RequestBlocker(PROFILES, "functional", head_lookup=True,
+                                 size_hint=lambda url: 700 if url.endswith("cached.png") else 0)
+        route_all(blocker, [
+            ("https://shop.example.com/cached.png", "image"),
+            ("https://ads.example.com/pixel", "xhr")
+        ], {}, heads)
+        assert blocker.stats["blocked_bytes"] == 700
+        assert heads == ["https://ads.example.com/pixel"]
+        assert blocker.stats["by_type"] == {"image": 1, "xhr": 1}
+
+    def test_profile_switch_resets_stats(self):
+        """Statistics are per test; the full profile blocks nothing."""
+        blocker = RequestBlocker(PROFILES, "functional", head_lookup=False)
+        route_all(blocker, [("https://shop.example.com/a.png", "image")], {}, [])
+        blocker.use_profile("full")
+        routes = route_all(blocker, [("https://shop.example.com/a.png", "image")], {}, [])
+        assert routes[0].outcome == "fallback"
+        assert blocker.stats["blocked_requests"] == 0
@@ -0,0 +1,53 @@
+"""
+Tests for duration-balanced CI sharding.
+Uses stand-in collected items, so no browser or pytest-bdd is needed.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from support.sharding import assign_shards, estimate_costs, parse_shard, select_shard
+
+
+def make_item(nodeid, steps):
+    """Stand-in for a pytest-bdd item whose scenario has the given number of steps."""
+    scenario = SimpleNamespace(steps=[object()] * steps)
+    return SimpleNamespace(nodeid=nodeid, obj=SimpleNamespace(__scenario__=scenario))
+
+
+ITEMS = [make_item(f"tests/test_cart.py::test_{index}", steps) for index, steps in enumerate([9, 7, 6, 5, 4, 4, 3, 2])]
+
+
+class TestSharding:
+    """Shard assignment."""
+
+    def test_parse_shard(self):
+        """Shards are 1-based i/n."""
+        assert parse_shard("2/4") == (2, 4)
+        for spec in ("0/4", "5/4", "2", "a/b"):
+            with pytest.raises(ValueError):
+                parse_shard(spec)
+
+    def test_every_test_runs_in_exactly_one_shard(self):
+        """The shards partition the collected tests."""
+        selected = [select_shard(ITEMS, f"{index}/3")[0] for index in (1, 2, 3)]
+        nodeids = [item.nodeid for shard in selected for item in shard]
+        assert sorted(nodeids) == sorted(item.nodeid for item in ITEMS)
+
+    def test_assignment_is_deterministic(self):
+        """The same inputs give the same split regardless of collection order."""
+        first = select_shard(ITEMS, "1/3")[0]
+        second = select_shard(list(reversed(ITEMS)), "1/3")[0]
+        assert {item.nodeid for item in first} == {item.nodeid for item in second}
+
+    def test_loads_are_balanced(self):
+        """Longest-first assignment keeps shards within one test of each other."""
+        costs = {f"test_{index}": cost for index, cost in enumerate([9, 7, 6, 5, 4, 4, 3, 2])}
+        assignment = assign_shards(costs, 2)
+        loads = [sum(cost for nodeid, cost in costs.items() if assignment[nodeid] == shard) for shard in (1, 2)]
+        assert loads == [20, 20]
+
+    def test_history_overrides_step_counts(self):
+        """Tests with history use their duration; the rest are priced at the same rate per step."""
+        costs = estimate_costs({"slow": 2, "new": 4}, {"slow": 10.0})
+        assert costs == {"slow": 10.0, "new": 20.0}
@@ -0,0 +1,128 @@
+"""
+Tests for the SQLite run history and the budgets, regressions and flakiness scores derived from it.
+Writes to a temporary database, so no browser or pytest-bdd is needed.
+"""
+import time
+
+import pytest
+
+from mcp_integration import MCPPlaywrightClient
+from support.test_history import RunHistory, aggregate_operations
+
+
+@pytest.fixture
+def history(tmp_path):
+    """Empty run history."""
+    store = RunHistory(str(tmp_path / "history.db"))
+    yield store
+    store.close()
+
+
+def record_runs(history, nodeid, outcomes, durations=None, revision="abc"):
+    """Record one run per outcome (or list of outcomes, for reruns) of a test, oldest first."""
+    for index, outcome in enumerate(outcomes):
+        run_id = f"{nodeid}-run{index}"
+        for attempt in outcome if isinstance(outcome, list) else [outcome]:
+            history.record_test(run_id, nodeid, attempt, durations[index] if durations else 1.0,
+                                git_revision=revision)
+
+
+class TestRunHistory:
+    """Durations and budgets."""
+
+    def test_durations_are_newest_first_and_passing_only(self, history):
+        """Failed runs and the excluded run do not count."""
+        record_runs(history, "t", ["passed", "failed", "passed", "passed"], [1.0, 9.0, 2.0, 3.0])
+        assert history.durations("t") == [3.0, 2.0, 1.0]
+        assert history.durations("t", exclude_run="t-run3") == [2.0, 1.0]
+        assert history.median_durations() == {"t": 2.0}
+        assert history.expected_duration("unknown") is None
+
+    def test_suggested_timeout(self, history):
+        """Three times the slowest recent pass, never below the floor."""
+        record_runs(history, "slow", ["passed"] * 3, [10.0, 20.0, 15.0])
+        record_runs(history, "fast", ["passed"] * 3, [1.0, 2.0, 1.0])
+        assert history.suggested_timeout("slow") == 60.0
+        assert history.suggested_timeout("fast") == 30.0
+        assert history.suggested_timeout("new", floor=45.0) == 45.0
+
+    def test_steps_and_operations_are_stored(self, history):
+        """Step and MCP-operation rows are written with the test."""
+        operations = aggregate_operations([("click", 0.0, 0.5), ("click", 1.0, 1.5), ("navigate", 2.0, 2.0)])
+        assert operations["click"] == {"calls": 2, "total": 2.0, "max": 1.5}
+        history.record_test("run", "t", "failed", 4.0, steps=[{"step": "login", "duration": 1.0, "error": "boom"}],
+                            operations=operations)
+        assert history._db.execute("SELECT step, outcome FROM step_results").fetchall() == [("login", "failed")]
+        assert history._db.execute("SELECT COUNT(*) FROM mcp_operations").fetchone() == (2,)
+
+
+class TestRegressions:
+    """Rolling-baseline regression detection."""
+
+    def test_slowdown_over_threshold_is_flagged(self, history):
+        """A recent median 50% above the baseline median is a regression; 10% is not."""
+        record_runs(history, "slower", ["passed"] * 8, [1.0] * 5 + [1.5] * 3)
+        record_runs(history, "steady", ["passed"] * 8, [1.0] * 5 + [1.1] * 3)
+        regressions = history.detect_regressions(threshold=0.25, recent_runs=3)
+        assert [regression["nodeid"] for regression in regressions] == ["slower"]
+        assert regressions[0]["change"] == pytest.approx(0.5)
+        assert (regressions[0]["baseline_median"], regressions[0]["recent_median"]) == (1.0, 1.5)
+
+    def test_too_few_samples_are_ignored(self, history):
+        """Tests without min_samples results in both windows are not judged."""
+        record_runs(history, "young", ["passed"] * 4, [1.0, 1.0, 5.0, 5.0])
+        assert history.detect_regressions(recent_runs=2, min_samples=3) == []
+
+    def test_regressions_are_sorted_by_change(self, history):
+        """The largest relative slowdown comes first."""
+        record_runs(history, "double", ["passed"] * 6, [1.0] * 3 + [2.0] * 3)
+        record_runs(history, "triple", ["passed"] * 6, [1.0] * 3 + [3.0] * 3)
+        assert [r["nodeid"] for r in history.detect_regressions(recent_runs=3)] == ["triple", "double"]
+
+
+class TestFlakiness:
+    """Flakiness scores and quarantine selection."""
+
+    def test_pass_on_retry_counts_as_flaky(self, history):
+        """A run that failed, was rerun and passed is flaky."""
+        record_runs(history, "retried", ["passed", ["rerun", "passed"], "passed", "passed"])
+        assert history.flakiness_scores()["retried"] == pytest.approx(0.25)
+
+    def test_flips_on_the_same_revision_count_as_flaky(self, history):
+        """Outcome changes between runs of one revision are flaky; across revisions they are not."""
+        record_runs(history, "flipping", ["passed", "failed", "passed", "passed"])
+        record_runs(history, "fixed", ["failed"], revision="old")
+        record_runs(history, "fixed", ["passed", "passed", "passed"], revision="new")
+        scores = history.flakiness_scores()
+        assert scores["flipping"] == pytest.approx(0.5)
+        assert scores["fixed"] == 0.0
+
+    def test_min_runs_and_window(self, history):
+        """Tests with fewer than min_runs runs are not scored; only the last window runs count."""
+        record_runs(history, "new", [["rerun", "passed"], "passed"])
+        record_runs(history, "settled", [["rerun", "passed"]] * 2 + ["passed"] * 4)
+        scores = history.flakiness_scores(window=4)
+        assert "new" not in scores
+        assert scores["settled"] == 0.0
+
+    def test_flaky_tests_above_threshold(self, history):
+        """Quarantine takes tests scoring above the threshold, most flaky first."""
+        record_runs(history, "often", [["rerun", "passed"]] * 2 + ["passed"] * 2)
+        record_runs(history, "rarely", [["rerun", "passed"]] + ["passed"] * 4)
+        record_runs(history, "stable", ["passed"] * 4)
+        assert history.flaky_tests(threshold=0.1) == ["often", "rarely"]
+        assert history.flaky_tests(threshold=0.3) == ["often"]
+
+
+class TestTimeBudget:
+    """The history budget caps client operation timeouts."""
+
+    def test_operation_timeouts_end_at_the_deadline(self):
+        """Timeouts shrink to what is left of the budget, and never reach 0 (no timeout)."""
+        client = MCPPlaywrightClient()
+        assert client._timeout_ms() == client.timeout
+        client.deadline = time.time() + 2.0
+        assert 1000 < client._timeout_ms() <= 2000
+        assert client._timeout_ms(500) == 500
+        client.deadline = time.time() - 1.0
+        assert client._timeout_ms() == 1
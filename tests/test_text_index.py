@@ -0,0 +1,60 @@
+"""
+Tests for the Aho-Corasick page-text index.
+Checked against a naive str.find oracle on random and hand-picked texts.
+"""
+import random
+
+import pytest
+
+from support.text_index import AhoCorasick, PageTextIndex, default_automaton
+
+
+def naive_search(patterns, text):
+    """Patterns occurring in the text, found one str.find at a time."""
+    return {pattern for pattern in patterns if pattern and text.find(pattern) != -1}
+
+
+class TestAhoCorasick:
+    """Multi-pattern search."""
+
+    def test_overlapping_and_nested_patterns(self):
+        """Patterns that overlap, nest or share suffixes are all reported."""
+        patterns = ["he", "she", "his", "hers", "s", "ushe", "e"]
+        assert AhoCorasick(patterns).search("ushers") == naive_search(patterns, "ushers")
+        assert AhoCorasick(patterns).search("ushers") == {"he", "she", "hers", "s", "ushe", "e"}
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_naive_search_on_random_texts(self, seed):
+        """On a small alphabet, where failure links are exercised heavily, results equal the oracle."""
+        rng = random.Random(seed)
+        alphabet = "abc"
+        patterns = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6))) for _ in range(30)]
+        automaton = AhoCorasick(patterns)
+        for _ in range(20):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            assert automaton.search(text) == naive_search(patterns, text), (patterns, text)
+
+    def test_page_texts(self):
+        """The expected texts and feature literals are found in page text as the oracle finds them."""
+        automaton = default_automaton()
+        text = "Swag Labs\nProducts\nSauce Labs Backpack\n$29.99\nEpic sadface: Username is required"
+        assert automaton.search(text) == naive_search(automaton.patterns, text)
+
+    def test_empty_and_duplicate_patterns_are_ignored(self):
+        """Empty patterns never match; duplicates are kept once."""
+        automaton = AhoCorasick(["", "ab", "ab"])
+        assert automaton.patterns == ["ab"]
+        assert automaton.search("") == set()
+        assert automaton.search("xaby") == {"ab"}
+
+
+class TestPageTextIndex:
+    """Answers from one capture."""
+
+    def test_known_and_adhoc_patterns(self):
+        """Known patterns come from the scan; others fall back to a memoised substring search."""
+        index = PageTextIndex("Products\nSauce Labs Onesie", AhoCorasick(["Products", "Checkout"]), version=3)
+        assert index.contains("Products")
+        assert not index.contains("Checkout")
+        assert index.contains("Onesie") and index._adhoc == {"Onesie": True}
+        assert not index.contains("Fleece")
@@ -0,0 +1,92 @@
+"""
+Tests for the concurrent TEST_USERS login matrix.
+Runs the clients in simulation mode, so no browser or network is needed.
+"""
+import threading
+import time
+
+import pytest
+
+from pages.login_page import LoginPage
+from support.user_matrix import expand_user_examples, run_user_matrix
+from TestData.test_data import EXPECTED_TEXTS, TEST_USERS
+
+
+@pytest.fixture(autouse=True)
+def simulation(monkeypatch):
+    """Every client the matrix opens runs in simulation mode."""
+    monkeypatch.setenv("MCP_MODE", "simulation")
+
+
+class TestUserMatrix:
+    """Example rows and their concurrent execution."""
+
+    def test_rows_carry_the_expected_error(self):
+        """One row per user, in TEST_USERS order, with the error each failing login must show."""
+        rows = expand_user_examples()
+        assert [row["user_key"] for row in rows] == [user.key for user in TEST_USERS]
+        errors = {row["user_key"]: row["expected_error"] for row in rows}
+        assert errors["standard_user"] is None
+        assert errors["locked_out_user"] == EXPECTED_TEXTS["error_locked_user"]
+        assert errors["empty_username"] == EXPECTED_TEXTS["error_username_required"]
+        assert errors["empty_password"] == EXPECTED_TEXTS["error_password_required"]
+
+    def test_failing_logins_check_their_own_error(self, monkeypatch):
+        """A locked-out user only passes when the locked-out message is shown."""
+        checked = []
+
+        def verify_login_error(page, expected_text):
+            checked.append(expected_text)
+            return expected_text != EXPECTED_TEXTS["error_locked_user"]
+
+        monkeypatch.setattr(LoginPage, "verify_login_error", verify_login_error)
+        [locked] = run_user_matrix(expand_user_examples(TEST_USERS.by_expected_result("locked")))
+        assert checked == [EXPECTED_TEXTS["error_locked_user"]]
+        assert not locked["passed"]
+        assert EXPECTED_TEXTS["error_locked_user"] in locked["error"]
+
+    def test_results_keep_row_order_and_capture_errors(self, monkeypatch):
+        """Results come back in row order; an exception fails its own row only."""
+        login = LoginPage.login
+
+        def flaky_login(page, username, password):
+            if username == "problem_user":
+                raise RuntimeError("context crashed")
+            return login(page, username, password)
+
+        monkeypatch.setattr(LoginPage, "login", flaky_login)
+        rows = expand_user_examples()
+        results = run_user_matrix(rows)
+        assert [result["user_key"] for result in results] == [row["user_key"] for row in rows]
+        failed = {result["user_key"]: result["error"] for result in results if not result["passed"]}
+        assert failed == {"problem_user": "context crashed"}
+        assert all(result["duration"] > 0 for result in results)
+
+    def test_rows_run_concurrently_up_to_the_limit(self, monkeypatch):
+        """All rows are in flight at once by default, and never more than max_concurrency."""
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+        navigate = LoginPage.navigate_to_login_page
+
+        def tracked_navigate(page):
+            with lock:
+                in_flight.append(page)
+                peak.append(len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.remove(page)
+            return navigate(page)
+
+        monkeypatch.setattr(LoginPage, "navigate_to_login_page", tracked_navigate)
+        rows = expand_user_examples()
+        run_user_matrix(rows)
+        assert max(peak) == len(rows)
+
+        peak.clear()
+        run_user_matrix(rows, max_concurrency=2)
+        assert max(peak) == 2
+
+    def test_no_rows(self):
+        """An empty matrix runs nothing."""
+        assert run_user_matrix([]) == []